@@ -103,7 +103,7 @@ from .sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 from .sources.message import InMemoryMessageRepository, MessageRepository
 from .sources.source import TState
 from .sources.streams.availability_strategy import AvailabilityStrategy
-from .sources.streams.call_rate import AbstractAPIBudget, HttpAPIBudget, HttpRequestMatcher, MovingWindowCallRatePolicy, Rate, CachedLimiterSession, LimiterSession
+from .sources.streams.call_rate import AbstractAPIBudget, HttpAPIBudget, HttpRequestMatcher, MovingWindowCallRatePolicy, Rate, TokenBucketCallRatePolicy, CachedLimiterSession, LimiterSession
 from .sources.streams.checkpoint import Cursor as LegacyCursor
 from .sources.streams.checkpoint import ResumableFullRefreshCursor
 from .sources.streams.concurrent.adapters import StreamFacade
@@ -228,6 +228,7 @@ __all__ = [
     "Rate",
     "SingleUseRefreshTokenOauth2Authenticator",
     "TokenAuthenticator",
+    "TokenBucketCallRatePolicy",
     "UserDefinedBackoffException",
     # Logger
     "AirbyteLogFormatter",
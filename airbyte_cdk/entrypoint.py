@@ -23,20 +23,22 @@ from airbyte_cdk.models import (  # type: ignore [attr-defined]
     AirbyteConnectionStatus,
     AirbyteMessage,
     AirbyteMessageSerializer,
+    AirbyteRecordMessage,
     AirbyteStateStats,
     ConnectorSpecification,
     FailureType,
     Status,
     Type,
+    dump_record_message,
 )
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
 
-# from airbyte_cdk.utils import PrintBuffer, is_cloud_environment, message_utils  # add PrintBuffer back once fixed
 from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
-from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.constants import ENV_BUFFERED_OUTPUT, ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.stdout_writer import BufferedStdoutWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from orjson import orjson
 from requests import PreparedRequest, Response, Session
@@ -45,6 +47,7 @@ logger = init_logger("airbyte")
 
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
+_FLUSH_ON_MESSAGE_TYPES = frozenset({Type.STATE, Type.TRACE})
 
 
 class AirbyteEntrypoint(object):
@@ -115,6 +118,13 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for message in self.run_messages(parsed_args):
+            yield self.airbyte_message_to_string(message)
+
+    def run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
+        """
+        Same as `run` but yields the messages before serialization so that callers can choose how to encode them
+        """
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -134,44 +144,26 @@ class AirbyteEntrypoint(object):
                 )
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from self._emit_queued_messages(self.source)
+                    yield message
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message)
-                        for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from self._emit_queued_messages(self.source)
                     if cmd == "check":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.check(source_spec, config),
-                        )
+                        yield from self.check(source_spec, config)
                     elif cmd == "discover":
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.discover(source_spec, config),
-                        )
+                        yield from self.discover(source_spec, config)
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(
-                            AirbyteEntrypoint.airbyte_message_to_string,
-                            self.read(source_spec, config, config_catalog, state),
-                        )
+                        yield from self.read(source_spec, config, config_catalog, state)
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [
-                self.airbyte_message_to_string(queued_message)
-                for queued_message in self._emit_queued_messages(self.source)
-            ]
+            yield from self._emit_queued_messages(self.source)
 
     def check(
         self, source_spec: ConnectorSpecification, config: TConfig
@@ -279,8 +271,32 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> str:
+        if _is_plain_record(airbyte_message):
+            return dump_record_message(  # type: ignore[union-attr] # record is set for plain records
+                airbyte_message.record.stream,
+                airbyte_message.record.data,
+                airbyte_message.record.emitted_at,
+                airbyte_message.record.namespace,
+            ).decode()
         return orjson.dumps(AirbyteMessageSerializer.dump(airbyte_message)).decode()  # type: ignore[no-any-return] # orjson.dumps(message).decode() always returns string
 
+    @staticmethod
+    def airbyte_message_to_bytes(airbyte_message: AirbyteMessage) -> bytes:
+        """
+        Serialize the message as a newline-terminated line of bytes, ready to be written to a binary stream
+        """
+        if _is_plain_record(airbyte_message):
+            return dump_record_message(  # type: ignore[union-attr] # record is set for plain records
+                airbyte_message.record.stream,
+                airbyte_message.record.data,
+                airbyte_message.record.emitted_at,
+                airbyte_message.record.namespace,
+                append_newline=True,
+            )
+        return orjson.dumps(  # type: ignore[no-any-return] # orjson.dumps(message) always returns bytes
+            AirbyteMessageSerializer.dump(airbyte_message), option=orjson.OPT_APPEND_NEWLINE
+        )
+
     @classmethod
     def extract_state(cls, args: List[str]) -> Optional[Any]:
         parsed_args = cls.parse_args(args)
@@ -311,13 +327,37 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    # temporarily removes the PrintBuffer because we're seeing weird print behavior for concurrent syncs
-    # Refer to: https://github.com/airbytehq/oncall/issues/6235
-    # with PrintBuffer():
-    for message in source_entrypoint.run(parsed_args):
-        # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-        # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-        print(f"{message}\n", end="", flush=True)
+    if not _is_buffered_output_enabled():
+        for message in source_entrypoint.run(parsed_args):
+            # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
+            # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
+            print(f"{message}\n", end="", flush=True)
+        return
+
+    with BufferedStdoutWriter() as writer:
+        for airbyte_message in source_entrypoint.run_messages(parsed_args):
+            # STATE and TRACE messages are flushed right away: the platform relies on them to checkpoint and to detect
+            # failures so they should never wait in the buffer
+            writer.write(
+                AirbyteEntrypoint.airbyte_message_to_bytes(airbyte_message),
+                flush=airbyte_message.type in _FLUSH_ON_MESSAGE_TYPES,
+            )
+
+
+def _is_plain_record(airbyte_message: AirbyteMessage) -> bool:
+    """
+    Records without `meta` can be serialized by `dump_record_message`. Subclasses such as file transfer records and
+    records with metadata go through `AirbyteMessageSerializer`.
+    """
+    return (
+        airbyte_message.type == Type.RECORD
+        and type(airbyte_message.record) is AirbyteRecordMessage
+        and airbyte_message.record.meta is None
+    )
+
+
+def _is_buffered_output_enabled() -> bool:
+    return os.environ.get(ENV_BUFFERED_OUTPUT, "true").lower() not in ("false", "0")
 
 
 def _init_internal_request_filter() -> None:
@@ -67,4 +67,5 @@ AirbyteMessageSerializer,
 ConfiguredAirbyteCatalogSerializer,
 ConfiguredAirbyteStreamSerializer,
 ConnectorSpecificationSerializer,
+dump_record_message,
 )
\ No newline at end of file
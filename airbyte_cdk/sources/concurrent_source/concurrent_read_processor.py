@@ -18,7 +18,10 @@ from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionE
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    RecordBatch,
+)
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils import AirbyteTracedException
@@ -143,15 +146,33 @@ class ConcurrentReadProcessor:
         5. Emit the message
         6. Emit messages that were added to the message repository
         """
+        stream = self._stream_name_to_instance[record.partition.stream_name()]
+        yield from self._process_record(stream, record)
+        yield from self._message_repository.consume_queue()
+
+    def on_record_batch(self, batch: RecordBatch) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition.
+        Each record is processed the same way as in `on_record`, including emitting the messages that were added to the message
+        repository after each record so that they are emitted in the same order as when records are not batched.
+        """
+        if not batch.records:
+            return
+        # all the records of a batch come from the same partition
+        stream = self._stream_name_to_instance[batch.records[0].partition.stream_name()]
+        for record in batch.records:
+            yield from self._process_record(stream, record)
+            yield from self._message_repository.consume_queue()
+
+    def _process_record(self, stream: AbstractStream, record: Record) -> Iterable[AirbyteMessage]:
         # Do not pass a transformer or a schema
         # AbstractStreams are expected to return data as they are expected.
         # Any transformation on the data should be done before reaching this point
         message = stream_data_to_airbyte_message(
-            stream_name=record.partition.stream_name(),
+            stream_name=stream.name,
             data_or_message=record.data,
             is_file_transfer_message=record.is_file_transfer_message,
         )
-        stream = self._stream_name_to_instance[record.partition.stream_name()]
 
         if message.type == MessageType.RECORD:
             if self._record_counter[stream.name] == 0:
@@ -162,7 +183,6 @@ class ConcurrentReadProcessor:
             self._record_counter[stream.name] += 1
             stream.cursor.observe(record)
         yield message
-        yield from self._message_repository.consume_queue()
 
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
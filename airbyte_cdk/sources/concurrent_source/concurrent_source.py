@@ -3,11 +3,13 @@
 #
 import concurrent
 import logging
+import os
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
@@ -22,8 +24,10 @@ from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
+from airbyte_cdk.utils.constants import ENV_MAX_QUEUE_SIZE_IN_BYTES
 
 
 class ConcurrentSource:
@@ -35,6 +39,7 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_MAX_QUEUE_SIZE_IN_BYTES = 256 * 1024 * 1024
 
     @staticmethod
     def create(
@@ -44,6 +49,7 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size_in_bytes: Optional[int] = None,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = (
@@ -65,6 +71,7 @@ class ConcurrentSource:
             message_repository,
             initial_number_of_partitions_to_generate,
             timeout_seconds,
+            max_queue_size_in_bytes,
         )
 
     def __init__(
@@ -75,6 +82,7 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size_in_bytes: Optional[int] = None,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -83,6 +91,7 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param max_queue_size_in_bytes: The approximate maximum size of the records buffered between the worker threads and the main thread. Workers block once it is reached. The AIRBYTE_MAX_QUEUE_SIZE_IN_BYTES environment variable takes precedence over this value.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -90,6 +99,21 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._max_queue_size_in_bytes = self._resolve_max_queue_size_in_bytes(
+            max_queue_size_in_bytes
+        )
+
+    @classmethod
+    def _resolve_max_queue_size_in_bytes(cls, max_queue_size_in_bytes: Optional[int]) -> int:
+        from_environment = os.environ.get(ENV_MAX_QUEUE_SIZE_IN_BYTES)
+        if from_environment:
+            try:
+                return int(from_environment)
+            except ValueError:
+                raise ValueError(
+                    f"{ENV_MAX_QUEUE_SIZE_IN_BYTES} is expected to be an integer but was {from_environment}"
+                )
+        return max_queue_size_in_bytes or cls.DEFAULT_MAX_QUEUE_SIZE_IN_BYTES
 
     def read(
         self,
@@ -97,11 +121,11 @@ class ConcurrentSource:
     ) -> Iterator[AirbyteMessage]:
         self._logger.info("Starting syncing")
 
-        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
-        # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        # We bound the size of the records in the queue for the main thread to process record items when the queue size grows. This
+        # assumes that there are less threads generating partitions that than are max number of workers. If it weren't the case, we could
+        # have threads only generating partitions which would fill the queue. The number of items is also bounded to 10_000 to avoid
+        # accumulating too many partitions.
+        queue = MemoryBoundedQueue(self._max_queue_size_in_bytes, maxsize=10_000)
         concurrent_stream_processor = ConcurrentReadProcessor(
             streams,
             PartitionEnqueuer(queue, self._threadpool),
@@ -121,6 +145,9 @@ class ConcurrentSource:
             concurrent_stream_processor,
         )
         self._threadpool.check_for_errors_and_shutdown()
+        self._logger.info(
+            f"Record queue peak usage: {queue.peak_qsize} items and {queue.peak_size_in_bytes} bytes for a budget of {self._max_queue_size_in_bytes} bytes"
+        )
         self._logger.info("Finished syncing")
 
     def _submit_initial_partition_generators(
@@ -150,8 +177,11 @@ class ConcurrentSource:
         queue_item: QueueItem,
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
-        # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, StreamThreadException):
+        # handle queue item and call the appropriate handler depending on the type of the queue item. Record batches are by far the
+        # most common items so they are checked first
+        if isinstance(queue_item, RecordBatch):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
+        elif isinstance(queue_item, StreamThreadException):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
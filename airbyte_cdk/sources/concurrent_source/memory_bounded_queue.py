@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import time
+from queue import Full, Queue
+from typing import Optional
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem, RecordBatch
+
+
+class MemoryBoundedQueue(Queue[QueueItem]):
+    """
+    Queue that blocks producers once the records it holds exceed a memory budget.
+
+    The size of a queue item is the approximate size of the records it holds (see `RecordBatch.approximate_size_in_bytes`). Other queue
+    items such as partitions and sentinels are considered free and are only bounded by `maxsize`. An item is always accepted if the
+    queue does not hold any record so that a single batch bigger than the budget can't block the sync forever.
+
+    The current and peak depth and size of the queue are exposed so that the memory used by a sync can be monitored.
+    """
+
+    def __init__(self, max_size_in_bytes: int, maxsize: int = 0) -> None:
+        """
+        :param max_size_in_bytes: The approximate maximum size of the records held in the queue
+        :param maxsize: The maximum number of items in the queue. If 0, the number of items is not bounded
+        """
+        super().__init__(maxsize)
+        self._max_size_in_bytes = max_size_in_bytes
+        self._size_in_bytes = 0
+        self._peak_size_in_bytes = 0
+        self._peak_qsize = 0
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size_in_bytes
+
+    @property
+    def peak_size_in_bytes(self) -> int:
+        return self._peak_size_in_bytes
+
+    @property
+    def peak_qsize(self) -> int:
+        return self._peak_qsize
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        item_size_in_bytes = self._size_of(item)
+        with self.not_full:
+            if not block:
+                if self._is_full(item_size_in_bytes):
+                    raise Full
+            elif timeout is None:
+                while self._is_full(item_size_in_bytes):
+                    self.not_full.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time.monotonic() + timeout
+                while self._is_full(item_size_in_bytes):
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise Full
+                    self.not_full.wait(remaining)
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _is_full(self, item_size_in_bytes: int) -> bool:
+        if 0 < self.maxsize <= self._qsize():
+            return True
+        return (
+            item_size_in_bytes > 0
+            and self._size_in_bytes > 0
+            and self._size_in_bytes + item_size_in_bytes > self._max_size_in_bytes
+        )
+
+    def _put(self, item: QueueItem) -> None:
+        super()._put(item)
+        self._size_in_bytes += self._size_of(item)
+        self._peak_size_in_bytes = max(self._peak_size_in_bytes, self._size_in_bytes)
+        self._peak_qsize = max(self._peak_qsize, self._qsize())
+
+    def _get(self) -> QueueItem:
+        item = super()._get()
+        item_size_in_bytes = self._size_of(item)
+        if item_size_in_bytes:
+            self._size_in_bytes -= item_size_in_bytes
+            # `get` only wakes up one producer but freeing a batch might make room for many of them
+            self.not_full.notify_all()
+        return item
+
+    @staticmethod
+    def _size_of(item: QueueItem) -> int:
+        return item.approximate_size_in_bytes if isinstance(item, RecordBatch) else 0
@@ -3,16 +3,20 @@
 #
 import logging
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Set
 
 
 class ThreadPoolManager:
     """
     Wrapper to abstract away the threadpool and the logic to wait for pending tasks to be completed.
+
+    Pending tasks are tracked using done callbacks on the futures so that knowing how many tasks are in flight is O(1) and threads
+    waiting for the number of pending tasks to go below the limit are woken up as soon as a task completes.
     """
 
     DEFAULT_MAX_QUEUE_SIZE = 10_000
+    _WAIT_FOR_FUTURES_TIMEOUT_IN_SECONDS = 60
 
     def __init__(
         self,
@@ -28,50 +32,52 @@ class ThreadPoolManager:
         self._threadpool = threadpool
         self._logger = logger
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._futures: List[Future[Any]] = []
-        self._lock = threading.Lock()
+        self._futures: Set[Future[Any]] = set()
+        self._condition = threading.Condition()
         self._most_recently_seen_exception: Optional[Exception] = None
 
-        self._logging_threshold = max_concurrent_tasks * 2
-
     def prune_to_validate_has_reached_futures_limit(self) -> bool:
-        self._prune_futures(self._futures)
-        if len(self._futures) > self._logging_threshold:
-            self._logger.warning(
-                f"ThreadPoolManager: The list of futures is getting bigger than expected ({len(self._futures)})"
-            )
-        return len(self._futures) >= self._max_concurrent_tasks
+        """
+        Kept for backward compatibility. Completed futures are now removed as soon as they are done so there is nothing left to prune.
+        """
+        return self.has_reached_futures_limit()
 
-    def submit(self, function: Callable[..., Any], *args: Any) -> None:
-        self._futures.append(self._threadpool.submit(function, *args))
+    def has_reached_futures_limit(self) -> bool:
+        with self._condition:
+            return len(self._futures) >= self._max_concurrent_tasks
 
-    def _prune_futures(self, futures: List[Future[Any]]) -> None:
+    def wait_until_below_futures_limit(self) -> None:
+        """
+        Block the calling thread until the number of pending tasks is below `max_concurrent_tasks`
         """
-        Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
-        operation.
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._futures) < self._max_concurrent_tasks)
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> None:
+        future = self._threadpool.submit(function, *args)
+        with self._condition:
+            self._futures.add(future)
+        # If the future is already done, the callback is called immediately which is why the future needs to be tracked first
+        future.add_done_callback(self._on_future_done)
 
-        We are using a lock here as without it, the algorithm would not be thread safe
+    def _on_future_done(self, future: Future[Any]) -> None:
         """
-        with self._lock:
-            if len(futures) < self._max_concurrent_tasks:
-                return
-
-            for index in reversed(range(len(futures))):
-                future = futures[index]
-
-                if future.done():
-                    # Only call future.exception() if the future is known to be done because it will block until the future is done.
-                    # See https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.Future.exception
-                    optional_exception = future.exception()
-                    if optional_exception:
-                        # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main
-                        # thread to call raise_if_exception
-                        # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and
-                        # push it to the queue. If this exception occurs, please review the futures and how they handle exceptions.
-                        self._most_recently_seen_exception = RuntimeError(
-                            f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
-                        )
-                    futures.pop(index)
+        Stop tracking the future. If the future has an exception, it'll be raised by `check_for_errors_and_shutdown` which kills the
+        stream operation.
+        """
+        if not future.cancelled():
+            optional_exception = future.exception()
+            if optional_exception:
+                # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main
+                # thread to call raise_if_exception
+                # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and
+                # push it to the queue. If this exception occurs, please review the futures and how they handle exceptions.
+                self._most_recently_seen_exception = RuntimeError(
+                    f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
+                )
+        with self._condition:
+            self._futures.discard(future)
+            self._condition.notify_all()
 
     def _shutdown(self) -> None:
         # Without a way to stop the threads that have already started, this will not stop the Python application. We are fine today with
@@ -79,7 +85,8 @@ class ThreadPoolManager:
         self._threadpool.shutdown(wait=False, cancel_futures=True)
 
     def is_done(self) -> bool:
-        return all([f.done() for f in self._futures])
+        with self._condition:
+            return not self._futures
 
     def check_for_errors_and_shutdown(self) -> None:
         """
@@ -87,6 +94,17 @@ class ThreadPoolManager:
         If the futures are not done, raise an exception.
         :return:
         """
+        with self._condition:
+            futures = list(self._futures)
+        # Workers signal that they are done before their future returns so the futures still tracked are waited for. A future can also
+        # be done while its done callback has not been called yet which is why their exceptions are checked as well
+        done, futures_not_done = wait(futures, timeout=self._WAIT_FOR_FUTURES_TIMEOUT_IN_SECONDS)
+        exceptions_from_futures = [
+            exception
+            for exception in [future.exception() for future in done if not future.cancelled()]
+            if exception is not None
+        ]
+
         if self._most_recently_seen_exception:
             self._logger.exception(
                 "An unknown exception has occurred while reading concurrently",
@@ -94,21 +112,14 @@ class ThreadPoolManager:
             )
             self._stop_and_raise_exception(self._most_recently_seen_exception)
 
-        exceptions_from_futures = [
-            f for f in [future.exception() for future in self._futures] if f is not None
-        ]
         if exceptions_from_futures:
             exception = RuntimeError(f"Failed reading with errors: {exceptions_from_futures}")
             self._stop_and_raise_exception(exception)
+        elif futures_not_done:
+            exception = RuntimeError(f"Failed reading with futures not done: {futures_not_done}")
+            self._stop_and_raise_exception(exception)
         else:
-            futures_not_done = [f for f in self._futures if not f.done()]
-            if futures_not_done:
-                exception = RuntimeError(
-                    f"Failed reading with futures not done: {futures_not_done}"
-                )
-                self._stop_and_raise_exception(exception)
-            else:
-                self._shutdown()
+            self._shutdown()
 
     def _stop_and_raise_exception(self, exception: BaseException) -> None:
         self._shutdown()
@@ -0,0 +1,244 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import itertools
+import logging
+import logging.handlers
+import multiprocessing
+import pickle
+import threading
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets_from_config, update_secrets
+
+_BATCH = "batch"
+_DONE = "done"
+_ERROR = "error"
+_LOG = "log"
+
+# Set in each worker process by `_initialize_worker`
+_results_queue: Optional["multiprocessing.Queue[Any]"] = None
+_log_level = logging.INFO
+
+
+class _ResultsQueueHandler(logging.handlers.QueueHandler):
+    """
+    Send the log records of a worker process to the main process through the results queue so that they are emitted by the handlers of
+    the main process instead of being written to the stdout shared with the main process in the middle of its messages.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put((None, _LOG, record))
+
+
+def _initialize_worker(
+    results_queue: "multiprocessing.Queue[Any]", secrets: List[str], log_level: int
+) -> None:
+    global _results_queue, _log_level
+    _results_queue = results_queue
+    # Worker processes are spawned so they don't inherit the logging configuration nor the secrets of the main process
+    _log_level = log_level
+    update_secrets(secrets)
+
+
+def _send_logs_to_main_process(results_queue: "multiprocessing.Queue[Any]") -> None:
+    # Modules imported when a task is unpickled can configure logging, like `airbyte_cdk.entrypoint` logging to stdout, so this is checked
+    # for each task
+    root_logger = logging.getLogger()
+    if len(root_logger.handlers) != 1 or not isinstance(
+        root_logger.handlers[0], _ResultsQueueHandler
+    ):
+        handler = _ResultsQueueHandler(results_queue)
+        # the record is formatted again by the handlers of the main process
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=_log_level, handlers=[handler], force=True)
+    logging.getLogger("airbyte").setLevel(_log_level)
+
+
+def _to_picklable_exception(exception: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        formatted_traceback = "".join(
+            traceback.format_exception(type(exception), exception, exception.__traceback__)
+        )
+        return RuntimeError(f"{type(exception).__name__}: {exception}\n{formatted_traceback}")
+
+
+def _iterate_in_worker(task_id: int, payload: bytes, batch_size: int) -> None:
+    """
+    Run in a worker process: iterate over the items generated by the pickled function and send them back to the main process in pickled
+    batches. Pickling the batches here means the main process only has to unpickle them in the thread that consumes them.
+    """
+    assert _results_queue is not None, "Worker process was not initialized"
+    function, args = pickle.loads(payload)
+    _send_logs_to_main_process(_results_queue)
+    batch: List[Any] = []
+    try:
+        for item in function(*args):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                _results_queue.put((task_id, _BATCH, pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)))
+                batch = []
+        if batch:
+            _results_queue.put((task_id, _BATCH, pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)))
+        _results_queue.put((task_id, _DONE, None))
+    except Exception as exception:
+        # items generated before the failure are still sent, same as if the function had been iterated in the main process
+        if batch:
+            _results_queue.put((task_id, _BATCH, pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)))
+        _results_queue.put((task_id, _ERROR, _to_picklable_exception(exception)))
+
+
+class WorkerProcessPool:
+    """
+    Pool of worker processes used to run the CPU-bound part of a partition outside of the GIL of the main process.
+
+    `iterate` runs a generator function in a worker process and returns an iterator over the items it generates so that callers running in
+    the threads of the `ConcurrentSource` can use it as a drop-in replacement for calling the function themselves. Only the work done by
+    the function is moved to the worker process: the caller keeps handling what it does with the items (cursor updates, state, messages)
+    in the main process.
+
+    Workers send their items in batches through a single queue. A dispatcher thread routes each batch to the bounded queue of the task it
+    belongs to, which means a task whose consumer is slow eventually blocks the dispatcher and, with it, the workers. Workers send their
+    log records through the same queue and the dispatcher emits them with the loggers of the main process.
+
+    The function and its arguments must be picklable. `iterate` raises `pickle.PicklingError` (or the error raised by the object that
+    can't be pickled) before anything is submitted if they are not so that callers can fall back on running the function themselves.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    _MAX_BATCHES_PER_TASK = 8
+    _DISPATCH_TIMEOUT_IN_SECONDS = 0.1
+
+    def __init__(self, max_workers: int, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        :param max_workers: The number of worker processes
+        :param batch_size: The number of items sent at once from a worker process to the main process
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got {max_workers}")
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._results_queue: Optional["multiprocessing.Queue[Any]"] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._task_queues: Dict[int, Queue[Tuple[str, Any]]] = {}
+        self._task_ids = itertools.count()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def iterate(self, function: Callable[..., Iterable[Any]], *args: Any) -> Iterator[Any]:
+        """
+        :param function: A picklable function returning an iterable. It is called in a worker process with `args`
+        :return: An iterator over the items generated by the function. Exceptions raised by the function are re-raised by the iterator
+        """
+        payload = pickle.dumps((function, args), pickle.HIGHEST_PROTOCOL)
+        executor = self._start()
+        task_id = next(self._task_ids)
+        task_queue: Queue[Tuple[str, Any]] = Queue(maxsize=self._MAX_BATCHES_PER_TASK)
+        with self._lock:
+            self._task_queues[task_id] = task_queue
+        future = executor.submit(_iterate_in_worker, task_id, payload, self._batch_size)
+        future.add_done_callback(lambda f: self._on_task_done(task_id, f))
+        return self._consume(task_id, task_queue)
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes. The pool can be used again afterwards in which case new worker processes are started.
+        """
+        with self._lock:
+            executor, results_queue, dispatcher = (
+                self._executor,
+                self._results_queue,
+                self._dispatcher,
+            )
+            self._executor = self._results_queue = self._dispatcher = None
+        if executor is None or results_queue is None or dispatcher is None:
+            return
+        executor.shutdown(wait=True, cancel_futures=True)
+        # `None` can't be sent by a worker so it is used to tell the dispatcher to stop
+        results_queue.put(None)
+        dispatcher.join()
+        results_queue.close()
+        results_queue.join_thread()
+
+    def _start(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that runs threads can deadlock so workers are always spawned
+                context = multiprocessing.get_context("spawn")
+                results_queue: "multiprocessing.Queue[Any]" = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=context,
+                    initializer=_initialize_worker,
+                    initargs=(
+                        results_queue,
+                        get_secrets_from_config(),
+                        logging.getLogger("airbyte").getEffectiveLevel(),
+                    ),
+                )
+                self._results_queue = results_queue
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch,
+                    args=(results_queue,),
+                    name="worker-process-pool-dispatcher",
+                    daemon=True,
+                )
+                self._dispatcher.start()
+            return self._executor
+
+    def _dispatch(self, results_queue: "multiprocessing.Queue[Any]") -> None:
+        while True:
+            message = results_queue.get()
+            if message is None:
+                return
+            task_id, kind, payload = message
+            if kind == _LOG:
+                logging.getLogger(payload.name).handle(payload)
+            else:
+                self._put_for_task(task_id, (kind, payload))
+
+    def _put_for_task(self, task_id: int, item: Tuple[str, Any]) -> None:
+        with self._lock:
+            task_queue = self._task_queues.get(task_id)
+        while task_queue is not None:
+            try:
+                task_queue.put(item, timeout=self._DISPATCH_TIMEOUT_IN_SECONDS)
+                return
+            except Full:
+                # the consumer might have stopped iterating in which case the item is dropped
+                with self._lock:
+                    task_queue = self._task_queues.get(task_id)
+
+    def _on_task_done(self, task_id: int, future: "Future[None]") -> None:
+        # Exceptions raised by the function are sent through the results queue. An exception here means the worker process itself failed
+        # (e.g. it was killed) so the consumer would otherwise wait forever.
+        exception = None if future.cancelled() else future.exception()
+        if future.cancelled() or exception is not None:
+            self._put_for_task(
+                task_id,
+                (_ERROR, exception or RuntimeError("Task was cancelled before it completed")),
+            )
+
+    def _consume(self, task_id: int, task_queue: "Queue[Tuple[str, Any]]") -> Iterator[Any]:
+        try:
+            while True:
+                kind, payload = task_queue.get()
+                if kind == _BATCH:
+                    yield from pickle.loads(payload)
+                elif kind == _DONE:
+                    return
+                else:
+                    raise payload
+        finally:
+            with self._lock:
+                self._task_queues.pop(task_id, None)
@@ -17,12 +17,14 @@ class ConcurrencyLevel:
     Attributes:
         default_concurrency (Union[int, str]): The hardcoded integer or interpolation of how many worker threads to use during a sync
         max_concurrency (Optional[int]): The maximum number of worker threads to use when the default_concurrency is exceeded
+        max_queue_size_in_bytes (Optional[int]): The approximate maximum size of the records buffered between the worker threads and the main thread
     """
 
     default_concurrency: Union[int, str]
     max_concurrency: Optional[int]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    max_queue_size_in_bytes: Optional[int] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if isinstance(self.default_concurrency, int):
@@ -79,18 +79,6 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
         self._concurrent_streams: Optional[List[AbstractStream]]
         self._synchronous_streams: Optional[List[Stream]]
 
-        # If the connector command was SPEC, there is no incoming config, and we cannot instantiate streams because
-        # they might depend on it. Ideally we want to have a static method on this class to get the spec without
-        # any other arguments, but the existing entrypoint.py isn't designed to support this. Just noting this
-        # for our future improvements to the CDK.
-        if config:
-            self._concurrent_streams, self._synchronous_streams = self._group_streams(
-                config=config or {}
-            )
-        else:
-            self._concurrent_streams = None
-            self._synchronous_streams = None
-
         concurrency_level_from_manifest = self._source_config.get("concurrency_level")
         if concurrency_level_from_manifest:
             concurrency_level_component = self._constructor.create_component(
@@ -107,9 +95,27 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             initial_number_of_partitions_to_generate = max(
                 concurrency_level // 2, 1
             )  # Partition_generation iterates using range based on this value. If this is floored to zero we end up in a dead lock during start up
+            max_queue_size_in_bytes = concurrency_level_component.max_queue_size_in_bytes
+            # Each worker can have a connection to the same host
+            self._constructor.get_connection_pool().resize(concurrency_level)
+            # Synchronous substreams are read once the concurrent streams are done so their parents can use as many threads
+            self._constructor.set_parent_stream_concurrency_level(concurrency_level)
         else:
             concurrency_level = self.SINGLE_THREADED_CONCURRENCY_LEVEL
             initial_number_of_partitions_to_generate = self.SINGLE_THREADED_CONCURRENCY_LEVEL
+            max_queue_size_in_bytes = None
+
+        # If the connector command was SPEC, there is no incoming config, and we cannot instantiate streams because
+        # they might depend on it. Ideally we want to have a static method on this class to get the spec without
+        # any other arguments, but the existing entrypoint.py isn't designed to support this. Just noting this
+        # for our future improvements to the CDK.
+        if config:
+            self._concurrent_streams, self._synchronous_streams = self._group_streams(
+                config=config or {}
+            )
+        else:
+            self._concurrent_streams = None
+            self._synchronous_streams = None
 
         self._concurrent_source = ConcurrentSource.create(
             num_workers=concurrency_level,
@@ -117,6 +123,7 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             logger=self.logger,
             slice_logger=self._slice_logger,
             message_repository=self.message_repository,  # type: ignore  # message_repository is always instantiated with a value by factory
+            max_queue_size_in_bytes=max_queue_size_in_bytes,
         )
 
     def read(
@@ -151,6 +158,7 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             filtered_catalog = catalog
 
         yield from super().read(logger, config, filtered_catalog, state)
+        self._constructor.get_connection_pool().log_stats(self.logger)
 
     def discover(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteCatalog:
         concurrent_streams = self._concurrent_streams or []
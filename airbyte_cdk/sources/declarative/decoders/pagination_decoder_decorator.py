@@ -8,6 +8,7 @@ from typing import Any, Generator, MutableMapping
 
 import requests
 from airbyte_cdk.sources.declarative.decoders import Decoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 
 logger = logging.getLogger("airbyte")
 
@@ -16,6 +17,8 @@ logger = logging.getLogger("airbyte")
 class PaginationDecoderDecorator(Decoder):
     """
     Decoder to wrap other decoders when instantiating a DefaultPaginator in order to bypass decoding if the response is streamed.
+
+    The StreamingJsonDecoder is not bypassed as it keeps the fields of the body that are not records while they are streamed.
     """
 
     def __init__(self, decoder: Decoder):
@@ -31,7 +34,9 @@ class PaginationDecoderDecorator(Decoder):
     def decode(
         self, response: requests.Response
     ) -> Generator[MutableMapping[str, Any], None, None]:
-        if self._decoder.is_stream_response():
+        if self._decoder.is_stream_response() and not isinstance(
+            self._decoder, StreamingJsonDecoder
+        ):
             logger.warning("Response is streamed and therefore will not be decoded for pagination.")
             yield {}
         else:
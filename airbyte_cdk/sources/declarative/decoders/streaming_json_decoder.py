@@ -0,0 +1,219 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import logging
+import re
+from dataclasses import InitVar, dataclass
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Mapping, MutableMapping
+from weakref import WeakKeyDictionary
+
+import dpath
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+logger = logging.getLogger("airbyte")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARACTERS = re.compile(r"[-+0-9.eE]*")
+
+
+class _JsonStream:
+    """
+    Reads JSON values one at a time from a stream of bytes so that only the value being decoded needs to be held in memory.
+
+    Values are decoded with the standard library's `json.JSONDecoder.raw_decode`, which is what `requests.Response.json` uses, so decoded
+    values are the same as if the whole document had been decoded at once.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], encoding: str) -> None:
+        self._chunks = chunks
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """
+        :return: The next non-whitespace character without consuming it or an empty string if the stream is exhausted
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]  # the pattern always matches
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return ""
+
+    def consume(self, expected: str) -> None:
+        actual = self.peek()
+        if not actual or actual not in expected:
+            raise ValueError(
+                f"Expected one of {list(expected)} at position {self._position} but got {actual!r}"
+            )
+        self._position += 1
+
+    def decode_value(self) -> Any:
+        next_character = self.peek()
+        if next_character and next_character in "-0123456789":
+            # The beginning of a number is a valid number so the whole number needs to be in the buffer before it is decoded
+            while (
+                _NUMBER_CHARACTERS.match(self._buffer, self._position).end() == len(self._buffer)  # type: ignore[union-attr]  # the pattern always matches
+                and self._read_more()
+            ):
+                pass
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            self._position = end
+            return value
+
+    def iterate_array(self) -> Iterator[Any]:
+        self.consume("[")
+        if self.peek() == "]":
+            self.consume("]")
+            return
+        while True:
+            yield self.decode_value()
+            if self.peek() == "]":
+                self.consume("]")
+                return
+            self.consume(",")
+
+    def _read_more(self) -> bool:
+        while not self._exhausted:
+            try:
+                text = self._text_decoder.decode(next(self._chunks))
+            except StopIteration:
+                self._exhausted = True
+                text = self._text_decoder.decode(b"", final=True)
+            if text:
+                self._buffer = self._buffer[self._position :] + text
+                self._position = 0
+                return True
+        return False
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder):
+    """
+    Decoder for large JSON documents that reads the response as a stream.
+
+    When used with a `DpathExtractor` whose field path doesn't contain wildcards, the records are decoded one at a time while the
+    response is being downloaded instead of decoding the whole document first. Everything that is not on the field path is skipped. Other
+    consumers of the decoder and field paths with wildcards get the whole document decoded as with `JsonDecoder`.
+
+    As the response body is consumed by the extraction of the records, the fields that are not on the field path are kept while the records
+    are read and `decode` returns them instead of the whole document so that paginators can read the next page token from the body.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    parameters: InitVar[Mapping[str, Any]]
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        self._bodies_without_records: WeakKeyDictionary[
+            requests.Response, MutableMapping[str, Any]
+        ] = WeakKeyDictionary()
+
+    def is_stream_response(self) -> bool:
+        return True
+
+    def decode(
+        self, response: requests.Response
+    ) -> Generator[MutableMapping[str, Any], None, None]:
+        """
+        Given the records of the response have been read by `decode_field_path`, yield the fields of the body that are not records.
+        Otherwise, the whole document is decoded.
+        """
+        if response in self._bodies_without_records:
+            yield self._bodies_without_records[response]
+        else:
+            yield from super().decode(response)
+
+    def decode_field_path(
+        self, response: requests.Response, field_path: List[str]
+    ) -> Iterable[Any]:
+        """
+        Yield the records found at the field path following the same rules as `DpathExtractor`: if the field path points to an array,
+        its items are the records, otherwise the value is the record unless it is empty.
+
+        :param response: the response to decode
+        :param field_path: the path to the records without wildcards
+        """
+        stream = _JsonStream(
+            response.iter_content(chunk_size=self.CHUNK_SIZE), response.encoding or "utf-8"
+        )
+        body_without_records: Dict[str, Any] = {}
+        self._bodies_without_records[response] = body_without_records
+        try:
+            if stream.peek() == "[":
+                # The records of each item of a top-level array are extracted separately, the same way JsonDecoder yields each item
+                for item in stream.iterate_array():
+                    yield from self._records(
+                        dpath.get(item, field_path, default=[]) if field_path else item
+                    )
+            elif stream.peek() == "{" and field_path:
+                yield from self._records_in_object(stream, field_path, body_without_records)
+            elif stream.peek():
+                body = stream.decode_value()
+                if isinstance(body, dict):
+                    # The document had to be decoded at once so there is nothing to save by leaving out the records
+                    self._bodies_without_records[response] = body
+                yield from self._records(
+                    dpath.get(body, field_path, default=[]) if field_path else body
+                )
+        except (ValueError, UnicodeDecodeError) as exception:
+            # json.JSONDecodeError is a ValueError
+            logger.warning(
+                f"Response cannot be parsed into json: {response.status_code=}, {exception=}"
+            )
+        finally:
+            # The rest of the body is not needed once the records have been read
+            response.close()
+
+    def _records_in_object(
+        self, stream: _JsonStream, field_path: List[str], fields: Dict[str, Any]
+    ) -> Iterable[Any]:
+        """
+        Yield the records found at the field path in the object and add the other fields of the object to `fields`
+        """
+        stream.consume("{")
+        if stream.peek() == "}":
+            stream.consume("}")
+            return
+        while True:
+            key = stream.decode_value()
+            stream.consume(":")
+            if key == field_path[0]:
+                next_character = stream.peek()
+                if len(field_path) == 1 and next_character == "[":
+                    yield from stream.iterate_array()
+                elif len(field_path) > 1 and next_character == "{":
+                    fields[key] = {}
+                    yield from self._records_in_object(stream, field_path[1:], fields[key])
+                else:
+                    value = stream.decode_value()
+                    yield from self._records(
+                        dpath.get(value, field_path[1:], default=[]) if field_path[1:] else value
+                    )
+            else:
+                # Fields following the records are read as well since the next page token can come after them
+                fields[key] = stream.decode_value()
+            if stream.peek() == "}":
+                stream.consume("}")
+                return
+            stream.consume(",")
+
+    @staticmethod
+    def _records(extracted: Any) -> Iterable[Any]:
+        if isinstance(extracted, list):
+            yield from extracted
+        elif extracted:
+            yield extracted
@@ -2,16 +2,95 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 import dpath
 import requests
-from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
 
+_WILDCARD = "*"
+_GLOB_CHARACTERS = re.compile(r"[*?\[]")
+# Same as the values dpath considers leaves: they have no children
+_LEAF_TYPES = (bytes, str, int, float, bool, type(None))
+_MISSING = object()
+
+
+def _child(node: Any, segment: Union[str, int]) -> Any:
+    if isinstance(node, Mapping):
+        return node.get(segment, _MISSING)
+    if isinstance(node, _LEAF_TYPES) or not isinstance(node, Sequence):
+        return _MISSING
+    try:
+        index = int(segment)
+    except ValueError:
+        return _MISSING
+    # Negative indices are supported like dpath does
+    return node[index] if -len(node) <= index < len(node) else _MISSING
+
+
+def _children(node: Any) -> Iterable[Any]:
+    if isinstance(node, Mapping):
+        return node.values()
+    if isinstance(node, _LEAF_TYPES) or not isinstance(node, Sequence):
+        return ()
+    return node
+
+
+class _CompiledFieldPath:
+    """
+    Field path resolved into direct key, index and iteration lookups.
+
+    `dpath.get` and `dpath.values` walk the whole document and match every path they find against the glob. For field paths where each
+    segment is either a plain key or the `*` wildcard, the same values can be found by only following the path. Other globs are left to
+    dpath.
+    """
+
+    def __init__(self, path: Tuple[Union[str, int], ...]) -> None:
+        self.path = path
+        self._has_wildcard = _WILDCARD in path
+
+    @staticmethod
+    def can_compile(path: Sequence[Any]) -> bool:
+        # Interpolation turns segments such as "0" into integers, which dpath only matches against list indices and integer keys
+        return all(
+            (isinstance(segment, int) and not isinstance(segment, bool))
+            or (
+                isinstance(segment, str)
+                and (segment == _WILDCARD or not _GLOB_CHARACTERS.search(segment))
+            )
+            for segment in path
+        )
+
+    def extract(self, body: Any) -> Any:
+        """
+        :return: the values matching the path if it has wildcards (same as `dpath.values`), otherwise the value at the path or an empty
+        list if there is none (same as `dpath.get` with an empty list as default)
+        """
+        if self._has_wildcard:
+            nodes = [body]
+            for segment in self.path:
+                if segment == _WILDCARD:
+                    nodes = [child for node in nodes for child in _children(node)]
+                else:
+                    nodes = [
+                        child
+                        for child in (_child(node, segment) for node in nodes)
+                        if child is not _MISSING
+                    ]
+            return nodes
+
+        node = body
+        for segment in self.path:
+            node = _child(node, segment)
+            if node is _MISSING:
+                return []
+        return node
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -23,6 +102,8 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    With a `StreamingJsonDecoder`, records are decoded one at a time as the response is read unless the field path contains wildcards.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -66,14 +147,34 @@ class DpathExtractor(RecordExtractor):
                 self._field_path[path_index] = InterpolatedString.create(
                     self.field_path[path_index], parameters=parameters
                 )
+        self._compiled_field_path: Optional[_CompiledFieldPath] = None
+
+    def _get_compiled_field_path(self, path: List[Any]) -> Optional[_CompiledFieldPath]:
+        """
+        The field path only depends on the config so it is the same for every response. The compiled path is still checked against the
+        evaluated one in case the config changes.
+        """
+        compiled = self._compiled_field_path
+        if compiled is None or compiled.path != tuple(path):
+            if not _CompiledFieldPath.can_compile(path):
+                return None
+            compiled = _CompiledFieldPath(tuple(path))
+            self._compiled_field_path = compiled
+        return compiled
 
     def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[Any, Any]]:
+        path = [path.eval(self.config) for path in self._field_path]
+        if isinstance(self.decoder, StreamingJsonDecoder) and "*" not in path:
+            yield from self.decoder.decode_field_path(response, path)
+            return
+        compiled_field_path = self._get_compiled_field_path(path)
         for body in self.decoder.decode(response):
             if len(self._field_path) == 0:
                 extracted = body
             else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
+                if compiled_field_path is not None:
+                    extracted = compiled_field_path.extract(body)
+                elif "*" in path:
                     extracted = dpath.values(body, path)
                 else:
                     extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
@@ -1,21 +1,80 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import io
 import logging
+import math
 import os
-import uuid
+import tempfile
+import threading
 import zlib
 from contextlib import closing
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Mapping, Optional
 
 import pandas as pd
 import requests
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
-from numpy import nan
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 
 EMPTY_STR: str = ""
 DEFAULT_ENCODING: str = "utf-8"
 DOWNLOAD_CHUNK_SIZE: int = 1024 * 10
+DEFAULT_CHUNK_SIZE: int = 1000
+
+
+class _DownloadError(Exception):
+    """
+    Raised when reading a file whose download failed so that the download's exception is not mistaken for an error reading the file
+    """
+
+    def __init__(self, exception: Exception) -> None:
+        super().__init__(str(exception))
+        self.exception = exception
+
+
+class _DownloadedFile(io.RawIOBase):
+    """
+    A file written by a download thread that can be read while it is downloaded. Reading waits for the download thread to write more
+    data and ends at the end of the file once the download is complete. If the download fails, reading raises the download's exception.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._written = 0
+        self._read = 0
+        self._completed = False
+        self._exception: Optional[Exception] = None
+        self._condition = threading.Condition()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with self._condition:
+            self._condition.wait_for(lambda: self._written > self._read or self._completed)
+            if self._exception is not None:
+                raise _DownloadError(self._exception)
+            available = self._written - self._read
+        if available == 0:
+            return 0
+        size = self._file.readinto(memoryview(buffer)[:available])  # type: ignore  # the buffer supports the buffer protocol
+        self._read += size
+        return size
+
+    def on_written(self, size: int) -> None:
+        with self._condition:
+            self._written += size
+            self._condition.notify_all()
+
+    def on_completed(self, exception: Optional[Exception] = None) -> None:
+        with self._condition:
+            self._completed = True
+            self._exception = exception
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
 
 
 class ResponseToFileExtractor(RecordExtractor):
@@ -25,10 +84,19 @@ class ResponseToFileExtractor(RecordExtractor):
 
     Eventually, we want to support multiple file type by re-using the file based CDK parsers if possible. However, the lift is too high for
     a first iteration so we will only support CSV parsing using pandas as salesforce and sendgrid were doing.
+
+    The response is downloaded to the temporary directory of the connector by a separate thread so that the file is parsed while it is
+    downloaded.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        :param chunk_size: The number of rows parsed at once. Bigger chunks are parsed faster but take more memory
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1. Got {chunk_size}")
         self.logger = logging.getLogger("airbyte")
+        self._chunk_size = chunk_size
 
     def _get_response_encoding(self, headers: Dict[str, Any]) -> str:
         """
@@ -73,55 +141,68 @@ class ResponseToFileExtractor(RecordExtractor):
             )
         return res
 
-    def _save_to_file(self, response: requests.Response) -> Tuple[str, str]:
+    def _create_file(self) -> str:
+        """
+        Creates an empty file in the temporary directory of the connector, which is removed at the end of the sync, or in the temporary
+        directory of the system if the connector is not run from the entrypoint or its directory was removed.
+        """
+        directory = os.getenv(ENV_REQUEST_CACHE_PATH)
+        file_descriptor, file_path = tempfile.mkstemp(
+            dir=directory if directory and os.path.isdir(directory) else None,
+            prefix="airbyte_response_",
+            suffix=".csv",
+        )
+        os.close(file_descriptor)
+        return file_path
+
+    def _save_to_file(
+        self, response: requests.Response, file_path: str, downloaded_file: _DownloadedFile
+    ) -> None:
         """
-        Saves the binary data from the given response to a temporary file and returns the filepath and response encoding.
+        Saves the binary data from the given response to the file while it is read. This is meant to be run in a separate thread: the
+        download stops if the file is closed and errors are raised when the file is read.
 
         Args:
-            response (Optional[requests.Response]): The response object containing the binary data. Defaults to None.
-
-        Returns:
-            Tuple[str, str]: A tuple containing the filepath of the temporary file and the response encoding.
-
-        Raises:
-            ValueError: If the temporary file does not exist after saving the binary data.
+            response (requests.Response): The response object containing the binary data.
+            file_path (str): The path of the file to write.
+            downloaded_file (_DownloadedFile): The file notified of the data written.
         """
-        # set filepath for binary data from response
         decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
         needs_decompression = True  # we will assume at first that the response is compressed and change the flag if not
 
-        tmp_file = str(uuid.uuid4())
-        with closing(response) as response, open(tmp_file, "wb") as data_file:
-            response_encoding = self._get_response_encoding(dict(response.headers or {}))
-            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                try:
-                    if needs_decompression:
-                        data_file.write(decompressor.decompress(chunk))
-                        needs_decompression = True
-                    else:
-                        data_file.write(self._filter_null_bytes(chunk))
-                except zlib.error:
-                    data_file.write(self._filter_null_bytes(chunk))
-                    needs_decompression = False
-
-        # check the file exists
-        if os.path.isfile(tmp_file):
-            return tmp_file, response_encoding
-        else:
-            raise ValueError(
-                f"The IO/Error occured while verifying binary data. Tmp file {tmp_file} doesn't exist."
-            )
+        try:
+            with closing(response) as response, open(file_path, "wb") as data_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if downloaded_file.closed:
+                        break
+                    try:
+                        if needs_decompression:
+                            data = decompressor.decompress(chunk)
+                            needs_decompression = True
+                        else:
+                            data = self._filter_null_bytes(chunk)
+                    except zlib.error:
+                        data = self._filter_null_bytes(chunk)
+                        needs_decompression = False
+                    data_file.write(data)
+                    # the data is flushed so that it can be read from the file
+                    data_file.flush()
+                    downloaded_file.on_written(len(data))
+        except Exception as exception:
+            downloaded_file.on_completed(exception)
+            return
+        downloaded_file.on_completed()
 
     def _read_with_chunks(
-        self, path: str, file_encoding: str, chunk_size: int = 100
+        self, data: io.BufferedIOBase, file_encoding: str, path: str
     ) -> Iterable[Mapping[str, Any]]:
         """
         Reads data from a file in chunks and yields each row as a dictionary.
 
         Args:
-            path (str): The path to the file to be read.
+            data (io.BufferedIOBase): The binary file to be read.
             file_encoding (str): The encoding of the file.
-            chunk_size (int, optional): The size of each chunk to be read. Defaults to 100.
+            path (str): The path of the file, for error messages.
 
         Yields:
             Mapping[str, Any]: A dictionary representing each row of data.
@@ -131,30 +212,35 @@ class ResponseToFileExtractor(RecordExtractor):
         """
 
         try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(
-                    data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object
-                )
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
+            chunks = pd.read_csv(
+                data,
+                chunksize=self._chunk_size,
+                iterator=True,
+                dialect="unix",
+                dtype=object,
+                encoding=file_encoding,
+            )
+            for chunk in chunks:
+                columns = list(chunk.columns)
+                # Building the rows from tuples is much faster than `DataFrame.to_dict`. Values are strings or NaN when they are missing
+                for row in chunk.itertuples(index=False, name=None):
+                    yield {
+                        column: None if isinstance(value, float) and math.isnan(value) else value
+                        for column, value in zip(columns, row)
+                    }
         except pd.errors.EmptyDataError as e:
             self.logger.info(f"Empty data received. {e}")
             yield from []
         except IOError as ioe:
             raise ValueError(f"The IO/Error occured while reading tmp data. Called: {path}", ioe)
-        finally:
-            # remove binary tmp file, after data is read
-            os.remove(path)
 
     def extract_records(
         self, response: Optional[requests.Response] = None
     ) -> Iterable[Mapping[str, Any]]:
         """
         Extracts records from the given response by:
-            1) Saving the result to a tmp file
-            2) Reading from saved file by chunks to avoid OOM
+            1) Saving the result to a tmp file in a separate thread
+            2) Reading from the file by chunks while it is saved to avoid OOM
 
         Args:
             response (Optional[requests.Response]): The response object containing the data. Defaults to None.
@@ -166,7 +252,25 @@ class ResponseToFileExtractor(RecordExtractor):
             None
         """
         if response:
-            file_path, encoding = self._save_to_file(response)
-            yield from self._read_with_chunks(file_path, encoding)
+            encoding = self._get_response_encoding(dict(response.headers or {}))
+            file_path = self._create_file()
+            downloaded_file = _DownloadedFile(file_path)
+            download = threading.Thread(
+                target=self._save_to_file,
+                args=(response, file_path, downloaded_file),
+                name="response_download",
+                daemon=True,
+            )
+            download.start()
+            try:
+                with io.BufferedReader(downloaded_file) as data:
+                    yield from self._read_with_chunks(data, encoding, file_path)
+            except _DownloadError as error:
+                raise error.exception
+            finally:
+                # closing the file stops the download if the records were not all read
+                download.join()
+                # remove binary tmp file, after data is read
+                os.remove(file_path)
         else:
             yield from []
@@ -0,0 +1,206 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
+from airbyte_cdk.sources.types import StreamState
+
+T = TypeVar("T")
+
+
+class PartitionStateStore(MutableMapping[str, DeclarativeCursor]):
+    """
+    Cursors per partition key where only the most recently used cursors are kept in memory. The state of the other cursors is kept in a
+    temporary sqlite database and a cursor is created again from its state when its partition is used, so the number of partitions is
+    bounded by the disk instead of the memory.
+
+    Partitions are ordered by insertion like in an `OrderedDict`: iterating and `popitem(last=False)` start with the oldest partition.
+    """
+
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        create_cursor: Callable[[StreamState], DeclarativeCursor],
+        max_cursors_in_memory: int,
+    ) -> None:
+        """
+        :param create_cursor: Creates the cursor of a partition from its state
+        :param max_cursors_in_memory: The number of cursors kept in memory. It should be greater than the number of partitions read at
+            the same time as a cursor evicted while its partition is read loses what it observed since the last time its state was
+            taken
+        """
+        if max_cursors_in_memory < 1:
+            raise ValueError(
+                f"max_cursors_in_memory must be at least 1. Got {max_cursors_in_memory}"
+            )
+        self._create_cursor = create_cursor
+        self._max_cursors_in_memory = max_cursors_in_memory
+        self._cursors: OrderedDict[str, DeclarativeCursor] = OrderedDict()
+        self._length = 0
+        self._next_position = 0
+        self._lock = threading.RLock()
+        self._directory = tempfile.TemporaryDirectory(prefix="airbyte_partition_states_")
+        self._connection = sqlite3.connect(
+            os.path.join(self._directory.name, "partition_states.sqlite"),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # The database is discarded at the end of the sync so there is no need to survive a crash
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute(
+            "CREATE TABLE partition_states (partition_key TEXT PRIMARY KEY, position INTEGER NOT NULL, state TEXT)"
+        )
+        self._connection.execute("CREATE INDEX position_index ON partition_states (position)")
+
+    def __getitem__(self, partition_key: str) -> DeclarativeCursor:
+        with self._lock:
+            cursor = self._cursors.get(partition_key)
+            if cursor is not None:
+                self._cursors.move_to_end(partition_key)
+                return cursor
+            row = self._connection.execute(
+                "SELECT state FROM partition_states WHERE partition_key = ?", (partition_key,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(partition_key)
+            cursor = self._create_cursor(self._deserialize(row[0]))
+            self._keep_in_memory(partition_key, cursor)
+            return cursor
+
+    def __setitem__(self, partition_key: str, cursor: DeclarativeCursor) -> None:
+        with self._lock:
+            if partition_key not in self:
+                self._connection.execute(
+                    "INSERT INTO partition_states (partition_key, position) VALUES (?, ?)",
+                    (partition_key, self._next_position),
+                )
+                self._next_position += 1
+                self._length += 1
+            self._keep_in_memory(partition_key, cursor)
+
+    def __delitem__(self, partition_key: str) -> None:
+        with self._lock:
+            if partition_key not in self:
+                raise KeyError(partition_key)
+            self._cursors.pop(partition_key, None)
+            self._connection.execute(
+                "DELETE FROM partition_states WHERE partition_key = ?", (partition_key,)
+            )
+            self._length -= 1
+
+    def __contains__(self, partition_key: object) -> bool:
+        with self._lock:
+            if partition_key in self._cursors:
+                return True
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM partition_states WHERE partition_key = ?", (partition_key,)
+                ).fetchone()
+                is not None
+            )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._iterate_in_batches(lambda partition_key, _: partition_key))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def popitem(self, last: bool = True) -> Tuple[str, DeclarativeCursor]:
+        """
+        :param last: If False, remove the oldest partition instead of the most recent one
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT partition_key FROM partition_states ORDER BY position {'DESC' if last else 'ASC'} LIMIT 1"
+            ).fetchone()
+            if row is None:
+                raise KeyError("popitem(): the partition state store is empty")
+            cursor = self[row[0]]
+            del self[row[0]]
+            return row[0], cursor
+
+    def states(self) -> Iterable[Tuple[str, StreamState]]:
+        """
+        :return: The state of each partition without creating the cursors that are not in memory
+        """
+        return self._iterate_in_batches(
+            lambda partition_key, serialized_state: (
+                partition_key,
+                self._cursors[partition_key].get_stream_state()
+                if partition_key in self._cursors
+                else self._deserialize(serialized_state),
+            )
+        )
+
+    def set_state(self, partition_key: str, state: StreamState) -> None:
+        """
+        Set the state of a partition without creating its cursor until the partition is used
+        """
+        with self._lock:
+            self._cursors.pop(partition_key, None)
+            if partition_key in self:
+                self._write_state(partition_key, state)
+                return
+            self._connection.execute(
+                "INSERT INTO partition_states (partition_key, position, state) VALUES (?, ?, ?)",
+                (partition_key, self._next_position, self._serialize(state)),
+            )
+            self._next_position += 1
+            self._length += 1
+
+    def _keep_in_memory(self, partition_key: str, cursor: DeclarativeCursor) -> None:
+        self._cursors[partition_key] = cursor
+        self._cursors.move_to_end(partition_key)
+        while len(self._cursors) > self._max_cursors_in_memory:
+            evicted_partition_key, evicted_cursor = self._cursors.popitem(last=False)
+            self._write_state(evicted_partition_key, evicted_cursor.get_stream_state())
+
+    def _write_state(self, partition_key: str, state: StreamState) -> None:
+        self._connection.execute(
+            "UPDATE partition_states SET state = ? WHERE partition_key = ?",
+            (self._serialize(state), partition_key),
+        )
+
+    def _iterate_in_batches(self, read_row: Callable[[str, Optional[str]], T]) -> Iterable[T]:
+        # Rows are read in batches so that the store can be updated while it is iterated. Each batch is read at once so that a cursor
+        # evicted while it is read doesn't leave its previous state
+        last_position = -1
+        while True:
+            with self._lock:
+                rows: List[Tuple[str, Optional[str], int]] = self._connection.execute(
+                    "SELECT partition_key, state, position FROM partition_states WHERE position > ? ORDER BY position LIMIT ?",
+                    (last_position, self._BATCH_SIZE),
+                ).fetchall()
+                batch = [read_row(partition_key, state) for partition_key, state, _ in rows]
+            if not rows:
+                return
+            yield from batch
+            last_position = rows[-1][2]
+
+    @staticmethod
+    def _serialize(state: StreamState) -> str:
+        return json.dumps(state, default=str)
+
+    @staticmethod
+    def _deserialize(serialized_state: Optional[str]) -> Any:
+        return json.loads(serialized_state) if serialized_state else {}
@@ -4,9 +4,10 @@
 
 import logging
 from collections import OrderedDict
-from typing import Any, Callable, Iterable, Mapping, Optional, Union
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import PartitionStateStore
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.streams.checkpoint.per_partition_key_serializer import (
     PerPartitionKeySerializer,
@@ -40,23 +41,42 @@ class PerPartitionCursor(DeclarativeCursor):
     - The `limit_reached` method returns `True` when `_over_limit` exceeds `DEFAULT_MAX_PARTITIONS_NUMBER`, indicating that the global cursor should be used instead of per-partition cursors.
 
     This approach avoids unnecessary switching to a global cursor due to temporary spikes in partition counts, ensuring that switching is only done when a sustained high number of partitions is observed.
+
+    **Partition State Store**
+
+    - If `max_partitions_in_memory` is set, `_cursor_per_partition` is a `PartitionStateStore` which only keeps that number of cursors in memory and the state of the other partitions on disk.
+    - The maximum number of partitions is then `MAX_PARTITIONS_NUMBER_WITH_STATE_STORE` so that streams with up to a million partitions keep their state per partition.
+    - Each checkpoint still reads and lists the state of every partition so the limit stays far below what the disk could hold.
     """
 
     DEFAULT_MAX_PARTITIONS_NUMBER = 10000
+    MAX_PARTITIONS_NUMBER_WITH_STATE_STORE = 1_000_000
     _NO_STATE: Mapping[str, Any] = {}
     _NO_CURSOR_STATE: Mapping[str, Any] = {}
     _KEY = 0
     _VALUE = 1
     _state_to_migrate_from: Mapping[str, Any] = {}
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: PartitionRouter):
+    def __init__(
+        self,
+        cursor_factory: CursorFactory,
+        partition_router: PartitionRouter,
+        max_partitions_in_memory: Optional[int] = None,
+    ):
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
         # The dict is ordered to ensure that once the maximum number of partitions is reached,
         # the oldest partitions can be efficiently removed, maintaining the most recent partitions.
-        self._cursor_per_partition: OrderedDict[str, DeclarativeCursor] = OrderedDict()
+        self._cursor_per_partition: Union[
+            OrderedDict[str, DeclarativeCursor], PartitionStateStore
+        ] = (
+            PartitionStateStore(self._create_cursor, max_partitions_in_memory)
+            if max_partitions_in_memory is not None
+            else OrderedDict()
+        )
         self._over_limit = 0
         self._partition_serializer = PerPartitionKeySerializer()
+        self._last_partition_key: Optional[Tuple[Mapping[str, Any], str]] = None
 
     def stream_slices(self) -> Iterable[StreamSlice]:
         slices = self._partition_router.stream_slices()
@@ -86,7 +106,7 @@ class PerPartitionCursor(DeclarativeCursor):
         """
         Ensure the maximum number of partitions is not exceeded. If so, the oldest added partition will be dropped.
         """
-        while len(self._cursor_per_partition) > self.DEFAULT_MAX_PARTITIONS_NUMBER - 1:
+        while len(self._cursor_per_partition) > self._get_max_partitions_number() - 1:
             self._over_limit += 1
             oldest_partition = self._cursor_per_partition.popitem(last=False)[
                 0
@@ -96,7 +116,12 @@ class PerPartitionCursor(DeclarativeCursor):
             )
 
     def limit_reached(self) -> bool:
-        return self._over_limit > self.DEFAULT_MAX_PARTITIONS_NUMBER
+        return self._over_limit > self._get_max_partitions_number()
+
+    def _get_max_partitions_number(self) -> int:
+        if isinstance(self._cursor_per_partition, PartitionStateStore):
+            return self.MAX_PARTITIONS_NUMBER_WITH_STATE_STORE
+        return self.DEFAULT_MAX_PARTITIONS_NUMBER
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
@@ -138,9 +163,12 @@ class PerPartitionCursor(DeclarativeCursor):
 
         else:
             for state in stream_state["states"]:
-                self._cursor_per_partition[self._to_partition_key(state["partition"])] = (
-                    self._create_cursor(state["cursor"])
-                )
+                partition_key = self._to_partition_key(state["partition"])
+                if isinstance(self._cursor_per_partition, PartitionStateStore):
+                    # The cursor is only created if the partition is read
+                    self._cursor_per_partition.set_state(partition_key, state["cursor"])
+                else:
+                    self._cursor_per_partition[partition_key] = self._create_cursor(state["cursor"])
 
             # set default state for missing partitions if it is per partition with fallback to global
             if "state" in stream_state:
@@ -167,8 +195,7 @@ class PerPartitionCursor(DeclarativeCursor):
 
     def get_stream_state(self) -> StreamState:
         states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
-            cursor_state = cursor.get_stream_state()
+        for partition_tuple, cursor_state in self._get_cursor_states():
             if cursor_state:
                 states.append(
                     {
@@ -183,6 +210,15 @@ class PerPartitionCursor(DeclarativeCursor):
             state["parent_state"] = parent_state
         return state
 
+    def _get_cursor_states(self) -> Iterable[Tuple[str, StreamState]]:
+        if isinstance(self._cursor_per_partition, PartitionStateStore):
+            # Avoid creating the cursors of the partitions that are only on disk
+            return self._cursor_per_partition.states()
+        return (
+            (partition_key, cursor.get_stream_state())
+            for partition_key, cursor in self._cursor_per_partition.items()
+        )
+
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
         if cursor:
@@ -195,7 +231,14 @@ class PerPartitionCursor(DeclarativeCursor):
         return not bool(stream_state)
 
     def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
-        return self._partition_serializer.to_partition_key(partition)
+        # The same partition object is serialized for each of its slices and records so the key of the last partition is kept. This
+        # assumes that partitions are not modified once they are read, like stream slices.
+        last_partition_key = self._last_partition_key
+        if last_partition_key is not None and last_partition_key[0] is partition:
+            return last_partition_key[1]
+        partition_key = self._partition_serializer.to_partition_key(partition)
+        self._last_partition_key = (partition, partition_key)
+        return partition_key
 
     def _to_dict(self, partition_key: str) -> Mapping[str, Any]:
         return self._partition_serializer.to_partition(partition_key)
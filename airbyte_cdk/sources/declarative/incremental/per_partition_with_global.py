@@ -71,9 +71,12 @@ class PerPartitionWithGlobalCursor(DeclarativeCursor):
         cursor_factory: CursorFactory,
         partition_router: PartitionRouter,
         stream_cursor: DatetimeBasedCursor,
+        max_partitions_in_memory: Optional[int] = None,
     ):
         self._partition_router = partition_router
-        self._per_partition_cursor = PerPartitionCursor(cursor_factory, partition_router)
+        self._per_partition_cursor = PerPartitionCursor(
+            cursor_factory, partition_router, max_partitions_in_memory=max_partitions_in_memory
+        )
         self._global_cursor = GlobalSubstreamCursor(stream_cursor, partition_router)
         self._use_global_cursor = False
         self._current_partition: Optional[Mapping[str, Any]] = None
@@ -40,6 +40,7 @@ class InterpolatedBoolean:
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._default = "False"
         self._interpolation = JinjaInterpolation()
+        self._interpolation.precompile(self.condition)
         self._parameters = parameters
 
     def eval(self, config: Config, **additional_parameters: Any) -> bool:
@@ -25,6 +25,9 @@ class InterpolatedMapping:
     def __post_init__(self, parameters: Optional[Mapping[str, Any]]) -> None:
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
+        for name, value in self.mapping.items():
+            self._interpolation.precompile(name)
+            self._interpolation.precompile(value)
 
     def eval(self, config: Config, **additional_parameters: Any) -> Dict[str, Any]:
         """
@@ -27,6 +27,7 @@ class InterpolatedString:
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.default = self.default or self.string
         self._interpolation = JinjaInterpolation()
+        self._interpolation.precompile(self.string)
         self._parameters = parameters
         # indicates whether passed string is just a plain string, not Jinja template
         # This allows for optimization, but we do not know it yet at this stage
@@ -3,16 +3,18 @@
 #
 
 import ast
-from functools import cache
-from typing import Any, Mapping, Optional, Tuple, Type
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Set, Tuple, Type, Union
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
+from airbyte_cdk.sources.declarative.interpolation.template_cache import TemplateCache
 from airbyte_cdk.sources.types import Config
-from jinja2 import meta
+from jinja2 import meta, nodes
 from jinja2.environment import Template
-from jinja2.exceptions import UndefinedError
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
 
@@ -29,6 +31,49 @@ class StreamPartitionAccessEnvironment(SandboxedEnvironment):
         return super().is_safe_attribute(obj, attr, value)  # type: ignore  # for some reason, mypy says 'Returning Any from function declared to return "bool"'
 
 
+class _StaticString:
+    """
+    A string without any Jinja syntax. Rendering it returns the string as is.
+    """
+
+
+_STATIC_STRING = _StaticString()
+
+
+@dataclass(frozen=True)
+class _VariableLookup:
+    """
+    A template made of a single variable lookup such as `{{ config.start_date }}` or `{{ record['id'] }}`.
+
+    Each element of `path` is a tuple `(is_attribute, key)` for a `.key` or a `[key]` access respectively.
+    """
+
+    variable: str
+    path: Tuple[Tuple[bool, Union[str, int]], ...]
+
+
+_FastPath = Union[_StaticString, _VariableLookup]
+
+class _CompiledString:
+    """
+    What is derived from a string to evaluate it. The Jinja template and its undeclared variables are only computed for strings that
+    need to be rendered.
+    """
+
+    __slots__ = ("fast_path", "undeclared_variables", "template", "static_values")
+
+    def __init__(self, fast_path: Optional[_FastPath]) -> None:
+        self.fast_path = fast_path
+        self.undeclared_variables: Optional[Set[str]] = None
+        self.template: Optional[Template] = None
+        self.static_values: Dict[Optional[Tuple[Type[Any]]], Any] = {}
+
+
+# Types for which `ast.literal_eval(str(value))` returns `value`
+_TYPES_RENDERED_AS_LITERALS = (int, bool, type(None))
+_LITERAL_NAMES = frozenset({"True", "False", "None"})
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -45,6 +90,9 @@ class JinjaInterpolation(Interpolation):
     "{{ max(2, 3) }}" will return 3
 
     Additional information on jinja templating can be found at https://jinja.palletsprojects.com/en/3.1.x/templates/#
+
+    Strings that don't use any Jinja syntax and templates made of a single variable lookup like `{{ config.start_date }}` are evaluated
+    without rendering a Jinja template. They yield the same values as if they had been rendered.
     """
 
     # These aliases are used to deprecate existing keywords without breaking all existing connectors.
@@ -65,15 +113,36 @@ class JinjaInterpolation(Interpolation):
         "range"
     ]  # The range function can cause very expensive computations
 
+    # All the instances share the same environment so that what is compiled from a string can be shared too. The cache is keyed on the
+    # template string and bounded so that processes running many manifests compile each distinct template once without leaking memory.
+    TEMPLATE_CACHE_MAX_SIZE = 4096
+    template_cache: TemplateCache[_CompiledString] = TemplateCache(TEMPLATE_CACHE_MAX_SIZE)
+    _shared_environment: Optional[StreamPartitionAccessEnvironment] = None
+
     def __init__(self) -> None:
-        self._environment = StreamPartitionAccessEnvironment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
+        if JinjaInterpolation._shared_environment is None:
+            JinjaInterpolation._shared_environment = self._create_environment()
+        self._environment = JinjaInterpolation._shared_environment
+
+    @classmethod
+    def _create_environment(cls) -> StreamPartitionAccessEnvironment:
+        environment = StreamPartitionAccessEnvironment()
+        environment.filters.update(**filters)
+        environment.globals.update(**macros)
 
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+        for extension in cls.RESTRICTED_EXTENSIONS:
+            environment.extensions.pop(extension, None)
+        for builtin in cls.RESTRICTED_BUILTIN_FUNCTIONS:
+            environment.globals.pop(builtin, None)
+        return environment
+
+    def precompile(self, input_str: Any) -> None:
+        """
+        Classify the input string ahead of its first evaluation so that components can pay the cost of parsing their interpolated
+        strings when they are created instead of when the first record is processed.
+        """
+        if isinstance(input_str, str):
+            self._get_fast_path(input_str)
 
     def eval(
         self,
@@ -83,18 +152,27 @@ class JinjaInterpolation(Interpolation):
         valid_types: Optional[Tuple[Type[Any]]] = None,
         **additional_parameters: Any,
     ) -> Any:
-        context = {"config": config, **additional_parameters}
-
-        for alias, equivalent in self.ALIASES.items():
-            if alias in context:
+        for alias in self.ALIASES:
+            if alias in additional_parameters:
                 # This is unexpected. We could ignore or log a warning, but failing loudly should result in fewer surprises
                 raise ValueError(
                     f"Found reserved keyword {alias} in interpolation context. This is unexpected and indicative of a bug in the CDK."
                 )
-            elif equivalent in context:
+
+        fast_path = self._get_fast_path(input_str) if isinstance(input_str, str) else None
+        if fast_path is _STATIC_STRING:
+            return self._eval_static_string(input_str, valid_types)
+
+        context = {"config": config, **additional_parameters}
+        for alias, equivalent in self.ALIASES.items():
+            if equivalent in context:
                 context[alias] = context[equivalent]
 
         try:
+            if isinstance(fast_path, _VariableLookup):
+                return self._eval_variable_lookup(
+                    fast_path, input_str, context, default, valid_types
+                )
             if isinstance(input_str, str):
                 result = self._eval(input_str, context)
                 if result:
@@ -107,16 +185,68 @@ class JinjaInterpolation(Interpolation):
         # If result is empty or resulted in an undefined error, evaluate and return the default string
         return self._literal_eval(self._eval(default, context), valid_types)
 
-    def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+    def _eval_static_string(self, input_str: str, valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+        static_values = self._get_compiled_string(input_str).static_values
+        if valid_types in static_values:
+            return static_values[valid_types]
+        evaluated = self._literal_eval(input_str, valid_types)
+        if isinstance(evaluated, (str, int, float, complex, bytes, type(None))):
+            # Mutable values like lists or dicts are evaluated every time so that callers can't alter the value returned to others
+            static_values[valid_types] = evaluated
+        return evaluated
+
+    def _eval_variable_lookup(
+        self,
+        lookup: _VariableLookup,
+        input_str: str,
+        context: Mapping[str, Any],
+        default: Optional[str],
+        valid_types: Optional[Tuple[Type[Any]]],
+    ) -> Any:
+        """
+        Evaluate the lookup the same way the compiled Jinja template would, using the environment to access attributes and items
+        """
+        if lookup.variable not in context:
+            raise ValueError(
+                f"Jinja macro has undeclared variables: {{'{lookup.variable}'}}. Context: {context}"
+            )
+        value = context[lookup.variable]
         try:
-            evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
-        except (ValueError, SyntaxError):
+            for is_attribute, key in lookup.path:
+                if is_attribute:
+                    value = self._environment.getattr(value, key)  # type: ignore[arg-type]  # attributes are always strings
+                else:
+                    value = self._environment.getitem(value, key)
+        except UndefinedError:
+            return self._literal_eval(self._eval(default, context), valid_types)
+
+        if type(value) in _TYPES_RENDERED_AS_LITERALS or (
+            type(value) is float and math.isfinite(value)
+        ):
+            return value if not valid_types or isinstance(value, valid_types) else str(value)
+        rendered = str(value)
+        if rendered:
+            return self._literal_eval(rendered, valid_types)
+        return self._literal_eval(self._eval(default, context), valid_types)
+
+    def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+        if isinstance(result, str) and not self._may_be_literal(result):
             return result
+        if isinstance(result, str) and self._is_small_decimal_integer(result):
+            evaluated: Any = int(result)
+        else:
+            try:
+                evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
+            except (ValueError, SyntaxError):
+                return result
         if not valid_types or (valid_types and isinstance(evaluated, valid_types)):
             return evaluated
         return result
 
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
+        if s is None:
+            # There is no default value to evaluate
+            return None
         try:
             undeclared = self._find_undeclared_variables(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
@@ -130,17 +260,87 @@ class JinjaInterpolation(Interpolation):
             # It can be returned as is
             return s
 
-    @cache
-    def _find_undeclared_variables(self, s: Optional[str]) -> Template:
+    @staticmethod
+    def _may_be_literal(s: str) -> bool:
+        """
+        Strings starting with an identifier can only be Python literals if they are a constant like `True` or a prefixed string like
+        `b'...'`. Checking this is much cheaper than having `ast.literal_eval` fail on the many strings that are plain words.
+        """
+        stripped = s.lstrip(" \t")
+        if not stripped or not (stripped[0].isalpha() or stripped[0] == "_"):
+            return True
+        return stripped.rstrip() in _LITERAL_NAMES or "'" in stripped[:3] or '"' in stripped[:3]
+
+    @staticmethod
+    def _is_small_decimal_integer(s: str) -> bool:
+        # Leading zeros are a syntax error for `ast.literal_eval` so those strings are left to it
+        return len(s) < 19 and s.isascii() and s.isdigit() and (len(s) == 1 or s[0] != "0")
+
+    def _get_compiled_string(self, s: Optional[str]) -> _CompiledString:
+        return self.template_cache.get(s, self._create_compiled_string)  # type: ignore[arg-type]  # the cache passes back the key
+
+    def _create_compiled_string(self, s: Optional[str]) -> _CompiledString:
+        if not isinstance(s, str):
+            raise TypeError(f"Expected a string, got {s}")
+        return _CompiledString(self._classify(s))
+
+    def _get_fast_path(self, s: str) -> Optional[_FastPath]:
+        return self._get_compiled_string(s).fast_path
+
+    def _classify(self, s: str) -> Optional[_FastPath]:
+        """
+        Return how the string can be evaluated without rendering a Jinja template, or None if it needs to be rendered
+        """
+        if not s or "\r" in s or s.endswith("\n"):
+            # Jinja normalizes newlines and removes the trailing one when rendering
+            return None
+        if "{{" not in s and "{%" not in s and "{#" not in s:
+            return _STATIC_STRING
+        try:
+            template = self._environment.parse(s)
+        except TemplateSyntaxError:
+            # The error is raised when the string is evaluated
+            return None
+        if (
+            len(template.body) != 1
+            or not isinstance(template.body[0], nodes.Output)
+            or len(template.body[0].nodes) != 1
+        ):
+            return None
+
+        node = template.body[0].nodes[0]
+        path = []
+        while isinstance(node, (nodes.Getattr, nodes.Getitem)):
+            if isinstance(node, nodes.Getattr):
+                path.append((True, node.attr))
+            elif isinstance(node.arg, nodes.Const) and type(node.arg.value) in (str, int):
+                path.append((False, node.arg.value))
+            else:
+                return None
+            node = node.node
+        if (
+            isinstance(node, nodes.Name)
+            and node.ctx == "load"
+            and node.name not in self._environment.globals
+        ):
+            return _VariableLookup(node.name, tuple(reversed(path)))
+        return None
+
+    def _find_undeclared_variables(self, s: Optional[str]) -> Set[str]:
         """
         Find undeclared variables and cache them
         """
-        ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
-        return meta.find_undeclared_variables(ast)
+        compiled_string = self._get_compiled_string(s)
+        if compiled_string.undeclared_variables is None:
+            ast = self._environment.parse(s)  # type: ignore # s is a string if the compiled string could be created
+            compiled_string.undeclared_variables = meta.find_undeclared_variables(ast)
+        return compiled_string.undeclared_variables
 
-    @cache
     def _compile(self, s: Optional[str]) -> Template:
         """
         We must cache the Jinja Template ourselves because we're using `from_string` instead of a template loader
         """
-        return self._environment.from_string(s)
+        compiled_string = self._get_compiled_string(s)
+        if compiled_string.template is None:
+            compiled_string.template = self._environment.from_string(s)  # type: ignore # s is a string if the compiled string could be created
+        return compiled_string.template
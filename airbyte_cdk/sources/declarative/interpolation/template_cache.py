@@ -0,0 +1,72 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class TemplateCache(Generic[T]):
+    """
+    Thread-safe LRU cache of the values compiled from template strings.
+
+    Unlike `functools.cache` on a method, the cache does not keep references to the objects using it and its size is bounded so that
+    processes creating templates dynamically (for example, from the parameters of each stream of many manifests) don't grow forever.
+    Values are computed outside of the lock: two threads missing the same key at the same time both compute the value and the last one
+    is kept, which is fine for values that are pure functions of the key.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: The maximum number of entries. The least recently used entry is evicted when it is reached
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1. Got {max_size}")
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[Hashable], T]) -> T:
+        """
+        Return the value cached for the key or compute and cache it. Exceptions raised by `compute` are propagated and nothing is cached.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+
+        value = compute(key)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
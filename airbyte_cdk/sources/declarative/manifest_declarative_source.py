@@ -202,7 +202,11 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[List[AirbyteStateMessage]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            # The partitions of the parent streams are only shared by the substreams of a read
+            self._constructor.clear_parent_record_cache()
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
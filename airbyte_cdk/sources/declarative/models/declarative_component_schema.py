@@ -66,6 +66,12 @@ class ConcurrencyLevel(BaseModel):
         examples=[20, 100],
         title="Max Concurrency",
     )
+    max_queue_size_in_bytes: Optional[int] = Field(
+        None,
+        description="The approximate maximum size of the records buffered in memory between the threads reading partitions and the thread emitting records. Once it is reached, reading partitions is paused until records are emitted. Defaults to 256 MB. The AIRBYTE_MAX_QUEUE_SIZE_IN_BYTES environment variable takes precedence over this value.",
+        examples=[268435456],
+        title="Max Queue Size In Bytes",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -670,6 +676,10 @@ class JsonDecoder(BaseModel):
     type: Literal["JsonDecoder"]
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal["StreamingJsonDecoder"]
+
+
 class JsonlDecoder(BaseModel):
     type: Literal["JsonlDecoder"]
 
@@ -1651,6 +1661,7 @@ class SimpleRetriever(BaseModel):
             IterableDecoder,
             XmlDecoder,
             GzipJsonDecoder,
+            StreamingJsonDecoder,
         ]
     ] = Field(
         None,
@@ -5,8 +5,10 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import importlib
 import inspect
+import json
 import re
 from functools import partial
 from typing import (
@@ -63,6 +65,7 @@ from airbyte_cdk.sources.declarative.decoders import (
     JsonDecoder,
     JsonlDecoder,
     PaginationDecoderDecorator,
+    StreamingJsonDecoder,
     XmlDecoder,
 )
 from airbyte_cdk.sources.declarative.extractors import (
@@ -277,6 +280,9 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
     SimpleRetriever as SimpleRetrieverModel,
 )
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    StreamingJsonDecoder as StreamingJsonDecoderModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     SubstreamPartitionRouter as SubstreamPartitionRouterModel,
 )
@@ -296,6 +302,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     SinglePartitionRouter,
     SubstreamPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
 )
@@ -365,6 +374,7 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_sta
     DateTimeStreamStateConverter,
 )
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
+from airbyte_cdk.sources.streams.http.http_connection_pool import HttpConnectionPool
 from airbyte_cdk.sources.types import Config
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from isodate import parse_duration
@@ -384,6 +394,10 @@ class ModelToComponentFactory:
         disable_retries: bool = False,
         disable_cache: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
+        parent_stream_concurrency_level: int = 1,
+        max_partitions_in_memory: Optional[int] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -394,6 +408,16 @@ class ModelToComponentFactory:
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
+        # Shared by all the requesters so that the streams of a source reuse the connections to the same hosts
+        self._connection_pool = connection_pool or HttpConnectionPool()
+        # Shared by all the substream partition routers so that a parent stream is read once for its substreams
+        self._parent_record_cache = (
+            None if disable_cache else parent_record_cache or ParentRecordCache()
+        )
+        self._parent_stream_concurrency_level = parent_stream_concurrency_level
+        # If set, the cursors of partitioned streams keep the state of the partitions beyond this number on disk instead of dropping them.
+        # It can't be set from a manifest yet: sources enable it by passing their own factory as the `component_factory` of the source
+        self._max_partitions_in_memory = max_partitions_in_memory
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -434,6 +458,7 @@ class ModelToComponentFactory:
             JsonDecoderModel: self.create_json_decoder,
             JsonlDecoderModel: self.create_jsonl_decoder,
             GzipJsonDecoderModel: self.create_gzipjson_decoder,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             KeysToLowerModel: self.create_keys_to_lower_transformation,
             IterableDecoderModel: self.create_iterable_decoder,
             XmlDecoderModel: self.create_xml_decoder,
@@ -741,6 +766,7 @@ class ModelToComponentFactory:
             max_concurrency=model.max_concurrency,
             config=config,
             parameters={},
+            max_queue_size_in_bytes=model.max_queue_size_in_bytes,
         )
 
     def create_concurrent_cursor_from_datetime_based_cursor(
@@ -1327,6 +1353,7 @@ class ModelToComponentFactory:
                     ),
                     partition_router=stream_slicer,
                     stream_cursor=cursor_component,
+                    max_partitions_in_memory=self._max_partitions_in_memory,
                 )
         elif model.incremental_sync:
             return (
@@ -1341,6 +1368,7 @@ class ModelToComponentFactory:
                     create_function=partial(ChildPartitionResumableFullRefreshCursor, {})
                 ),
                 partition_router=stream_slicer,
+                max_partitions_in_memory=self._max_partitions_in_memory,
             )
         elif (
             hasattr(model.retriever, "paginator")
@@ -1508,6 +1536,7 @@ class ModelToComponentFactory:
             use_cache=use_cache,
             decoder=decoder,
             stream_response=decoder.is_stream_response() if decoder else False,
+            connection_pool=self._connection_pool,
         )
 
     @staticmethod
@@ -1568,6 +1597,12 @@ class ModelToComponentFactory:
     ) -> GzipJsonDecoder:
         return GzipJsonDecoder(parameters={}, encoding=model.encoding)
 
+    @staticmethod
+    def create_streaming_json_decoder(
+        model: StreamingJsonDecoderModel, config: Config, **kwargs: Any
+    ) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(parameters={})
+
     @staticmethod
     def create_json_file_schema_loader(
         model: JsonFileSchemaLoaderModel, config: Config, **kwargs: Any
@@ -1755,7 +1790,30 @@ class ModelToComponentFactory:
             incremental_dependency=model.incremental_dependency or False,
             parameters=model.parameters or {},
             extra_fields=model.extra_fields,
+            cache_key=self._get_parent_stream_cache_key(model),
+            stream_factory=partial(self._create_parent_stream_for_slice_reads, model.stream, config)
+            if isinstance(model.stream.retriever, SimpleRetrieverModel)
+            else None,
+        )
+
+    def _create_parent_stream_for_slice_reads(
+        self, model: DeclarativeStreamModel, config: Config
+    ) -> DeclarativeStream:
+        declarative_stream: DeclarativeStream = self._create_component_from_model(
+            model, config=config
         )
+        # Slices are read without checkpointing the parent stream: without its cursor, the retriever reads all the pages of a slice at once
+        declarative_stream.retriever.cursor = None  # type: ignore # the retriever is always a SimpleRetriever
+        return declarative_stream
+
+    @staticmethod
+    def _get_parent_stream_cache_key(model: ParentStreamConfigModel) -> str:
+        serialized_model = json.dumps(
+            [model.stream.dict(), model.parent_key, model.extra_fields],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(serialized_model.encode()).hexdigest()
 
     @staticmethod
     def create_record_filter(
@@ -2132,6 +2190,8 @@ class ModelToComponentFactory:
             parent_stream_configs=parent_stream_configs,
             parameters=model.parameters or {},
             config=config,
+            parent_record_cache=self._parent_record_cache,
+            parent_stream_concurrency_level=self._parent_stream_concurrency_level,
         )
 
     def _create_message_repository_substream_wrapper(
@@ -2148,6 +2208,10 @@ class ModelToComponentFactory:
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
+            connection_pool=self._connection_pool,
+            parent_record_cache=self._parent_record_cache,
+            parent_stream_concurrency_level=self._parent_stream_concurrency_level,
+            max_partitions_in_memory=self._max_partitions_in_memory,
         )
         return substream_factory._create_component_from_model(model=model, config=config)
 
@@ -2180,5 +2244,21 @@ class ModelToComponentFactory:
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def get_connection_pool(self) -> HttpConnectionPool:
+        return self._connection_pool
+
+    def clear_parent_record_cache(self) -> None:
+        """
+        Release the partitions cached for the parent streams so that they are read again by the next read
+        """
+        if self._parent_record_cache is not None:
+            self._parent_record_cache.clear()
+
+    def set_parent_stream_concurrency_level(self, concurrency_level: int) -> None:
+        """
+        Set the number of slices of a parent stream that the substream partition routers created afterwards read at the same time
+        """
+        self._parent_stream_concurrency_level = concurrency_level
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from queue import Full, Queue
+from typing import Any, Callable, Iterable, Optional
+
+
+@dataclass(frozen=True)
+class _ReaderDone:
+    exception: Optional[Exception] = None
+
+
+class ConcurrentParentReader:
+    """
+    Reads iterables on a pool of threads and yields their items as soon as they are read, so that the partitions of a substream can be
+    generated while its parent streams are still being read.
+
+    The items of an iterable are yielded in order but the items of different iterables are interleaved. At most `max_workers` iterables
+    are read at the same time and at most `max_queue_size` items are read ahead of the consumer. If an iterable raises, the exception is
+    raised to the consumer and the other iterables stop being read.
+    """
+
+    # How often a thread waiting for the consumer to take items checks if the consumer stopped reading
+    _PUT_TIMEOUT_SECONDS = 0.1
+
+    def __init__(self, max_workers: int, max_queue_size: int = 10_000) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got {max_workers}")
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+
+    def read(self, readers: Iterable[Callable[[], Iterable[Any]]]) -> Iterable[Any]:
+        """
+        :param readers: each reader returns an iterable that is read on one of the threads. Readers are taken from `readers` as threads
+            are available so that they can be generated lazily
+        """
+        items: Queue[Any] = Queue(maxsize=self._max_queue_size)
+        stopped = threading.Event()
+        readers_iterator = iter(readers)
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="parent_reader"
+        )
+        running_readers = 0
+        try:
+            for reader in islice(readers_iterator, self._max_workers):
+                executor.submit(self._read, reader, items, stopped)
+                running_readers += 1
+
+            while running_readers:
+                item = items.get()
+                if not isinstance(item, _ReaderDone):
+                    yield item
+                    continue
+                running_readers -= 1
+                if item.exception is not None:
+                    raise item.exception
+                next_reader = next(readers_iterator, None)
+                if next_reader is not None:
+                    executor.submit(self._read, next_reader, items, stopped)
+                    running_readers += 1
+        finally:
+            # Threads blocked on a full queue give up once the consumer stopped reading
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _read(
+        self, reader: Callable[[], Iterable[Any]], items: Queue[Any], stopped: threading.Event
+    ) -> None:
+        exception = None
+        iterable: Optional[Iterable[Any]] = None
+        try:
+            iterable = reader()
+            for item in iterable:
+                if not self._put(items, item, stopped):
+                    break
+        except Exception as e:
+            exception = e
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+        self._put(items, _ReaderDone(exception), stopped)
+
+    def _put(self, items: Queue[Any], item: Any, stopped: threading.Event) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=self._PUT_TIMEOUT_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
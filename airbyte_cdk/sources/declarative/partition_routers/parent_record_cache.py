@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import pickle
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger("airbyte")
+
+# The partition value, the parent slice and the extra fields extracted from a parent record
+ParentPartition = Tuple[Any, Mapping[str, Any], Mapping[str, Any]]
+
+# Raised when partitions can't be written to the temporary file, in which case they are not cached
+_PICKLING_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+class _CachedPartitions:
+    """
+    Partitions of a parent stream. The first ones are kept in memory and the others are pickled in batches to a temporary file that is
+    deleted when it is closed.
+    """
+
+    _BATCH_SIZE = 1000
+
+    def __init__(self, max_partitions_in_memory: int) -> None:
+        self._max_partitions_in_memory = max_partitions_in_memory
+        self._partitions: List[ParentPartition] = []
+        self._pending_batch: List[ParentPartition] = []
+        self._file: Optional[IO[bytes]] = None
+        self._batch_offsets: List[int] = []
+        self._file_lock = threading.Lock()
+
+    def append(self, partition: ParentPartition) -> None:
+        if len(self._partitions) < self._max_partitions_in_memory:
+            self._partitions.append(partition)
+            return
+        self._pending_batch.append(partition)
+        if len(self._pending_batch) >= self._BATCH_SIZE:
+            self._write_pending_batch()
+
+    def complete(self) -> None:
+        if self._pending_batch:
+            self._write_pending_batch()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def read(self) -> Iterable[ParentPartition]:
+        yield from self._partitions
+        for offset in self._batch_offsets:
+            # The file is shared by the readers so each batch is read at once
+            with self._file_lock:
+                assert self._file is not None
+                self._file.seek(offset)
+                batch = pickle.load(self._file)
+            yield from batch
+
+    def _write_pending_batch(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        with self._file_lock:
+            self._file.seek(0, 2)
+            offset = self._file.tell()
+            pickle.dump(self._pending_batch, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._batch_offsets.append(offset)
+        self._pending_batch = []
+
+
+class ParentRecordCache:
+    """
+    Partitions extracted from the records of parent streams, shared by the substreams having the same parent stream so that the parent
+    stream's records are requested and decoded once per sync.
+
+    Only the partition values, the parent slices and the extra fields are kept: a parent stream with few fields extracted per record takes
+    little space even if its records are big. Partitions beyond `max_partitions_in_memory` are kept in a temporary file. The partitions of
+    a parent stream are only cached once it was completely read: a substream that stops reading its parent early doesn't leave partial
+    partitions for the others.
+    """
+
+    def __init__(self, max_partitions_in_memory: int = 100_000) -> None:
+        self._max_partitions_in_memory = max_partitions_in_memory
+        self._partitions_by_key: Dict[str, _CachedPartitions] = {}
+        self._lock = threading.Lock()
+
+    def read_through(
+        self, key: str, read_partitions: Callable[[], Iterable[ParentPartition]]
+    ) -> Iterable[ParentPartition]:
+        """
+        :param key: identifies the parent stream and how partitions are extracted from its records
+        :param read_partitions: reads the partitions from the parent stream if they are not cached
+        :return: the cached partitions or the ones read, which are cached once they are all read
+        """
+        with self._lock:
+            cached_partitions = self._partitions_by_key.get(key)
+        if cached_partitions is not None:
+            yield from cached_partitions.read()
+            return
+
+        partitions: Optional[_CachedPartitions] = _CachedPartitions(self._max_partitions_in_memory)
+        try:
+            for partition in read_partitions():
+                if partitions is not None:
+                    partitions = self._append(partitions, partition, key)
+                yield partition
+        except BaseException:
+            if partitions is not None:
+                partitions.close()
+            raise
+        if partitions is None or not self._complete(partitions, key):
+            return
+        with self._lock:
+            if key in self._partitions_by_key:
+                # Another substream read the same parent stream at the same time
+                partitions.close()
+            else:
+                self._partitions_by_key[key] = partitions
+
+    def clear(self) -> None:
+        with self._lock:
+            for partitions in self._partitions_by_key.values():
+                partitions.close()
+            self._partitions_by_key.clear()
+
+    @staticmethod
+    def _append(
+        partitions: _CachedPartitions, partition: ParentPartition, key: str
+    ) -> Optional[_CachedPartitions]:
+        try:
+            partitions.append(partition)
+            return partitions
+        except _PICKLING_ERRORS as exception:
+            logger.debug(f"Partitions of parent stream {key} can't be cached: {exception}")
+            partitions.close()
+            return None
+
+    @staticmethod
+    def _complete(partitions: _CachedPartitions, key: str) -> bool:
+        try:
+            partitions.complete()
+            return True
+        except _PICKLING_ERRORS as exception:
+            logger.debug(f"Partitions of parent stream {key} can't be cached: {exception}")
+            partitions.close()
+            return False
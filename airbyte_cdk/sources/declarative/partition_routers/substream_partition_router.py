@@ -3,18 +3,28 @@
 #
 import copy
 import logging
-from dataclasses import InitVar, dataclass
-from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, Optional, Union
+from dataclasses import InitVar, dataclass, field
+from functools import partial
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Mapping, Optional, Union
 
 import dpath
-from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import AirbyteMessage, SyncMode
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_reader import (
+    ConcurrentParentReader,
+)
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentPartition,
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import (
     RequestOption,
     RequestOptionType,
 )
+from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.utils import AirbyteTracedException
 
@@ -33,6 +43,9 @@ class ParentStreamConfig:
     extra_fields: Additional field paths to include in the stream slice
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    cache_key: Identifies the parent stream and the fields extracted from its records. Parent stream configs with the same key share
+        the partitions cached by the router's parent record cache
+    stream_factory: Creates other instances of the parent stream so that its slices can be read concurrently
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -45,6 +58,8 @@ class ParentStreamConfig:
     )
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
+    cache_key: Optional[str] = None
+    stream_factory: Optional[Callable[[], "DeclarativeStream"]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -67,11 +82,18 @@ class SubstreamPartitionRouter(PartitionRouter):
 
     Attributes:
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
+        parent_record_cache (Optional[ParentRecordCache]): partitions extracted from the parent streams, shared with the other
+            substreams of the source so that a parent stream is read once
+        parent_stream_concurrency_level (int): number of parent slices read at the same time. Parent streams read with
+            `incremental_dependency` are always read one slice at a time so that their state only covers the partitions emitted
     """
 
     parent_stream_configs: List[ParentStreamConfig]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    # Keyword-only so that subclasses can still declare fields without default values
+    parent_record_cache: Optional[ParentRecordCache] = field(default=None, kw_only=True)
+    parent_stream_concurrency_level: int = field(default=1, kw_only=True)
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if not self.parent_stream_configs:
@@ -153,59 +175,147 @@ class SubstreamPartitionRouter(PartitionRouter):
         """
         if not self.parent_stream_configs:
             yield from []
+        elif self._read_parent_streams_concurrently():
+            yield from ConcurrentParentReader(
+                min(self.parent_stream_concurrency_level, len(self.parent_stream_configs))
+            ).read(
+                [
+                    partial(self._parent_stream_slices, parent_stream_config)
+                    for parent_stream_config in self.parent_stream_configs
+                ]
+            )
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
-                partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
-                extra_fields = None
-                if parent_stream_config.extra_fields:
-                    extra_fields = [
-                        [field_path_part.eval(self.config) for field_path_part in field_path]
-                        for field_path in parent_stream_config.extra_fields
-                    ]  # type: ignore # extra_fields is always casted to an interpolated string
-
-                # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
-                # not support either substreams or RFR, but something that needs to be considered once we do
-                for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = (
-                            parent_record.associated_slice.partition
-                            if parent_record.associated_slice
-                            else {}
-                        )
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(
-                            message=f"Parent stream returned records as invalid type {type(parent_record)}"
-                        )
-                    try:
-                        partition_value = dpath.get(parent_record, parent_field)
-                    except KeyError:
-                        continue
-
-                    # Add extra fields
-                    extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
-
-                    yield StreamSlice(
-                        partition={
-                            partition_field: partition_value,
-                            "parent_slice": parent_partition or {},
-                        },
-                        cursor_slice={},
-                        extra_fields=extracted_extra_fields,
-                    )
+                yield from self._parent_stream_slices(parent_stream_config)
+
+    def _read_parent_streams_concurrently(self) -> bool:
+        # The state of a parent read with `incremental_dependency` must not include the records of another parent read ahead
+        return (
+            self.parent_stream_concurrency_level > 1
+            and len(self.parent_stream_configs) > 1
+            and not any(
+                parent_stream_config.incremental_dependency
+                for parent_stream_config in self.parent_stream_configs
+            )
+        )
+
+    def _parent_stream_slices(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[StreamSlice]:
+        partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
+        for (
+            partition_value,
+            parent_partition,
+            extracted_extra_fields,
+        ) in self._read_parent_partitions(parent_stream_config):
+            yield StreamSlice(
+                partition={
+                    partition_field: partition_value,
+                    "parent_slice": parent_partition,
+                },
+                cursor_slice={},
+                extra_fields=extracted_extra_fields,
+            )
+
+    def _read_parent_partitions(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[ParentPartition]:
+        # A parent read incrementally only has the records since its state, which is specific to this substream
+        if (
+            self.parent_record_cache is None
+            or parent_stream_config.cache_key is None
+            or parent_stream_config.incremental_dependency
+        ):
+            return self._extract_parent_partitions(parent_stream_config)
+        return self.parent_record_cache.read_through(
+            parent_stream_config.cache_key,
+            lambda: self._extract_parent_partitions(parent_stream_config),
+        )
+
+    def _extract_parent_partitions(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[ParentPartition]:
+        parent_stream = parent_stream_config.stream
+        parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+        extra_fields = None
+        if parent_stream_config.extra_fields:
+            extra_fields = [
+                [field_path_part.eval(self.config) for field_path_part in field_path]
+                for field_path in parent_stream_config.extra_fields
+            ]  # type: ignore # extra_fields is always casted to an interpolated string
+
+        for parent_record in self._read_parent_records(parent_stream_config):
+            parent_partition = None
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                self.logger.warning(
+                    f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+                )
+                if parent_record.type == MessageType.RECORD:
+                    parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
+                else:
+                    continue
+            elif isinstance(parent_record, Record):
+                parent_partition = (
+                    parent_record.associated_slice.partition
+                    if parent_record.associated_slice
+                    else {}
+                )
+                parent_record = parent_record.data
+            elif not isinstance(parent_record, Mapping):
+                # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+                raise AirbyteTracedException(
+                    message=f"Parent stream returned records as invalid type {type(parent_record)}"
+                )
+            try:
+                partition_value = dpath.get(parent_record, parent_field)
+            except KeyError:
+                continue
+
+            # Add extra fields
+            extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
+
+            yield partition_value, parent_partition or {}, extracted_extra_fields
+
+    def _read_parent_records(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[StreamData]:
+        if (
+            self.parent_stream_concurrency_level <= 1
+            or parent_stream_config.stream_factory is None
+            or parent_stream_config.incremental_dependency
+        ):
+            # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
+            # not support either substreams or RFR, but something that needs to be considered once we do
+            return parent_stream_config.stream.read_only_records()
+        return ConcurrentParentReader(self.parent_stream_concurrency_level).read(
+            self._parent_slice_readers(parent_stream_config)
+        )
+
+    def _parent_slice_readers(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[Callable[[], Iterable[StreamData]]]:
+        # Each thread reads with its own instance of the parent stream as the pagination of a stream is not thread-safe. There are as many
+        # instances as threads so an instance is always available when a slice starts being read
+        stream_factory: Callable[[], "DeclarativeStream"] = parent_stream_config.stream_factory  # type: ignore # only called with a stream factory
+        idle_streams: SimpleQueue["DeclarativeStream"] = SimpleQueue()
+        parent_slices = parent_stream_config.stream.stream_slices(sync_mode=SyncMode.full_refresh)
+        for index, parent_slice in enumerate(parent_slices):
+            if index < self.parent_stream_concurrency_level:
+                idle_streams.put(stream_factory())
+            yield partial(self._read_parent_slice, idle_streams, parent_slice)
+
+    @staticmethod
+    def _read_parent_slice(
+        idle_streams: "SimpleQueue[DeclarativeStream]", parent_slice: Optional[StreamSlice]
+    ) -> Iterable[StreamData]:
+        parent_stream = idle_streams.get()
+        try:
+            yield from parent_stream.read_records(
+                sync_mode=SyncMode.full_refresh, stream_slice=parent_slice
+            )
+        finally:
+            idle_streams.put(parent_stream)
 
     def _extract_extra_fields(
         self,
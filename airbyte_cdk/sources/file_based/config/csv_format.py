@@ -16,6 +16,11 @@ class InferenceType(Enum):
     PRIMITIVE_TYPES_ONLY = "Primitive Types Only"
 
 
+class CsvEngine(Enum):
+    PYTHON = "Python"
+    ARROW = "Arrow"
+
+
 class CsvHeaderDefinitionType(Enum):
     FROM_CSV = "From CSV"
     AUTOGENERATED = "Autogenerated"
@@ -161,6 +166,12 @@ class CsvFormat(BaseModel):
         default=False,
         description="Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
     )
+    engine: CsvEngine = Field(
+        title="Engine",
+        default=CsvEngine.PYTHON,
+        description="The engine used to read the records. `Arrow` reads and casts the values in batches, which is faster for large files. It falls back to `Python` if errors on field mismatch are ignored.",
+        airbyte_hidden=True,
+    )
 
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
@@ -21,6 +21,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
 from airbyte_cdk.sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
+from airbyte_cdk.sources.concurrent_source.worker_process_pool import WorkerProcessPool
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
@@ -43,6 +44,7 @@ from airbyte_cdk.sources.file_based.exceptions import (
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types import default_parsers
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.schema_validation_policies import (
     DEFAULT_SCHEMA_VALIDATION_POLICIES,
     AbstractSchemaValidationPolicy,
@@ -70,6 +72,18 @@ INITIAL_N_PARTITIONS = MAX_CONCURRENCY // 2
 class FileBasedSource(ConcurrentSourceAdapter, ABC):
     # We make each source override the concurrency level to give control over when they are upgraded.
     _concurrency_level = None
+    # Sources with CPU-bound parsers can set the number of worker processes used to parse files. Files are parsed in the threads of the
+    # concurrent source otherwise.
+    _parse_process_count: Optional[int] = None
+    # Sources can have their parsers only read the fields of the configured catalog schema. As the catalog doesn't tell apart the fields
+    # that were not selected from the ones that were not discovered, columns added to the files after the last discover are not read.
+    _project_selected_fields = False
+    # Sources can have the files bigger than this number of bytes split into ranges that are read concurrently when the parser supports
+    # it. The cursor only considers a file synced once all its ranges are read.
+    _file_range_size: Optional[int] = None
+    # Sources can keep the schemas inferred from each file in this local file so that discovers and reads without a user schema only
+    # open the files that were added or modified since the schemas were inferred.
+    _schema_inference_cache_path: Optional[str] = None
 
     def __init__(
         self,
@@ -106,6 +120,14 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
         self.logger = init_logger(f"airbyte.{self.name}")
         self.errors_collector: FileBasedErrorsCollector = FileBasedErrorsCollector()
         self._message_repository: Optional[MessageRepository] = None
+        self._process_pool = (
+            WorkerProcessPool(self._parse_process_count) if self._parse_process_count else None
+        )
+        self._schema_inference_cache = (
+            SchemaInferenceCache(self._schema_inference_cache_path)
+            if self._schema_inference_cache_path
+            else None
+        )
         concurrent_source = ConcurrentSource.create(
             MAX_CONCURRENCY,
             INITIAL_N_PARTITIONS,
@@ -310,6 +332,10 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
             errors_collector=self.errors_collector,
             cursor=cursor,
             use_file_transfer=use_file_transfer,
+            process_pool=self._process_pool,
+            project_selected_fields=self._project_selected_fields,
+            file_range_size=self._file_range_size,
+            schema_inference_cache=self._schema_inference_cache,
         )
 
     def _get_stream_from_catalog(
@@ -336,7 +362,11 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
         catalog: ConfiguredAirbyteCatalog,
         state: Optional[List[AirbyteStateMessage]] = None,
     ) -> Iterator[AirbyteMessage]:
-        yield from super().read(logger, config, catalog, state)
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
         # emit all the errors collected
         yield from self.errors_collector.yield_and_raise_collected()
         # count streams using a certain parser
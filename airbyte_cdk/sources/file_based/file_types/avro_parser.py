@@ -3,7 +3,7 @@
 #
 
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple
 
 import fastavro
 from airbyte_cdk.sources.file_based.config.avro_format import AvroFormat
@@ -13,7 +13,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 
@@ -171,6 +171,8 @@ class AvroParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         avro_format = config.format or AvroFormat(filetype="avro")
         if not isinstance(avro_format, AvroFormat):
@@ -181,8 +183,12 @@ class AvroParser(FileTypeParser):
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 avro_reader = fastavro.reader(fp)
                 schema = avro_reader.writer_schema
+                # fastavro decodes every field, but the fields that are not selected are not converted. Skipping them with a projected
+                # reader schema is slower as fastavro then resolves each record against the writer schema
                 schema_field_name_to_type = {
-                    field["name"]: field["type"] for field in schema["fields"]
+                    field["name"]: field["type"]
+                    for field in schema["fields"]
+                    if selected_fields is None or field["name"] in selected_fields
                 }
                 for record in avro_reader:
                     line_no += 1
@@ -9,11 +9,28 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import partial
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
+from itertools import islice, repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 from uuid import uuid4
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import (
+    CsvEngine,
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
@@ -25,7 +42,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, SchemaType
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -42,24 +59,16 @@ class _CsvReader:
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         file_read_mode: FileReadMode,
+        selected_fields: Optional[Set[str]] = None,
     ) -> Generator[Dict[str, Any], None, None]:
+        """
+        :param selected_fields: if set, the rows only have the values of these columns. The values of the other columns are not copied
+        into the rows
+        """
         config_format = _extract_format(config)
         lineno = 0
 
-        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
-        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
-        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
-        # registering it.
-        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        dialect_name = self._register_dialect(config, config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
             try:
                 headers = self._get_headers(fp, config_format, dialect_name)
@@ -76,40 +85,97 @@ class _CsvReader:
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
-            reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
             try:
-                for row in reader:
-                    lineno += 1
-
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row:
-                        if config_format.ignore_errors_on_fields_mismatch:
-                            logger.error(
-                                f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with missing column."
-                            )
-                        else:
-                            raise RecordParseError(
-                                FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
-                                filename=file.uri,
-                                lineno=lineno,
-                            )
-                    if None in row.values():
-                        if config_format.ignore_errors_on_fields_mismatch:
-                            logger.error(
-                                f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with extra column."
-                            )
-                        else:
-                            raise RecordParseError(
-                                FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS,
-                                filename=file.uri,
-                                lineno=lineno,
-                            )
-                    yield row
+                if selected_fields is None:
+                    reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
+                    for row in reader:
+                        lineno += 1
+
+                        # The row was not properly parsed if any of the values are None. This will most likely occur if there are more
+                        # columns than headers or more headers dans columns
+                        self._check_number_of_values(
+                            None in row, None in row.values(), config_format, file, lineno, logger
+                        )
+                        yield row
+                else:
+                    # The last column with a given name is the one kept, the same way csv.DictReader does. Headers are stripped in the
+                    # inferred schemas so they are stripped to be matched with the selected fields
+                    selected_columns = {
+                        header: index
+                        for index, header in enumerate(headers)
+                        if header.strip() in selected_fields
+                    }
+                    for values in csv.reader(fp, dialect=dialect_name):  # type: ignore
+                        if not values:
+                            # csv.DictReader skips empty lines
+                            continue
+                        lineno += 1
+                        self._check_number_of_values(
+                            len(values) > len(headers),
+                            len(values) < len(headers),
+                            config_format,
+                            file,
+                            lineno,
+                            logger,
+                        )
+                        yield {
+                            header: values[index] if index < len(values) else None
+                            for header, index in selected_columns.items()
+                        }
             finally:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    @staticmethod
+    def _register_dialect(config: FileBasedStreamConfig, config_format: CsvFormat) -> str:
+        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
+        # We don't unregister the dialect because we are lazily parsing each csv file to generate records
+        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
+        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
+        # registering it.
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        return dialect_name
+
+    @staticmethod
+    def _check_number_of_values(
+        has_more_values_than_headers: bool,
+        has_less_values_than_headers: bool,
+        config_format: CsvFormat,
+        file: RemoteFile,
+        lineno: int,
+        logger: logging.Logger,
+    ) -> None:
+        if has_more_values_than_headers:
+            if config_format.ignore_errors_on_fields_mismatch:
+                logger.error(
+                    f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with missing column."
+                )
+            else:
+                raise RecordParseError(
+                    FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
+                    filename=file.uri,
+                    lineno=lineno,
+                )
+        if has_less_values_than_headers:
+            if config_format.ignore_errors_on_fields_mismatch:
+                logger.error(
+                    f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with extra column."
+                )
+            else:
+                raise RecordParseError(
+                    FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS,
+                    filename=file.uri,
+                    lineno=lineno,
+                )
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -150,6 +216,176 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader(_CsvReader):
+    """
+    Reads the values of CSV files in batches with Arrow's CSV reader. The values are read as strings, the same as `_CsvReader` does, so
+    that they are cast the same way. The headers are read by `_CsvReader` so that they are the same with both readers.
+    """
+
+    @staticmethod
+    def supports(config_format: CsvFormat) -> bool:
+        # Rows with more or less values than headers are emitted when the mismatch is ignored but Arrow can't put them in a batch
+        return not config_format.ignore_errors_on_fields_mismatch
+
+    def read_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        selected_fields: Optional[Set[str]] = None,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        :param selected_fields: if set, the batches only have the columns of these fields
+        :return: batches of string columns named after the headers. If a header is duplicated, the last column with this name is kept in
+        place of the first one the same way csv.DictReader does
+        """
+        config_format = _extract_format(config)
+        headers = self._read_headers(config, config_format, file, stream_reader, logger)
+        column_index_by_header = {header: index for index, header in enumerate(headers)}
+        if selected_fields is not None:
+            # Headers are stripped in the inferred schemas so they are stripped to be matched with the selected fields
+            column_index_by_header = {
+                header: index
+                for header, index in column_index_by_header.items()
+                if header.strip() in selected_fields
+            }
+        # Arrow would read every column if no column was included and can't tell duplicated columns apart
+        indices_to_select = (
+            list(column_index_by_header.values())
+            if not column_index_by_header or len(set(headers)) < len(headers)
+            else None
+        )
+
+        invalid_rows: List[pa_csv.InvalidRow] = []
+
+        def _on_invalid_row(row: pa_csv.InvalidRow) -> str:
+            invalid_rows.append(row)
+            return "error"
+
+        rows_to_skip = (
+            config_format.skip_rows_before_header
+            + (1 if config_format.header_definition.has_header_row() else 0)
+            + config_format.skip_rows_after_header
+        )
+        read_options = pa_csv.ReadOptions(
+            column_names=headers, skip_rows=rows_to_skip, encoding=config_format.encoding or "utf8"
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=config_format.delimiter,
+            quote_char=config_format.quote_char,
+            double_quote=config_format.double_quote,
+            escape_char=config_format.escape_char or False,
+            newlines_in_values=True,
+            invalid_row_handler=_on_invalid_row,
+        )
+        convert_options = pa_csv.ConvertOptions(
+            column_types={header: pa.string() for header in headers},
+            null_values=[],
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+            include_columns=list(column_index_by_header) if indices_to_select is None else [],
+        )
+        rows_read = 0
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            try:
+                for batch in pa_csv.open_csv(fp, read_options, parse_options, convert_options):
+                    rows_read += batch.num_rows
+                    yield batch if indices_to_select is None else batch.select(indices_to_select)
+            except pa.ArrowInvalid:
+                if invalid_rows:
+                    # Arrow fails on the whole block of the invalid row so the rows of the block before the invalid row are read by
+                    # _CsvReader which raises the same error as the Python engine once it reaches the invalid row
+                    yield from self._read_rows_after(
+                        rows_read,
+                        list(column_index_by_header),
+                        config,
+                        file,
+                        stream_reader,
+                        logger,
+                        selected_fields,
+                    )
+                    row = invalid_rows[0]
+                    # The row number is the same as the line number counted by _CsvReader: it includes the skipped rows
+                    self._check_number_of_values(
+                        row.actual_columns > row.expected_columns,
+                        row.actual_columns < row.expected_columns,
+                        config_format,
+                        file,
+                        row.number,
+                        logger,
+                    )
+                # Arrow fails on files without anything after the skipped rows while they simply have no rows for _CsvReader
+                if not self._has_data_after_skipped_rows(
+                    config_format, rows_to_skip, file, stream_reader, logger
+                ):
+                    return
+                raise
+
+    def _read_rows_after(
+        self,
+        rows_read: int,
+        column_names: List[str],
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        selected_fields: Optional[Set[str]],
+    ) -> Generator[pa.RecordBatch, None, None]:
+        rows: List[Dict[str, Any]] = []
+        schema = pa.schema([(column_name, pa.string()) for column_name in column_names])
+        try:
+            for row in islice(
+                self.read_data(
+                    config, file, stream_reader, logger, FileReadMode.READ, selected_fields
+                ),
+                rows_read,
+                None,
+            ):
+                rows.append(row)
+        except RecordParseError:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            raise
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+    def _has_data_after_skipped_rows(
+        self,
+        config_format: CsvFormat,
+        rows_to_skip: int,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> bool:
+        with stream_reader.open_file(file, FileReadMode.READ, config_format.encoding, logger) as fp:
+            self._skip_rows(fp, rows_to_skip)
+            return bool(fp.read(1))
+
+    def _read_headers(
+        self,
+        config: FileBasedStreamConfig,
+        config_format: CsvFormat,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> List[str]:
+        if isinstance(config_format.header_definition, CsvHeaderUserProvided):
+            return config_format.header_definition.column_names  # type: ignore  # should be CsvHeaderUserProvided given the type
+
+        dialect_name = self._register_dialect(config, config_format)
+        try:
+            with stream_reader.open_file(
+                file, FileReadMode.READ, config_format.encoding, logger
+            ) as fp:
+                try:
+                    return self._get_headers(fp, config_format, dialect_name)
+                except UnicodeError:
+                    raise AirbyteTracedException(
+                        message=f"{FileBasedSourceError.ENCODING_ERROR.value} Expected encoding: {config_format.encoding}",
+                    )
+        finally:
+            csv.unregister_dialect(dialect_name)
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
@@ -159,6 +395,7 @@ class CsvParser(FileTypeParser):
         # skipping data on load. https://stackoverflow.com/questions/15063936/csv-error-field-larger-than-field-limit-131072
         csv.field_size_limit(csv_field_max_bytes)
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._arrow_csv_reader = _ArrowCsvReader()
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -221,6 +458,8 @@ class CsvParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         line_no = 0
         try:
@@ -232,20 +471,32 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
-            cast_fn = CsvParser._get_cast_function(
-                deduped_property_types, config_format, logger, config.schemaless
-            )
-            data_generator = self._csv_reader.read_data(
-                config, file, stream_reader, logger, self.file_read_mode
-            )
-            for row in data_generator:
-                line_no += 1
-                yield CsvParser._to_nullable(
-                    cast_fn(row),
-                    deduped_property_types,
-                    config_format.null_values,
-                    config_format.strings_can_be_null,
+            if config_format.engine == CsvEngine.ARROW and _ArrowCsvReader.supports(config_format):
+                data_generator = self._arrow_csv_reader.read_batches(
+                    config, file, stream_reader, logger, selected_fields
                 )
+                rows = CsvParser._cast_batches(
+                    data_generator, deduped_property_types, config_format, logger, config.schemaless
+                )
+            else:
+                cast_fn = CsvParser._get_cast_function(
+                    deduped_property_types, config_format, logger, config.schemaless
+                )
+                data_generator = self._csv_reader.read_data(
+                    config, file, stream_reader, logger, self.file_read_mode, selected_fields
+                )
+                rows = (
+                    CsvParser._to_nullable(
+                        cast_fn(row),
+                        deduped_property_types,
+                        config_format.null_values,
+                        config_format.strings_can_be_null,
+                    )
+                    for row in data_generator
+                )
+            for row in rows:
+                line_no += 1
+                yield row
         except RecordParseError as parse_err:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no
@@ -276,6 +527,59 @@ class CsvParser(FileTypeParser):
             # If no schema is provided, yield the rows as they are
             return _no_cast
 
+    @staticmethod
+    def _cast_batches(
+        batches: Iterable[pa.RecordBatch],
+        deduped_property_types: Mapping[str, str],
+        config_format: CsvFormat,
+        logger: logging.Logger,
+        schemaless: bool,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Build the rows of batches of string columns. The rows are the same as if the rows of strings were cast with the function from
+        `_get_cast_function` then passed to `_to_nullable` but the values are cast column by column.
+        """
+        cast_values = bool(deduped_property_types) and not schemaless
+        for batch in batches:
+            keys: List[str] = []
+            columns: List[List[Any]] = []
+            warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+            for key, values in zip(batch.schema.names, batch.columns):
+                prop_type = deduped_property_types.get(key)
+                if not cast_values:
+                    column = _to_strings(values)
+                elif prop_type in TYPE_PYTHON_MAPPING:
+                    column, failed_indices = _cast_column(values, prop_type, config_format)  # type: ignore  # prop_type is a key of TYPE_PYTHON_MAPPING
+                    for index in failed_indices:
+                        warnings_by_row[index].append(
+                            _format_warning(key, column[index], prop_type)
+                        )
+                else:
+                    # Only the columns of the schema are kept when values are cast
+                    continue
+                if config_format.null_values:
+                    column = [
+                        None
+                        if CsvParser._value_is_none(
+                            value,
+                            prop_type,
+                            config_format.null_values,
+                            config_format.strings_can_be_null,
+                        )
+                        else value
+                        for value in column
+                    ]
+                keys.append(key)
+                columns.append(column)
+
+            rows_values = zip(*columns) if columns else repeat((), batch.num_rows)
+            for index, row_values in enumerate(rows_values):
+                if index in warnings_by_row:
+                    logger.warning(
+                        f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[index])}",
+                    )
+                yield dict(zip(keys, row_values))
+
     @staticmethod
     def _to_nullable(
         row: Mapping[str, str],
@@ -511,6 +815,99 @@ def _value_to_python_type(value: str, python_type: type) -> Any:
     return python_type(value)
 
 
+def _value_to_none(value: str) -> None:
+    if value != "":
+        raise ValueError(f"Value {value} is not a valid null value")
+
+
+# Values matching these patterns are parsed by Arrow into the same numbers as Python's int() and float(). Python also accepts other
+# values (whitespaces, underscores, infinity, integers that don't fit in 64 bits...) so the values not matching are cast with Python
+_ARROW_NUMBER_CAST_BY_PYTHON_TYPE: Mapping[Type[Any], Tuple[pa.DataType, str]] = {
+    int: (pa.int64(), r"^-?[0-9]{1,18}$"),
+    float: (
+        pa.float64(),
+        r"^-?(?:[0-9]{1,15}(?:\.[0-9]{0,15})?|\.[0-9]{1,15})(?:[eE][-+]?[0-9]{1,2})?$",
+    ),
+}
+
+
+def _cast_column(
+    values: pa.Array, prop_type: str, config_format: CsvFormat
+) -> Tuple[List[Any], List[int]]:
+    """
+    Cast a column of strings the same way `CsvParser._cast_types` casts each value. The values that can't be cast are kept as strings.
+
+    :return: the cast values and the indices of the values that could not be cast
+    """
+    _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+    if python_type in _ARROW_NUMBER_CAST_BY_PYTHON_TYPE:
+        return _cast_numbers(values, python_type)  # type: ignore  # python_type is a key of _ARROW_NUMBER_CAST_BY_PYTHON_TYPE
+    if python_type is bool:
+        return _cast_booleans(values, config_format.true_values, config_format.false_values)
+    strings = _to_strings(values)
+    if python_type is None:
+        return _cast_strings(strings, _value_to_none, (ValueError,))
+    if python_type is dict:
+        return _cast_strings(strings, orjson.loads, (orjson.JSONDecodeError,))
+    if python_type is list:
+        return _cast_strings(strings, _value_to_list, (ValueError, json.JSONDecodeError))
+    if python_type is str:
+        return strings, []
+    return _cast_strings(
+        strings, partial(_value_to_python_type, python_type=python_type), (ValueError,)
+    )
+
+
+def _cast_numbers(values: pa.Array, python_type: Type[Any]) -> Tuple[List[Any], List[int]]:
+    arrow_type, pattern = _ARROW_NUMBER_CAST_BY_PYTHON_TYPE[python_type]
+    castable = pc.match_substring_regex(values, pattern)
+    if pc.all(castable).as_py():
+        return pc.cast(values, arrow_type).to_numpy().tolist(), []
+
+    cast_values = pc.cast(pc.if_else(castable, values, "0"), arrow_type).to_numpy().tolist()
+    failed_indices = []
+    for index in pc.indices_nonzero(pc.invert(castable)).to_pylist():
+        value = values[index].as_py()
+        try:
+            cast_values[index] = _value_to_python_type(value, python_type)
+        except ValueError:
+            cast_values[index] = value
+            failed_indices.append(index)
+    return cast_values, failed_indices
+
+
+def _cast_booleans(
+    values: pa.Array, true_values: Set[str], false_values: Set[str]
+) -> Tuple[List[Any], List[int]]:
+    # Values that are both true and false values are true, the same as with _value_to_bool
+    is_true = pc.is_in(values, value_set=pa.array(list(true_values), type=pa.string()))
+    is_false = pc.is_in(values, value_set=pa.array(list(false_values), type=pa.string()))
+    cast_values = is_true.to_numpy(zero_copy_only=False).tolist()
+    failed_indices = pc.indices_nonzero(pc.invert(pc.or_(is_true, is_false))).to_pylist()
+    for index in failed_indices:
+        cast_values[index] = values[index].as_py()
+    return cast_values, failed_indices
+
+
+def _cast_strings(
+    strings: List[str], cast: Callable[[str], Any], errors: Tuple[Type[Exception], ...]
+) -> Tuple[List[Any], List[int]]:
+    cast_values: List[Any] = []
+    failed_indices = []
+    for index, value in enumerate(strings):
+        try:
+            cast_values.append(cast(value))
+        except errors:
+            cast_values.append(value)
+            failed_indices.append(index)
+    return cast_values, failed_indices
+
+
+def _to_strings(values: pa.Array) -> List[str]:
+    # The columns are read as strings that can't be null. Converting through numpy is faster than Array.to_pylist
+    return values.to_numpy(zero_copy_only=False).tolist()  # type: ignore  # the values are strings
+
+
 def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
@@ -5,7 +5,7 @@
 import logging
 from io import IOBase
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, Union
 
 import pandas as pd
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
@@ -21,7 +21,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 from numpy import datetime64
@@ -89,6 +89,8 @@ class ExcelParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]] = None,
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         """
         Parses records from an Excel file based on the provided configuration.
@@ -99,6 +101,7 @@ class ExcelParser(FileTypeParser):
             stream_reader (AbstractFileBasedStreamReader): Reader to read the file.
             logger (logging.Logger): Logger for logging information and errors.
             discovered_schema (Optional[Mapping[str, SchemaType]]): Discovered schema for validation.
+            selected_fields (Optional[Set[str]]): Not used, every column is read.
 
         Yields:
             Iterable[Dict[str, Any]]: Parsed records from the Excel file.
@@ -4,7 +4,8 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.file_based_stream_reader import (
@@ -17,6 +18,17 @@ from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 Record = Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class FileRange:
+    """
+    A part of a file that can be parsed independently of the rest of the file. The parser that split the file defines what `start`
+    (inclusive) and `end` (exclusive) are, for example bytes or row groups.
+    """
+
+    start: int
+    end: int
+
+
 class FileTypeParser(ABC):
     """
     An abstract class containing methods that must be implemented for each
@@ -71,12 +83,36 @@ class FileTypeParser(ABC):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Record]:
         """
         Parse and emit each record.
+
+        If `selected_fields` is set, records only need to have these fields. Parsers that can skip the other fields while reading the file
+        should do so while the others can emit every field.
+
+        If `file_range` is set, only the records of this range are emitted. It is only set to one of the ranges returned by
+        `get_file_ranges`.
         """
         ...
 
+    def get_file_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        range_size: int,
+    ) -> Optional[List[FileRange]]:
+        """
+        Split the file into ranges whose records can be parsed concurrently. Return None if the file is not split, in which case it is
+        parsed at once.
+
+        :param range_size: The approximate number of bytes of each range
+        """
+        return None
+
     @property
     @abstractmethod
     def file_read_mode(self) -> FileReadMode:
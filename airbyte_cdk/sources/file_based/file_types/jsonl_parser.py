@@ -4,7 +4,7 @@
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
@@ -12,7 +12,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import (
     PYTHON_TYPE_MAPPING,
@@ -58,6 +58,8 @@ class JsonlParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         """
         This code supports parsing json objects over multiple lines even though this does not align with the JSONL format. This is for
@@ -68,8 +70,34 @@ class JsonlParser(FileTypeParser):
 
         The goal is to run the V4 of source-s3 in production, track the warning log emitted when there are multiline json objects and
         deprecate this feature if it's not a valid use case.
+
+        Json objects over multiple lines are not supported when a range of the file is parsed.
+        """
+        if file_range is not None:
+            yield from self._parse_jsonl_range(file, stream_reader, logger, file_range)
+        else:
+            yield from self._parse_jsonl_entries(file, stream_reader, logger)
+
+    def get_file_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        range_size: int,
+    ) -> Optional[List[FileRange]]:
+        """
+        Split the file into ranges of bytes. The records of a range are the ones on the lines starting in the range so the file needs to
+        have one record per line.
         """
-        yield from self._parse_jsonl_entries(file, stream_reader, logger)
+        # The size is 0 if the stream reader doesn't know it
+        file_size = stream_reader.file_size(file)
+        if file_size <= range_size:
+            return None
+        return [
+            FileRange(start, min(start + range_size, file_size))
+            for start in range(0, file_size, range_size)
+        ]
 
     @classmethod
     def _infer_schema_for_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
@@ -136,6 +164,36 @@ class JsonlParser(FileTypeParser):
                     FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line
                 )
 
+    def _parse_jsonl_range(
+        self,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_range: FileRange,
+    ) -> Iterable[Dict[str, Any]]:
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            position = file_range.start
+            if position > 0:
+                # The line that is being read at the start of the range belongs to the previous range
+                fp.seek(position - 1)
+                position += len(fp.readline()) - 1
+            while position < file_range.end:
+                line = fp.readline()
+                if not line:
+                    break
+                line_start = position
+                position += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError as exc:
+                    raise RecordParseError(
+                        FileBasedSourceError.ERROR_PARSING_RECORD,
+                        filename=file.uri,
+                        byte_offset=line_start,
+                    ) from exc
+
     @staticmethod
     def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
         if isinstance(line, bytes):
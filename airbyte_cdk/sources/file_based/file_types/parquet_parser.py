@@ -5,7 +5,8 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -23,7 +24,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 from pyarrow import DictionaryArray, Scalar
@@ -31,6 +32,14 @@ from pyarrow import DictionaryArray, Scalar
 
 class ParquetParser(FileTypeParser):
     ENCODING = None
+    DEFAULT_BATCH_SIZE = 64 * 1024
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        :param batch_size: The maximum number of rows read and converted at once. Row groups larger than that are read in many batches so
+        that memory doesn't grow with the size of the row groups
+        """
+        self._batch_size = batch_size
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -74,6 +83,8 @@ class ParquetParser(FileTypeParser):
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         discovered_schema: Optional[Mapping[str, SchemaType]],
+        selected_fields: Optional[Set[str]] = None,
+        file_range: Optional[FileRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         parquet_format = config.format
         if not isinstance(parquet_format, ParquetFormat):
@@ -87,19 +98,38 @@ class ParquetParser(FileTypeParser):
                 partition_columns = {
                     x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)
                 }
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
-                        line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(
-                                    batch.column(column)[row], parquet_format
-                                )
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                columns_to_read = None
+                if selected_fields is not None:
+                    # The columns that are not selected are not read from the file
+                    columns_to_read = [
+                        name for name in reader.schema_arrow.names if name in selected_fields
+                    ]
+                    partition_columns = {
+                        name: value
+                        for name, value in partition_columns.items()
+                        if name in selected_fields
+                    }
+                row_groups = (
+                    range(reader.num_row_groups)
+                    if file_range is None
+                    else range(file_range.start, file_range.end)
+                )
+                for row_group in row_groups:
+                    for batch in reader.iter_batches(
+                        batch_size=self._batch_size, row_groups=[row_group], columns=columns_to_read
+                    ):
+                        # Values are converted a column at a time, which is much faster than converting each value
+                        columns = [
+                            ParquetParser._to_output_values(column, parquet_format)
+                            for column in batch.columns
+                        ]
+                        rows = zip(*columns) if columns else repeat((), batch.num_rows)
+                        for values in rows:
+                            line_no += 1
+                            yield {
+                                **dict(zip(batch.schema.names, values)),
+                                **partition_columns,
+                            }
         except Exception as exc:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD,
@@ -107,6 +137,38 @@ class ParquetParser(FileTypeParser):
                 lineno=f"{row_group=}, {line_no=}",
             ) from exc
 
+    def get_file_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        range_size: int,
+    ) -> Optional[List[FileRange]]:
+        """
+        Split the file into ranges of row groups. A row group is never split so files with a single row group are not split.
+        """
+        # The size is 0 if the stream reader doesn't know it
+        if stream_reader.file_size(file) <= range_size:
+            return None
+        with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
+            metadata = pq.ParquetFile(fp).metadata
+
+        ranges = []
+        start = size = 0
+        for row_group in range(metadata.num_row_groups):
+            row_group_metadata = metadata.row_group(row_group)
+            size += sum(
+                row_group_metadata.column(column).total_compressed_size
+                for column in range(row_group_metadata.num_columns)
+            )
+            if size >= range_size:
+                ranges.append(FileRange(start, row_group + 1))
+                start, size = row_group + 1, 0
+        if start < metadata.num_row_groups:
+            ranges.append(FileRange(start, metadata.num_row_groups))
+        return ranges if len(ranges) > 1 else None
+
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
         return [unquote(partition) for partition in filepath.split(os.sep) if "=" in partition]
@@ -127,58 +189,114 @@ class ParquetParser(FileTypeParser):
         else:
             return ParquetParser._scalar_to_python_value(parquet_value, parquet_format)
 
+    @staticmethod
+    def _to_output_values(parquet_values: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a column of a record batch to the values that can be output by the source. The values are the same as if each of them was
+        converted with `_to_output_value`.
+        """
+        values = ParquetParser._to_python_values(parquet_values)
+        convert = ParquetParser._python_value_converter(parquet_values.type, parquet_format)
+        if convert is None:
+            return values
+        return [None if value is None else convert(value) for value in values]
+
+    @staticmethod
+    def _to_python_values(parquet_values: pa.Array) -> List[Any]:
+        """
+        Same as `to_pylist` but going through numpy for the types numpy converts to the same python values, which is an order of magnitude
+        faster.
+        """
+        parquet_type = parquet_values.type
+        if (
+            pa.types.is_string(parquet_type)
+            or pa.types.is_large_string(parquet_type)
+            or pa.types.is_boolean(parquet_type)
+            or (
+                # numpy has no null integers nor floats
+                parquet_values.null_count == 0
+                and (
+                    pa.types.is_integer(parquet_type)
+                    or pa.types.is_float32(parquet_type)
+                    or pa.types.is_float64(parquet_type)
+                )
+            )
+        ):
+            return parquet_values.to_numpy(zero_copy_only=False).tolist()  # type: ignore[no-any-return]
+        if pa.types.is_date(parquet_type):
+            return parquet_values.to_numpy(zero_copy_only=False).astype("datetime64[D]").tolist()  # type: ignore[no-any-return]
+        if (
+            pa.types.is_timestamp(parquet_type)
+            and parquet_type.tz is None
+            and parquet_type.unit in ("s", "ms", "us")
+        ):
+            # numpy only converts to datetime objects from microseconds or coarser units
+            return parquet_values.to_numpy(zero_copy_only=False).astype("datetime64[us]").tolist()  # type: ignore[no-any-return]
+        return parquet_values.to_pylist()  # type: ignore[no-any-return]
+
     @staticmethod
     def _scalar_to_python_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        value = parquet_value.as_py()
+        if value is None:
             return None
+        convert = ParquetParser._python_value_converter(parquet_value.type, parquet_format)
+        return value if convert is None else convert(value)
 
+    @staticmethod
+    def _python_value_converter(
+        parquet_type: pa.DataType, parquet_format: ParquetFormat
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the non-null python values of a pyarrow type to the values that can be output by the source or None
+        if the python values are output as is.
+        """
         # Convert date and datetime objects to isoformat strings
         if (
-            pa.types.is_time(parquet_value.type)
-            or pa.types.is_timestamp(parquet_value.type)
-            or pa.types.is_date(parquet_value.type)
+            pa.types.is_time(parquet_type)
+            or pa.types.is_timestamp(parquet_type)
+            or pa.types.is_date(parquet_type)
         ):
-            return parquet_value.as_py().isoformat()
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
+                return float
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            if unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif unit == "ns":
+                return lambda duration: (
+                    duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+                )
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {unit}")
+        return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
+
+logger = logging.getLogger("airbyte")
+
+
+class SchemaInferenceCache:
+    """
+    Schemas inferred from files, persisted in a local JSON file so that files which did not change since the last discover or read don't
+    need to be opened and parsed again.
+
+    An entry is kept per file and format: a file modified since its schema was inferred replaces its entry instead of adding one, so the
+    cache grows with the number of files rather than with the number of syncs. Entries are only used if the file's last modified date is
+    the one the schema was inferred from.
+    """
+
+    # Bumped when the inferred schemas could change for the same file and format so that previously cached schemas are not used
+    VERSION = 1
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The path of the JSON file. It is created when the cache is saved if it does not exist
+        """
+        self._path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+        self._saved_seconds = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def saved_seconds(self) -> float:
+        """
+        :return: The time it took to infer the schemas that were read from the cache instead
+        """
+        return self._saved_seconds
+
+    @staticmethod
+    def format_key(parser: Any, format: Any) -> str:
+        """
+        :return: A key identifying the parser and its format configuration: files read with another parser or format have other entries
+        """
+        serialized_format = json.dumps(format.dict(), sort_keys=True, default=str)
+        return hashlib.sha256(
+            f"{type(parser).__module__}.{type(parser).__qualname__}:{serialized_format}".encode()
+        ).hexdigest()
+
+    def get(self, file: RemoteFile, format_key: str) -> Optional[SchemaType]:
+        with self._lock:
+            entry = self._get_entries().get(self._key(file, format_key))
+            if entry is None or entry["last_modified"] != file.last_modified.isoformat():
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._saved_seconds += entry["inference_seconds"]
+            return entry["schema"]  # type: ignore[no-any-return]  # entries are only written by `set`
+
+    def set(
+        self, file: RemoteFile, format_key: str, schema: SchemaType, inference_seconds: float
+    ) -> None:
+        with self._lock:
+            self._get_entries()[self._key(file, format_key)] = {
+                "last_modified": file.last_modified.isoformat(),
+                "schema": schema,
+                "inference_seconds": inference_seconds,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the cache if entries were added. The file is replaced at once so that a sync interrupted while saving doesn't leave a
+        truncated cache.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self._path))
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w") as temporary_file:
+                    json.dump({"version": self.VERSION, "entries": self._entries}, temporary_file)
+                os.replace(temporary_path, self._path)
+            except BaseException:
+                os.remove(temporary_path)
+                raise
+            self._dirty = False
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path) as cache_file:
+                content = json.load(cache_file)
+        except (OSError, ValueError) as exception:
+            logger.warning(
+                f"Could not read the schema inference cache {self._path}, schemas will be inferred again: {exception}"
+            )
+            return {}
+        if not isinstance(content, dict) or content.get("version") != self.VERSION:
+            return {}
+        return content.get("entries", {})  # type: ignore[no-any-return]  # written by `save`
+
+    @staticmethod
+    def _key(file: RemoteFile, format_key: str) -> str:
+        return f"{format_key}:{file.uri}"
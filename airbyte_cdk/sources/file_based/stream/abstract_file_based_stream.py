@@ -23,7 +23,7 @@ from airbyte_cdk.sources.file_based.exceptions import (
     UndefinedParserError,
 )
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
-from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
@@ -132,6 +132,12 @@ class AbstractFileBasedStream(Stream):
         """
         return self.compute_slices()
 
+    def get_file_ranges(self, file: RemoteFile) -> Optional[List[FileRange]]:
+        """
+        Return the ranges of the file that can be read concurrently or None if the file is read at once.
+        """
+        return None
+
     @abstractmethod
     def compute_slices(self) -> Iterable[Optional[StreamSlice]]:
         """
@@ -284,6 +284,8 @@ class FileBasedStreamPartition(Partition):
             len(self._slice["files"]) == 1
         ), f"Expected 1 file per partition but got {len(self._slice['files'])} for stream {self.stream_name()}"
         file = self._slice["files"][0]
+        if self._slice.get("file_range") is not None:
+            return {"files": [file], "file_range": self._slice["file_range"]}
         return {"files": [file]}
 
     def __hash__(self) -> int:
@@ -295,6 +297,8 @@ class FileBasedStreamPartition(Partition):
                 )
             else:
                 s = f"{self._slice['files'][0].last_modified.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}_{self._slice['files'][0].uri}"
+            if self._slice.get("file_range") is not None:
+                return hash((self._stream.name, s, self._slice["file_range"]))
             return hash((self._stream.name, s))
         else:
             return hash(self._stream.name)
@@ -334,15 +338,21 @@ class FileBasedStreamPartitionGenerator(PartitionGenerator):
         ):
             if _slice is not None:
                 for file in _slice.get("files", []):
-                    pending_partitions.append(
-                        FileBasedStreamPartition(
-                            self._stream,
-                            {"files": [copy.deepcopy(file)]},
-                            self._message_repository,
-                            self._sync_mode,
-                            self._cursor_field,
-                            self._state,
+                    # Big files can be split into ranges that are read by different partitions
+                    file_ranges = self._stream.get_file_ranges(file)
+                    for file_range in file_ranges or [None]:
+                        partition_slice: MutableMapping[str, Any] = {"files": [copy.deepcopy(file)]}
+                        if file_range is not None:
+                            partition_slice["file_range"] = file_range
+                        pending_partitions.append(
+                            FileBasedStreamPartition(
+                                self._stream,
+                                partition_slice,
+                                self._message_repository,
+                                self._sync_mode,
+                                self._cursor_field,
+                                self._state,
+                            )
                         )
-                    )
         self._cursor.set_pending_partitions(pending_partitions)
         yield from pending_partitions
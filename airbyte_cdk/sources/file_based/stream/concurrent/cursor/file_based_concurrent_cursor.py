@@ -61,6 +61,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         self._state_lock = RLock()
         self._pending_files_lock = RLock()
         self._pending_files: Optional[Dict[str, RemoteFile]] = None
+        # Files split into ranges are only synced once all of their partitions are read
+        self._pending_partition_count_by_file: Dict[str, int] = {}
         self._file_to_datetime_history = stream_state.get("history", {}) if stream_state else {}
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
@@ -82,15 +84,19 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
     def set_pending_partitions(self, partitions: List["FileBasedStreamPartition"]) -> None:
         with self._pending_files_lock:
             self._pending_files = {}
+            self._pending_partition_count_by_file = {}
             for partition in partitions:
                 _slice = partition.to_slice()
                 if _slice is None:
                     continue
                 for file in _slice["files"]:
-                    if file.uri in self._pending_files.keys():
+                    if file.uri in self._pending_files.keys() and "file_range" not in _slice:
                         raise RuntimeError(
                             f"Already found file {_slice} in pending files. This is unexpected. Please contact Support."
                         )
+                    self._pending_partition_count_by_file[file.uri] = (
+                        self._pending_partition_count_by_file.get(file.uri, 0) + 1
+                    )
                 self._pending_files.update({file.uri: file})
 
     def _compute_prev_sync_cursor(self, value: Optional[StreamState]) -> Tuple[datetime, str]:
@@ -132,7 +138,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def add_file(self, file: RemoteFile) -> None:
         """
-        Add a file to the cursor. This method is called when a file is processed by the stream.
+        Add a file to the cursor. This method is called when a file is processed by the stream. If the file was split into ranges, it
+        is called once per range and the file is only added once all of its ranges are processed.
         :param file: The file to add
         """
         if self._pending_files is None:
@@ -141,6 +148,11 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
             )
         with self._pending_files_lock:
             with self._state_lock:
+                pending_partition_count = self._pending_partition_count_by_file.get(file.uri, 0)
+                if pending_partition_count > 1:
+                    self._pending_partition_count_by_file[file.uri] = pending_partition_count - 1
+                    return
+                self._pending_partition_count_by_file.pop(file.uri, None)
                 if file.uri not in self._pending_files:
                     self._message_repository.emit_message(
                         AirbyteMessage(
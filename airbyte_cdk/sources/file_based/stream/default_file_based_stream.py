@@ -4,13 +4,27 @@
 
 import asyncio
 import itertools
+import pickle
+import time
 import traceback
 from copy import deepcopy
 from functools import cache
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.worker_process_pool import WorkerProcessPool
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import PrimaryKeyType
 from airbyte_cdk.sources.file_based.exceptions import (
     FileBasedSourceError,
@@ -21,6 +35,7 @@ from airbyte_cdk.sources.file_based.exceptions import (
     StopSyncPerValidationPolicy,
 )
 from airbyte_cdk.sources.file_based.file_types import FileTransfer
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange, FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import (
     SchemaType,
@@ -28,6 +43,7 @@ from airbyte_cdk.sources.file_based.schema_helpers import (
     merge_schemas,
     schemaless_schema,
 )
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.types import StreamSlice
@@ -43,6 +59,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     """
 
     FILE_TRANSFER_KW = "use_file_transfer"
+    PROCESS_POOL_KW = "process_pool"
+    PROJECT_SELECTED_FIELDS_KW = "project_selected_fields"
+    FILE_RANGE_SIZE_KW = "file_range_size"
+    SCHEMA_INFERENCE_CACHE_KW = "schema_inference_cache"
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
     ab_last_mod_col = "_ab_source_file_last_modified"
     ab_file_name_col = "_ab_source_file_url"
@@ -50,10 +70,22 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     source_file_url = "source_file_url"
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
     use_file_transfer = False
+    process_pool: Optional[WorkerProcessPool] = None
+    project_selected_fields = False
+    file_range_size: Optional[int] = None
+    schema_inference_cache: Optional[SchemaInferenceCache] = None
 
     def __init__(self, **kwargs: Any):
         if self.FILE_TRANSFER_KW in kwargs:
             self.use_file_transfer = kwargs.pop(self.FILE_TRANSFER_KW, False)
+        if self.PROCESS_POOL_KW in kwargs:
+            self.process_pool = kwargs.pop(self.PROCESS_POOL_KW, None)
+        if self.PROJECT_SELECTED_FIELDS_KW in kwargs:
+            self.project_selected_fields = kwargs.pop(self.PROJECT_SELECTED_FIELDS_KW, False)
+        if self.FILE_RANGE_SIZE_KW in kwargs:
+            self.file_range_size = kwargs.pop(self.FILE_RANGE_SIZE_KW, None)
+        if self.SCHEMA_INFERENCE_CACHE_KW in kwargs:
+            self.schema_inference_cache = kwargs.pop(self.SCHEMA_INFERENCE_CACHE_KW, None)
         super().__init__(**kwargs)
 
     @property
@@ -138,6 +170,8 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
+        # Set if the slice only has a range of its file
+        file_range: Optional[FileRange] = stream_slice.get("file_range")
         for file in stream_slice["files"]:
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
@@ -160,9 +194,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                             self.name, record, is_file_transfer_message=True
                         )
                 else:
-                    for record in parser.parse_records(
-                        self.config, file, self.stream_reader, self.logger, schema
-                    ):
+                    for record in self._parse_records(parser, file, schema, file_range):
                         line_no += 1
                         if self.config.schemaless:
                             record = {"data": record}
@@ -221,6 +253,58 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         ),
                     )
 
+    def _parse_records(
+        self,
+        parser: FileTypeParser,
+        file: RemoteFile,
+        schema: Mapping[str, Any],
+        file_range: Optional[FileRange] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Parse the file in a worker process if a process pool is configured so that CPU-bound parsing is not limited by the GIL. Everything
+        done with the parsed records (validation, transformation, cursor updates) still happens in the calling thread.
+        """
+        args: List[Any] = [self.config, file, self.stream_reader, self.logger, schema]
+        selected_fields = self._get_selected_fields()
+        if selected_fields is not None or file_range is not None:
+            # Only passed when set so that parsers implemented before fields could be selected or files split keep working
+            args.append(selected_fields)
+        if file_range is not None:
+            args.append(file_range)
+        if self.process_pool is not None:
+            try:
+                return self.process_pool.iterate(parser.parse_records, *args)
+            except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                self.logger.warning(
+                    f"Could not send file {file.uri} of stream {self.name} to a worker process, parsing it in the current process: {exc}"
+                )
+        return parser.parse_records(*args)
+
+    def get_file_ranges(self, file: RemoteFile) -> Optional[List[FileRange]]:
+        if self.file_range_size is None or self.use_file_transfer:
+            return None
+        try:
+            return self.get_parser().get_file_ranges(
+                self.config, file, self.stream_reader, self.logger, self.file_range_size
+            )
+        except Exception as exc:
+            self.logger.warning(
+                f"Could not split file {file.uri} of stream {self.name}, reading it at once: {exc}"
+            )
+            return None
+
+    @cache
+    def _get_selected_fields(self) -> Optional[Set[str]]:
+        """
+        Return the fields of the configured catalog schema that parsers need to read or None if all the fields are needed.
+        """
+        if not self.project_selected_fields or self.config.schemaless or not self.catalog_schema:
+            return None
+        properties = self.catalog_schema.get("properties")
+        if not properties:
+            return None
+        return set(properties) - set(self.airbyte_columns)
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -316,6 +400,11 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     def infer_schema(self, files: List[RemoteFile]) -> Mapping[str, Any]:
         loop = asyncio.get_event_loop()
         schema = loop.run_until_complete(self._infer_schema(files))
+        if self.schema_inference_cache is not None:
+            try:
+                self.schema_inference_cache.save()
+            except Exception as exc:
+                self.logger.warning(f"Could not save the schema inference cache: {exc}")
         # as infer schema returns a Mapping that is assumed to be immutable, we need to create a deepcopy to avoid modifying the reference
         return self._fill_nulls(deepcopy(schema))
 
@@ -346,6 +435,9 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         base_schema: SchemaType = {}
         pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
 
+        if self.schema_inference_cache is not None:
+            files, base_schema = self._merge_cached_schemas(files)
+
         n_started, n_files = 0, len(files)
         files_iterator = iter(files)
         while pending_tasks or n_started < n_files:
@@ -372,11 +464,46 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         return base_schema
 
+    def _merge_cached_schemas(self, files: List[RemoteFile]) -> Tuple[List[RemoteFile], SchemaType]:
+        """
+        :return: The files whose schema is not cached and the merged schema of the others
+        """
+        inference_cache = self.schema_inference_cache
+        assert inference_cache is not None
+        hits, saved_seconds = inference_cache.hits, inference_cache.saved_seconds
+        format_key = self._get_schema_inference_format_key()
+        files_to_infer: List[RemoteFile] = []
+        base_schema: SchemaType = {}
+        for file in files:
+            cached_schema = inference_cache.get(file, format_key)
+            if cached_schema is None:
+                files_to_infer.append(file)
+            else:
+                base_schema = merge_schemas(base_schema, cached_schema)
+        self.logger.info(
+            f"Read the schema of {inference_cache.hits - hits} of {len(files)} files of stream {self.name} from the schema inference cache, "
+            f"saving {inference_cache.saved_seconds - saved_seconds:.2f} seconds of inference"
+        )
+        return files_to_infer, base_schema
+
+    @cache
+    def _get_schema_inference_format_key(self) -> str:
+        return SchemaInferenceCache.format_key(self.get_parser(), self.config.format)
+
     async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
         try:
-            return await self.get_parser().infer_schema(
+            start_time = time.monotonic()
+            schema = await self.get_parser().infer_schema(
                 self.config, file, self.stream_reader, self.logger
             )
+            if self.schema_inference_cache is not None:
+                self.schema_inference_cache.set(
+                    file,
+                    self._get_schema_inference_format_key(),
+                    schema,
+                    time.monotonic() - start_time,
+                )
+            return schema
         except AirbyteTracedException as ate:
             raise ate
         except Exception as exc:
@@ -365,6 +365,155 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         #     ts = call_reset_ts.timestamp()
 
 
+@dataclasses.dataclass(frozen=True)
+class CallRatePolicyStats:
+    """Usage of a call rate policy since its first call"""
+
+    calls: int
+    waits: int
+    time_waited: timedelta
+    utilization: float
+
+
+class TokenBucketCallRatePolicy(BaseCallRatePolicy):
+    """
+    Policy allowing calls at a steady rate with bursts of up to {capacity} calls. The bucket is refilled with {rate.limit} tokens per
+    {rate.interval} and each call takes as many tokens as its weight.
+
+    Unlike the other policies, a call that has to wait reserves the next tokens added to the bucket and its thread sleeps until they
+    are: threads get their calls in the order they asked for them and only wake up when their call can be made instead of all retrying
+    when the limit is reset. This is implemented as the generic cell rate algorithm, which only keeps the time at which the bucket is
+    full again.
+    """
+
+    def __init__(self, rate: Rate, matchers: list[RequestMatcher], capacity: Optional[int] = None):
+        """Constructor
+
+        :param rate: the rate at which tokens are added to the bucket
+        :param matchers:
+        :param capacity: the number of tokens the bucket can hold, which is the number of calls that can be made at once. Defaults to
+         the limit of the rate
+        """
+        if rate.limit < 1 or rate.interval <= timedelta(0):
+            raise ValueError(
+                f"The rate must allow at least one call per positive interval. Got {rate}"
+            )
+        capacity = rate.limit if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least 1. Got {capacity}")
+        self._rate = rate
+        self._capacity = capacity
+        self._seconds_per_token = rate.interval.total_seconds() / rate.limit
+        # Time at which the bucket is full again. All the tokens were taken by calls made or reserved before then
+        self._full_at = time.monotonic()
+        self._lock = RLock()
+        self._first_call_at: Optional[float] = None
+        self._calls = 0
+        self._waits = 0
+        self._seconds_waited = 0.0
+        super().__init__(matchers=matchers)
+
+    def try_acquire(self, request: Any, weight: int) -> None:
+        self.reserve(request, weight, max_time_to_wait=timedelta(0))
+
+    def reserve(
+        self, request: Any, weight: int, max_time_to_wait: Optional[timedelta] = None
+    ) -> timedelta:
+        """Reserve the tokens of a call
+
+        :param request:
+        :param weight: number of tokens taken by the call
+        :param max_time_to_wait: if set, nothing is reserved if the call can't be made within this time
+        :return: how long to wait until the call can be made
+        :raises: CallRateLimitHit - when the call can't be made within max_time_to_wait
+        """
+        if weight > self._capacity:
+            raise ValueError("Weight can not exceed the capacity")
+        if not self.matches(request):
+            raise ValueError("Request does not match the policy")
+
+        with self._lock:
+            now = time.monotonic()
+            time_to_wait = self._get_seconds_to_wait(now, weight)
+            if max_time_to_wait is not None and time_to_wait > max_time_to_wait.total_seconds():
+                raise CallRateLimitHit(
+                    error=f"reached maximum rate of {self._rate.limit} calls per {self._rate.interval}, next call in {timedelta(seconds=time_to_wait)}.",
+                    item=request,
+                    weight=weight,
+                    rate=f"{self._rate.limit} per {self._rate.interval}",
+                    time_to_wait=timedelta(seconds=time_to_wait),
+                )
+            self._full_at = max(self._full_at, now) + weight * self._seconds_per_token
+            if self._first_call_at is None:
+                self._first_call_at = now
+            self._calls += weight
+            if time_to_wait > 0:
+                self._waits += 1
+                self._seconds_waited += time_to_wait
+            return timedelta(seconds=time_to_wait)
+
+    def get_time_to_wait(self, weight: int = 1) -> timedelta:
+        """
+        :return: how long a call would have to wait if it was made now. Nothing is reserved so that callers such as schedulers can make
+         other calls in the meantime
+        """
+        with self._lock:
+            return timedelta(seconds=self._get_seconds_to_wait(time.monotonic(), weight))
+
+    def get_stats(self) -> CallRatePolicyStats:
+        """
+        :return: the calls made and the time spent waiting for them. The utilization is the ratio of the calls made to the calls the
+         policy allowed since the first call, 1 being when calls are made exactly at the rate limit
+        """
+        with self._lock:
+            if self._first_call_at is None:
+                return CallRatePolicyStats(
+                    calls=0, waits=0, time_waited=timedelta(0), utilization=0.0
+                )
+            elapsed = max(time.monotonic(), self._first_call_at) - self._first_call_at
+            allowed_calls = self._capacity + elapsed / self._seconds_per_token
+            return CallRatePolicyStats(
+                calls=self._calls,
+                waits=self._waits,
+                time_waited=timedelta(seconds=self._seconds_waited),
+                utilization=min(self._calls / allowed_calls, 1.0),
+            )
+
+    def update(
+        self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]
+    ) -> None:
+        """Update the bucket to have at most the number of calls available according to the API. As for FixedWindowCallRatePolicy, updates
+        with more calls than the bucket has are ignored to support call rate limits that are lower than API limits.
+
+        :param available_calls:
+        :param call_reset_ts: when no calls are available, the time from which calls can be made again
+        """
+        with self._lock:
+            now = time.monotonic()
+            if available_calls is not None:
+                full_at = now + (self._capacity - max(available_calls, 0)) * self._seconds_per_token
+                if full_at > self._full_at:
+                    logger.debug(
+                        "got rate limit update from api, adjusting available calls to %s",
+                        available_calls,
+                    )
+                    self._full_at = full_at
+            if available_calls == 0 and call_reset_ts is not None:
+                reset_in = (call_reset_ts - datetime.datetime.now()).total_seconds()
+                # The next call can be made once the bucket has one token, which is when it is full minus the other tokens
+                full_at = now + reset_in + (self._capacity - 1) * self._seconds_per_token
+                if full_at > self._full_at:
+                    logger.debug(
+                        "got rate limit update from api, next call in %s seconds", reset_in
+                    )
+                    self._full_at = full_at
+
+    def _get_seconds_to_wait(self, now: float, weight: int) -> float:
+        # The call can be made once the bucket has enough tokens to be full after the call's tokens are added back
+        full_after_call_at = max(self._full_at, now) + weight * self._seconds_per_token
+        return max(full_after_call_at - self._capacity * self._seconds_per_token - now, 0.0)
+
+
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
 
@@ -422,6 +571,18 @@ class APIBudget(AbstractAPIBudget):
                 return policy
         return None
 
+    def get_time_to_wait(self, request: Any) -> timedelta:
+        """Tell how long the request would wait for its call if it was made now, without acquiring it, so that callers can do something
+        else in the meantime. Only policies that can tell it in advance are considered.
+
+        :param request:
+        :return: the time to wait, zero if the call could be made now or if the matching policy can't tell it in advance
+        """
+        policy = self.get_matching_policy(request)
+        if isinstance(policy, TokenBucketCallRatePolicy):
+            return policy.get_time_to_wait()
+        return timedelta(0)
+
     def acquire_call(
         self, request: Any, block: bool = True, timeout: Optional[float] = None
     ) -> None:
@@ -459,6 +620,18 @@ class APIBudget(AbstractAPIBudget):
         :param block:
         :param timeout:
         """
+        if block and isinstance(policy, TokenBucketCallRatePolicy):
+            # The call is reserved so that the thread only sleeps once instead of competing with the other threads for the next calls
+            time_to_wait = policy.reserve(
+                request,
+                weight=1,
+                max_time_to_wait=timedelta(seconds=timeout) if timeout is not None else None,
+            )
+            if time_to_wait > timedelta(0):
+                logger.debug("reached call limit, going to sleep for %s", time_to_wait)
+                time.sleep(time_to_wait.total_seconds())
+            return
+
         last_exception = None
         # sometimes we spend all budget before a second attempt, so we have few more here
         for attempt in range(1, self._maximum_attempts_to_acquire):
@@ -3,6 +3,8 @@
 import json
 from typing import Any, Mapping
 
+import orjson
+
 
 class PerPartitionKeySerializer:
     """
@@ -10,13 +12,26 @@ class PerPartitionKeySerializer:
     concern, we wanted to use dictionaries to map `partition -> cursor`. However, partitions are dict and dict can't be used as dict keys
     since they are not hashable. By creating json string using the dict, we can have a use the dict as a key to the dict since strings are
     hashable.
+
+    Keys are encoded with orjson as they are computed for every record. They are only compared to keys computed in the same sync since
+    the state keeps partitions as objects, so they don't need to be the same as the ones that `json.dumps` used to encode. Partitions that
+    orjson can't encode or that it would mistake for other partitions are still encoded with `json.dumps`.
     """
 
     @staticmethod
     def to_partition_key(to_serialize: Any) -> str:
+        try:
+            partition_key = orjson.dumps(to_serialize, option=orjson.OPT_SORT_KEYS)
+            # orjson encodes NaN and infinity as null: partitions with null values are encoded with `json.dumps` so they aren't mistaken
+            if b"null" not in partition_key:
+                return partition_key.decode("utf-8")
+        except TypeError:
+            # orjson rejects keys that are not strings, integers over 64 bits and strings that are not valid UTF-8
+            pass
         # separators have changed in Python 3.4. To avoid being impacted by further change, we explicitly specify our own value
         return json.dumps(to_serialize, indent=None, separators=(",", ":"), sort_keys=True)
 
     @staticmethod
     def to_partition(to_deserialize: Any) -> Mapping[str, Any]:
+        # orjson is not used as it decodes integers over 64 bits as floats
         return json.loads(to_deserialize)  # type: ignore # The partition is known to be a dict, but the type hint is Any
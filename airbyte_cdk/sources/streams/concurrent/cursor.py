@@ -4,7 +4,18 @@
 
 import functools
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
@@ -143,6 +154,7 @@ class FinalStateCursor(Cursor):
 class ConcurrentCursor(Cursor):
     _START_BOUNDARY = 0
     _END_BOUNDARY = 1
+    _MAX_PARSED_CURSOR_VALUES = 1024
 
     def __init__(
         self,
@@ -174,6 +186,13 @@ class ConcurrentCursor(Cursor):
         self._lookback_window = lookback_window
         self._slice_range = slice_range
         self._most_recent_cursor_value_per_partition: MutableMapping[Partition, Any] = {}
+        # Most recent (ordering key, value) for the values that can be compared without being parsed. They are parsed when the
+        # partition is closed
+        self._most_recent_raw_cursor_value_per_partition: MutableMapping[
+            Partition, Tuple[Any, Any]
+        ] = {}
+        # Records often share the same cursor value (e.g. the date of an export) so the parsed values are memoized
+        self._parsed_cursor_values: Dict[Tuple[type, Any], Any] = {}
         self._has_closed_at_least_one_slice = False
         self._cursor_granularity = cursor_granularity
 
@@ -209,16 +228,61 @@ class ConcurrentCursor(Cursor):
         )
 
     def observe(self, record: Record) -> None:
+        raw_cursor_value = self._cursor_field.extract_value(record)
+        ordering_key = self._connector_state_converter.get_ordering_key(raw_cursor_value)
+        if ordering_key is not None:
+            most_recent_raw_cursor_value = self._most_recent_raw_cursor_value_per_partition.get(
+                record.partition
+            )
+            if (
+                most_recent_raw_cursor_value is None
+                or most_recent_raw_cursor_value[0] < ordering_key
+            ):
+                self._most_recent_raw_cursor_value_per_partition[record.partition] = (
+                    ordering_key,
+                    raw_cursor_value,
+                )
+            return
+
         most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(
             record.partition
         )
-        cursor_value = self._extract_cursor_value(record)
+        cursor_value = self._parse_cursor_value(raw_cursor_value)
 
         if most_recent_cursor_value is None or most_recent_cursor_value < cursor_value:
             self._most_recent_cursor_value_per_partition[record.partition] = cursor_value
 
     def _extract_cursor_value(self, record: Record) -> Any:
-        return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
+        return self._parse_cursor_value(self._cursor_field.extract_value(record))
+
+    def _parse_cursor_value(self, raw_cursor_value: Any) -> Any:
+        # The type is part of the key so that values like 1 and 1.0 or True are parsed separately
+        key = (type(raw_cursor_value), raw_cursor_value)
+        try:
+            return self._parsed_cursor_values[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable values are not memoized
+            return self._connector_state_converter.parse_value(raw_cursor_value)
+
+        cursor_value = self._connector_state_converter.parse_value(raw_cursor_value)
+        if len(self._parsed_cursor_values) >= self._MAX_PARSED_CURSOR_VALUES:
+            self._parsed_cursor_values.clear()
+        self._parsed_cursor_values[key] = cursor_value
+        return cursor_value
+
+    def _get_most_recent_cursor_value(self, partition: Partition) -> Any:
+        most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(partition)
+        most_recent_raw_cursor_value = self._most_recent_raw_cursor_value_per_partition.pop(
+            partition, None
+        )
+        if most_recent_raw_cursor_value is not None:
+            cursor_value = self._parse_cursor_value(most_recent_raw_cursor_value[1])
+            if most_recent_cursor_value is None or most_recent_cursor_value < cursor_value:
+                most_recent_cursor_value = cursor_value
+                self._most_recent_cursor_value_per_partition[partition] = cursor_value
+        return most_recent_cursor_value
 
     def close_partition(self, partition: Partition) -> None:
         slice_count_before = len(self.state.get("slices", []))
@@ -231,7 +295,7 @@ class ConcurrentCursor(Cursor):
         self._has_closed_at_least_one_slice = True
 
     def _add_slice_to_state(self, partition: Partition) -> None:
-        most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(partition)
+        most_recent_cursor_value = self._get_most_recent_cursor_value(partition)
 
         if self._slice_boundary_fields:
             if "slices" not in self.state:
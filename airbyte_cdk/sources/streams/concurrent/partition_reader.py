@@ -1,34 +1,68 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import sys
 from queue import Queue
+from typing import Any, List, Mapping
 
+import orjson
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
 
 
+def approximate_record_size_in_bytes(data: Mapping[str, Any]) -> int:
+    """
+    Estimate the size of a record by the length of its JSON representation. Records that can't be serialized by orjson fall back on
+    the shallow size of the mapping.
+    """
+    try:
+        return len(orjson.dumps(data, default=str))
+    except (TypeError, orjson.JSONEncodeError):
+        return sys.getsizeof(data)
+
+
 class PartitionReader:
     """
     Generates records from a partition and puts them in a queue.
     """
 
     _IS_SUCCESSFUL = True
+    DEFAULT_MAX_BATCH_SIZE = 100
+    DEFAULT_MAX_BATCH_SIZE_IN_BYTES = 1024 * 1024
+    # Only one record out of this number is serialized to estimate its size. The records in between are assumed to have the size of
+    # the last record that was measured as records of the same partition usually have similar sizes
+    _RECORD_SIZE_SAMPLING_INTERVAL = 10
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_size_in_bytes: int = DEFAULT_MAX_BATCH_SIZE_IN_BYTES,
+    ) -> None:
         """
         :param queue: The queue to put the records in.
+        :param max_batch_size: The maximum number of records put in the queue as a single RecordBatch
+        :param max_batch_size_in_bytes: The approximate maximum size of a RecordBatch
         """
         self._queue = queue
+        self._max_batch_size = max_batch_size
+        self._max_batch_size_in_bytes = max_batch_size_in_bytes
 
     def process_partition(self, partition: Partition) -> None:
         """
         Process a partition and put the records in the output queue.
         When all the partitions are added to the queue, a sentinel is added to the queue to indicate that all the partitions have been generated.
 
+        Records are put in the queue as RecordBatch items. A batch is sent once it reaches `max_batch_size` records or
+        `max_batch_size_in_bytes`. The size of a batch is the sum of the approximate sizes of its records so that records of different
+        sizes are accounted for. The size of a record is only measured for one record out of `_RECORD_SIZE_SAMPLING_INTERVAL`.
+
         If an exception is encountered, the exception will be caught and put in the queue. This is very important because if we don't, the
         main thread will have no way to know that something when wrong and will wait until the timeout is reached
 
@@ -36,10 +70,30 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        batch: List[Record] = []
+        batch_size_in_bytes = 0
+        record_size_in_bytes = 0
         try:
-            for record in partition.read():
-                self._queue.put(record)
+            for index, record in enumerate(partition.read()):
+                batch.append(record)
+                if index % self._RECORD_SIZE_SAMPLING_INTERVAL == 0:
+                    record_size_in_bytes = approximate_record_size_in_bytes(record.data)
+                batch_size_in_bytes += record_size_in_bytes
+                if (
+                    len(batch) >= self._max_batch_size
+                    or batch_size_in_bytes >= self._max_batch_size_in_bytes
+                ):
+                    self._put_batch(batch, batch_size_in_bytes)
+                    batch = []
+                    batch_size_in_bytes = 0
+            self._put_batch(batch, batch_size_in_bytes)
             self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
         except Exception as e:
+            # records read before the failure are still emitted, same as if they had been put in the queue one by one
+            self._put_batch(batch, batch_size_in_bytes)
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _put_batch(self, batch: List[Record], batch_size_in_bytes: int) -> None:
+        if batch:
+            self._queue.put(RecordBatch(batch, batch_size_in_bytes))
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Union
+from typing import Any, List, Union
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
@@ -30,9 +30,40 @@ class PartitionCompleteSentinel:
         return False
 
 
+class RecordBatch:
+    """
+    A group of records read from the same partition.
+    Records are put in the queue in batches so that workers and the main thread don't have to hand the queue lock over for every record.
+    """
+
+    def __init__(self, records: List[Record], approximate_size_in_bytes: int = 0):
+        """
+        :param records: The records, in the order they were read from the partition
+        :param approximate_size_in_bytes: An estimate of the size of the records once serialized
+        """
+        self.records = records
+        self.approximate_size_in_bytes = approximate_size_in_bytes
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RecordBatch):
+            return self.records == other.records
+        return False
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(records={self.records})"
+
+
 """
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
 QueueItem = Union[
-    Record, Partition, PartitionCompleteSentinel, PartitionGenerationCompletedSentinel, Exception
+    Record,
+    RecordBatch,
+    Partition,
+    PartitionCompleteSentinel,
+    PartitionGenerationCompletedSentinel,
+    Exception,
 ]
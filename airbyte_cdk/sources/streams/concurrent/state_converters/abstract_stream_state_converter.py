@@ -176,6 +176,13 @@ class AbstractStreamStateConverter(ABC):
         """
         ...
 
+    def get_ordering_key(self, value: Any) -> Optional[Any]:
+        """
+        Return a key for the value of the cursor field that compares like the parsed values so that the most recent value can be found
+        without parsing every value. Return None if the value needs to be parsed to be compared, which is the case by default.
+        """
+        return None
+
     @property
     @abstractmethod
     def zero_value(self) -> Any: ...
@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import calendar
+import re
 from abc import abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, List, MutableMapping, Optional, Tuple
+from typing import Any, Callable, List, MutableMapping, Optional, Pattern, Tuple
 
 import pendulum
 
@@ -18,6 +20,48 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_sta
 )
 from pendulum.datetime import DateTime
 
+# Patterns of the fixed-width directives, from the most significant to the least significant. Each pattern only matches values that
+# strptime parses with the directive
+_ORDERED_DIRECTIVES = {
+    "Y": "[0-9]{4}",
+    "m": "(?:0[1-9]|1[0-2])",
+    "d": "(?:0[1-9]|[12][0-9]|3[01])",
+    "H": "(?:[01][0-9]|2[0-3])",
+    "M": "[0-5][0-9]",
+    "S": "[0-5][0-9]",
+    "f": "[0-9]{6}",
+}
+_TIMESTAMP_FORMATS = {"%s", "%ms", "%s_as_float"}
+
+
+def _lexicographically_ordered_pattern(datetime_format: str) -> Optional[Pattern[str]]:
+    """
+    Return the pattern of the values that sort like the datetimes they represent when compared as strings, or None if the format doesn't
+    guarantee it. This is the case when the format is made of fixed-width directives from the year down to the microseconds, in that
+    order, separated by literals, like `%Y-%m-%dT%H:%M:%S.%fZ`. Formats with time zones, names or non-padded values are not ordered.
+    """
+    expected_directives = iter(_ORDERED_DIRECTIVES)
+    pattern = []
+    index = 0
+    while index < len(datetime_format):
+        character = datetime_format[index]
+        if character != "%":
+            pattern.append(re.escape(character))
+            index += 1
+            continue
+        directive = datetime_format[index + 1 : index + 2]
+        if directive == "%":
+            pattern.append("%")
+        elif directive != next(expected_directives, None):
+            return None
+        else:
+            # the year, month and day are captured to check that the day exists in the month
+            pattern.append(f"(?P<{directive}>{_ORDERED_DIRECTIVES[directive]})")
+        index += 2
+    if "%Y" not in datetime_format:
+        return None
+    return re.compile("".join(pattern))
+
 
 class DateTimeStreamStateConverter(AbstractStreamStateConverter):
     def _from_state_message(self, value: Any) -> Any:
@@ -129,6 +173,11 @@ class EpochValueConcurrentStreamStateConverter(DateTimeStreamStateConverter):
 
     _zero_value = 0
 
+    def get_ordering_key(self, value: Any) -> Optional[Any]:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        return None
+
     def increment(self, timestamp: datetime) -> datetime:
         return timestamp + timedelta(seconds=1)
 
@@ -201,6 +250,36 @@ class CustomFormatConcurrentStreamStateConverter(IsoMillisConcurrentStreamStateC
         self._input_datetime_formats = input_datetime_formats if input_datetime_formats else []
         self._input_datetime_formats += [self._datetime_format]
         self._parser = DatetimeParser()
+        # Values are parsed with the first format that matches so only values of the first format can be compared without parsing them
+        self._first_datetime_format = self._input_datetime_formats[0]
+        self._ordered_pattern = _lexicographically_ordered_pattern(self._first_datetime_format)
+
+    def get_ordering_key(self, value: Any) -> Optional[Any]:
+        if self._first_datetime_format in _TIMESTAMP_FORMATS:
+            # Timestamps given as numbers compare like the datetimes. Timestamps given as strings don't as they might have different lengths
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return value
+            return None
+        if self._ordered_pattern is None or not isinstance(value, str):
+            return None
+        match = self._ordered_pattern.fullmatch(value)
+        if match is None or not self._is_existing_date(match):
+            # Values that are not valid are parsed so that the error is raised for the record
+            return None
+        return value
+
+    @staticmethod
+    def _is_existing_date(match: "re.Match[str]") -> bool:
+        """
+        The pattern only checks the ranges of the months and days so impossible dates like February 30th or the year 0 also match it
+        """
+        year = int(match.group("Y"))
+        if year == 0:
+            return False
+        groups = match.groupdict()
+        if "d" not in groups or int(groups["d"]) <= 28:
+            return True
+        return int(groups["d"]) <= calendar.monthrange(year, int(groups["m"]))[1]
 
     def output_format(self, timestamp: datetime) -> str:
         return self._parser.format(timestamp, self._datetime_format)
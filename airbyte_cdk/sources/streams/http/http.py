@@ -31,6 +31,7 @@ from airbyte_cdk.sources.streams.http.error_handlers.response_models import (
     ResponseAction,
 )
 from airbyte_cdk.sources.streams.http.http_client import HttpClient
+from airbyte_cdk.sources.streams.http.http_connection_pool import HttpConnectionPool
 from airbyte_cdk.sources.types import Record, StreamSlice
 from airbyte_cdk.sources.utils.types import JsonType
 from deprecated import deprecated
@@ -51,7 +52,10 @@ class HttpStream(Stream, CheckpointMixin, ABC):
     )
 
     def __init__(
-        self, authenticator: Optional[AuthBase] = None, api_budget: Optional[APIBudget] = None
+        self,
+        authenticator: Optional[AuthBase] = None,
+        api_budget: Optional[APIBudget] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
     ):
         self._exit_on_rate_limit: bool = False
         self._http_client = HttpClient(
@@ -63,6 +67,7 @@ class HttpStream(Stream, CheckpointMixin, ABC):
             use_cache=self.use_cache,
             backoff_strategy=self.get_backoff_strategy(),
             message_repository=InMemoryMessageRepository(),
+            connection_pool=connection_pool,
         )
 
         # There are three conditions that dictate if RFR should automatically be applied to a stream
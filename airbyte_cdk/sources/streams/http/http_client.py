@@ -19,7 +19,6 @@ from airbyte_cdk.models import (
     Level,
     StreamDescriptor,
 )
-from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.http.error_handlers import (
@@ -38,6 +37,7 @@ from airbyte_cdk.sources.streams.http.exceptions import (
     RequestBodyException,
     UserDefinedBackoffException,
 )
+from airbyte_cdk.sources.streams.http.http_connection_pool import HttpConnectionPool
 from airbyte_cdk.sources.streams.http.rate_limiting import (
     http_client_default_backoff_handler,
     rate_limit_default_backoff_handler,
@@ -87,6 +87,7 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        connection_pool: Optional[HttpConnectionPool] = None,
     ):
         self._name = name
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
@@ -95,12 +96,8 @@ class HttpClient:
         else:
             self._use_cache = use_cache
             self._session = self._request_session()
-            self._session.mount(
-                "https://",
-                requests.adapters.HTTPAdapter(
-                    pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE
-                ),
-            )
+            # Sharing a pool between the clients of a source lets its streams reuse the connections to the same hosts
+            (connection_pool or HttpConnectionPool()).mount(self._session)
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
         self._logger = logger
@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    hosts: int
+    new_connections: int
+    reused_connections: int
+
+
+class _SocketOptionsHTTPAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs: Any) -> None:
+        # Set before calling the parent constructor as it initializes the pool manager
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class HttpConnectionPool:
+    """
+    Transport settings and connection pools shared by the HttpClients of a source.
+
+    The same `requests` adapter is mounted on the session of each HttpClient so that the streams of a source requesting the same host
+    reuse the same connections instead of each stream opening its own. The connections of a host can be used by as many threads at the
+    same time as the pool size, so it should be the number of threads making requests: with fewer connections, `urllib3` discards the
+    connections it can't keep and logs "Connection pool is full".
+    """
+
+    def __init__(
+        self,
+        pool_size: int = MAX_CONNECTION_POOL_SIZE,
+        max_hosts: int = MAX_CONNECTION_POOL_SIZE,
+        pool_block: bool = False,
+        tcp_keep_alive_idle_seconds: Optional[int] = None,
+        connect_retries: int = 0,
+    ) -> None:
+        """
+        :param pool_size: The number of connections kept per host
+        :param max_hosts: The number of hosts whose connections are kept. The least recently used host's connections are closed beyond that
+        :param pool_block: If True, threads wait for a connection of the host to be available instead of opening one that is not kept
+        :param tcp_keep_alive_idle_seconds: If set, TCP keep-alive probes are sent after the connection is idle for this number of
+            seconds so that idle connections are not dropped by proxies and load balancers
+        :param connect_retries: The number of times connecting to the host is retried by the transport before the error is handled by
+            the HttpClient. Only failures to connect are retried as the request was not sent
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1. Got {pool_size}")
+        self._pool_size = pool_size
+        self._max_hosts = max_hosts
+        self._pool_block = pool_block
+        self._tcp_keep_alive_idle_seconds = tcp_keep_alive_idle_seconds
+        self._connect_retries = connect_retries
+        self._adapter: Optional[requests.adapters.HTTPAdapter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    def resize(self, pool_size: int) -> None:
+        """
+        Change the number of connections kept per host. This is meant to be called when the number of threads making requests is known,
+        before requests are made: the connections opened so far are closed.
+        """
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1. Got {pool_size}")
+        with self._lock:
+            self._pool_size = pool_size
+            if self._adapter is not None:
+                self._adapter.poolmanager.clear()
+                self._adapter.init_poolmanager(
+                    self._max_hosts, self._pool_size, block=self._pool_block
+                )
+
+    def mount(self, session: requests.Session) -> None:
+        adapter = self._get_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def get_stats(self) -> ConnectionPoolStats:
+        """
+        :return: The number of connections opened and reused for the hosts whose connections are kept
+        """
+        with self._lock:
+            if self._adapter is None:
+                return ConnectionPoolStats(hosts=0, new_connections=0, reused_connections=0)
+            pools = self._adapter.poolmanager.pools
+            host_pools = [pools.get(key) for key in pools.keys()]
+        new_connections = sum(pool.num_connections for pool in host_pools if pool is not None)
+        requests_sent = sum(pool.num_requests for pool in host_pools if pool is not None)
+        return ConnectionPoolStats(
+            hosts=len(host_pools),
+            new_connections=new_connections,
+            reused_connections=max(requests_sent - new_connections, 0),
+        )
+
+    def log_stats(self, logger: logging.Logger) -> None:
+        stats = self.get_stats()
+        logger.debug(
+            f"HTTP connection pool: {stats.new_connections} connections opened and {stats.reused_connections} requests reusing a "
+            f"connection to {stats.hosts} hosts with {self._pool_size} connections per host",
+        )
+
+    def _get_adapter(self) -> requests.adapters.HTTPAdapter:
+        with self._lock:
+            if self._adapter is None:
+                self._adapter = self._create_adapter()
+            return self._adapter
+
+    def _create_adapter(self) -> requests.adapters.HTTPAdapter:
+        kwargs: Dict[str, Any] = {
+            "pool_connections": self._max_hosts,
+            "pool_maxsize": self._pool_size,
+            "pool_block": self._pool_block,
+            # Requests that could have been sent are never retried by the transport as the HttpClient handles their errors
+            "max_retries": Retry(
+                total=None,
+                connect=self._connect_retries,
+                read=False,
+                redirect=False,
+                status=0,
+                other=0,
+            ),
+        }
+        if self._tcp_keep_alive_idle_seconds is None:
+            return requests.adapters.HTTPAdapter(**kwargs)
+        return _SocketOptionsHTTPAdapter(
+            socket_options=self._get_keep_alive_socket_options(self._tcp_keep_alive_idle_seconds),
+            **kwargs,
+        )
+
+    @staticmethod
+    def _get_keep_alive_socket_options(idle_seconds: int) -> List[Tuple[int, int, int]]:
+        socket_options = list(HTTPConnection.default_socket_options) + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        # The idle time and interval between probes can't be set on every platform
+        for option_name in ("TCP_KEEPIDLE", "TCP_KEEPINTVL"):
+            if hasattr(socket, option_name):
+                socket_options.append(
+                    (socket.IPPROTO_TCP, getattr(socket, option_name), idle_seconds)
+                )
+        return socket_options
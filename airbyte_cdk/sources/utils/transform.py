@@ -3,11 +3,14 @@
 #
 
 import logging
+import numbers
+from collections import deque
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema.exceptions import UnknownType
 
 json_to_python_simple = {
     "string": str,
@@ -21,6 +24,165 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# Same type checks as the jsonschema validator used by TypeTransformer
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: (
+        not isinstance(instance, bool)
+        and (isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer()))
+    ),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: (
+        not isinstance(instance, bool) and isinstance(instance, numbers.Number)
+    ),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+_SIMPLE_PYTHON_TYPES = frozenset(json_to_python_simple.values())
+
+_TYPE = "type"
+_REF = "$ref"
+_PROPERTIES = "properties"
+_ITEMS = "items"
+_RAISE = "raise"
+
+
+class _UnsupportedSchema(Exception):
+    """
+    Raised when compiling a schema that the jsonschema traversal handles in a way the compiled schema doesn't reproduce, for example
+    boolean subschemas or `items` defined as an array of schemas. These schemas are normalized with jsonschema.
+    """
+
+
+class _TypeCheck:
+    __slots__ = ("types", "_checks")
+
+    def __init__(self, types: Union[str, List[str]]) -> None:
+        listed_types = [types] if isinstance(types, str) else types
+        if not isinstance(listed_types, list) or not all(
+            isinstance(type_, str) for type_ in listed_types
+        ):
+            raise _UnsupportedSchema(f"Unsupported type {types!r}")
+        self.types = types
+        self._checks = tuple((type_, _TYPE_CHECKS.get(type_)) for type_ in listed_types)
+
+    def matches(self, instance: Any, schema: Mapping[str, Any]) -> bool:
+        for type_, check in self._checks:
+            if check is None:
+                # Unknown types only fail when they are checked, same as with jsonschema
+                raise UnknownType(type_, instance, schema)
+            if check(instance):
+                return True
+        return False
+
+    def error(self, instance: Any, path: List[Any], schema: Mapping[str, Any]) -> ValidationError:
+        reprs = ", ".join(repr(type_) for type_, _ in self._checks)
+        return ValidationError(
+            f"{instance!r} is not of type {reprs}",
+            validator="type",
+            validator_value=self.types,
+            instance=instance,
+            schema=schema,
+            path=deque(path),
+        )
+
+
+class _Normalization:
+    """
+    How the value of a property or an array item is normalized: the subschema given to the normalization callbacks (with its `$ref`
+    resolved) and the default conversion if it applies.
+    """
+
+    __slots__ = ("subschema", "convert", "error")
+
+    def __init__(
+        self,
+        subschema: Any,
+        convert: Optional[Callable[[Any], Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.subschema = subschema
+        self.convert = convert
+        self.error = error
+
+
+class _CompiledSchema:
+    """
+    The steps applied to an instance for a schema, in the order of the keywords of the schema like the jsonschema traversal does.
+    """
+
+    __slots__ = ("schema", "steps")
+
+    def __init__(self, schema: Mapping[str, Any]) -> None:
+        self.schema = schema
+        self.steps: List[Tuple[str, Any]] = []
+
+
+def _lenient(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_leniently(item: Any) -> Any:
+        try:
+            return convert(item)
+        except (ValueError, TypeError):
+            return item
+
+    return convert_leniently
+
+
+def _to_boolean(item: Any) -> bool:
+    if isinstance(item, str):
+        return strtobool(item) == 1
+    return bool(item)
+
+
+def _wrap_in_array(item: Any) -> Any:
+    return [item] if type(item) in _SIMPLE_PYTHON_TYPES else item
+
+
+_CONVERSIONS: Dict[str, Callable[[Any], Any]] = {
+    "string": _lenient(str),
+    "number": _lenient(float),
+    "integer": _lenient(int),
+    "boolean": _lenient(_to_boolean),
+}
+
+
+def _compile_default_conversion(subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """
+    :return: A function doing the same conversion as `TypeTransformer.default_convert` for the subschema or None if the values are
+    returned unchanged
+    """
+    target_type = subschema.get("type", [])
+    if not isinstance(target_type, (str, list)):
+        raise _UnsupportedSchema(f"Unsupported type {target_type!r}")
+    nullable = "null" in target_type
+    if isinstance(target_type, list):
+        target_types = [t for t in target_type if t != "null"]
+        if len(target_types) != 1:
+            return None
+        target_type = target_types[0]
+    if not isinstance(target_type, str):
+        return None
+
+    if target_type == "array":
+        items = subschema.get("items", {})
+        if not isinstance(items, Mapping):
+            raise _UnsupportedSchema(f"Unsupported items {items!r}")
+        try:
+            item_types = set(items.get("type", set()))
+        except TypeError:
+            return None
+        if not item_types.issubset(json_to_python_simple):
+            return None
+        conversion: Optional[Callable[[Any], Any]] = _wrap_in_array
+    else:
+        conversion = _CONVERSIONS.get(target_type)
+
+    if conversion is None or not nullable:
+        return conversion
+    convert_not_null = conversion
+    return lambda item: None if item is None else convert_not_null(item)
+
 
 class TransformConfig(Flag):
     """
@@ -44,9 +206,15 @@ class TransformConfig(Flag):
 class TypeTransformer:
     """
     Class for transforming object before output.
+
+    Each schema is compiled the first time records are transformed with it into the list of conversions and type checks to apply to
+    records, with its `$ref`s resolved ahead of time. Records are then transformed without jsonschema, with the same results and
+    warnings. Schemas are identified by their content so that equal schemas built for each record share the same compiled schema and a
+    schema changed in place is compiled again.
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
+    _MAX_COMPILED_SCHEMAS = 64
 
     def __init__(self, config: TransformConfig):
         """
@@ -65,6 +233,8 @@ class TypeTransformer:
         self._normalizer = validators.create(
             meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators
         )
+        # compiled schemas by the repr of their schema, in the order they were compiled
+        self._compiled_schemas: Dict[str, Optional[_CompiledSchema]] = {}
 
     def registerCustomTransform(
         self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]
@@ -197,6 +367,13 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema is None:
+            self._transform_with_jsonschema(record, schema)
+        else:
+            self._apply(compiled_schema, record, [])
+
+    def _transform_with_jsonschema(self, record: Dict[str, Any], schema: Mapping[str, Any]) -> None:
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -205,6 +382,150 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        # repr distinguishes values that compare equal but are converted differently, like 1 and True
+        key = repr(schema)
+        try:
+            compiled_schema = self._compiled_schemas[key]
+        except KeyError:
+            try:
+                compiled_schema = self._compile(schema, self._normalizer(schema).resolver, {})
+            except _UnsupportedSchema:
+                compiled_schema = None
+            self._compiled_schemas[key] = compiled_schema
+            if len(self._compiled_schemas) > self._MAX_COMPILED_SCHEMAS:
+                # the oldest schema is evicted. Another thread may have evicted it already
+                self._compiled_schemas.pop(next(iter(self._compiled_schemas)), None)
+        return compiled_schema
+
+    def _compile(
+        self, schema: Any, resolver: Any, compiled_schemas: Dict[Tuple[int, str], _CompiledSchema]
+    ) -> _CompiledSchema:
+        """
+        :param resolver: The jsonschema resolver of the root schema, used to resolve `$ref`s from the same scope as during validation
+        :param compiled_schemas: The schemas compiled so far by scope so that recursive schemas are compiled once
+        """
+        if not isinstance(schema, Mapping):
+            raise _UnsupportedSchema(f"Unsupported schema {schema!r}")
+        key = (id(schema), resolver.resolution_scope)
+        if key in compiled_schemas:
+            return compiled_schemas[key]
+        compiled_schema = _CompiledSchema(schema)
+        compiled_schemas[key] = compiled_schema
+
+        scope = schema.get("$id", "")
+        if scope:
+            resolver.push_scope(scope)
+        try:
+            for keyword, value in schema.items():
+                if keyword == _TYPE:
+                    compiled_schema.steps.append((_TYPE, _TypeCheck(value)))
+                elif keyword == _REF:
+                    try:
+                        url, resolved = resolver.resolve(value)
+                    except Exception as exception:
+                        # The reference is only resolved by jsonschema if a record reaches it
+                        compiled_schema.steps.append((_RAISE, exception))
+                        continue
+                    resolver.push_scope(url)
+                    try:
+                        compiled_schema.steps.append(
+                            (_REF, self._compile(resolved, resolver, compiled_schemas))
+                        )
+                    finally:
+                        resolver.pop_scope()
+                elif keyword == _PROPERTIES:
+                    if not isinstance(value, Mapping):
+                        raise _UnsupportedSchema(f"Unsupported properties {value!r}")
+                    compiled_schema.steps.append(
+                        (
+                            _PROPERTIES,
+                            tuple(
+                                (
+                                    name,
+                                    self._compile_normalization(subschema, resolver),
+                                    self._compile(subschema, resolver, compiled_schemas),
+                                )
+                                for name, subschema in value.items()
+                            ),
+                        )
+                    )
+                elif keyword == _ITEMS:
+                    compiled_schema.steps.append(
+                        (
+                            _ITEMS,
+                            (
+                                self._compile_normalization(value, resolver),
+                                self._compile(value, resolver, compiled_schemas),
+                            ),
+                        )
+                    )
+        finally:
+            if scope:
+                resolver.pop_scope()
+        return compiled_schema
+
+    def _compile_normalization(self, subschema: Any, resolver: Any) -> _Normalization:
+        if not isinstance(subschema, Mapping):
+            raise _UnsupportedSchema(f"Unsupported schema {subschema!r}")
+        if "$ref" in subschema:
+            try:
+                _, subschema = resolver.resolve(subschema["$ref"])
+            except Exception as exception:
+                return _Normalization(subschema, error=exception)
+            if not isinstance(subschema, Mapping):
+                raise _UnsupportedSchema(f"Unsupported schema {subschema!r}")
+
+        if TransformConfig.DefaultSchemaNormalization not in self._config:
+            return _Normalization(subschema)
+        if type(self).default_convert is not TypeTransformer.default_convert:
+            resolved_subschema = subschema
+            return _Normalization(
+                subschema, lambda item: self.default_convert(item, resolved_subschema)
+            )
+        return _Normalization(subschema, _compile_default_conversion(subschema))
+
+    def _normalize_with(self, item: Any, normalization: _Normalization) -> Any:
+        if normalization.error is not None:
+            raise normalization.error
+        if normalization.convert is not None:
+            item = normalization.convert(item)
+        if self._custom_normalizer:
+            item = self._custom_normalizer(item, normalization.subschema)
+        return item
+
+    def _apply(self, compiled_schema: _CompiledSchema, instance: Any, path: List[Any]) -> None:
+        for kind, value in compiled_schema.steps:
+            if kind is _TYPE:
+                if not value.matches(instance, compiled_schema.schema):
+                    logger.warning(
+                        self.get_error_message(value.error(instance, path, compiled_schema.schema))
+                    )
+            elif kind is _PROPERTIES:
+                if isinstance(instance, dict):
+                    # all the properties are normalized before any of them is traversed, same as with jsonschema
+                    for name, normalization, _ in value:
+                        if name in instance:
+                            instance[name] = self._normalize_with(instance[name], normalization)
+                    for name, _, child in value:
+                        if name in instance:
+                            path.append(name)
+                            self._apply(child, instance[name], path)
+                            path.pop()
+            elif kind is _ITEMS:
+                if isinstance(instance, list):
+                    normalization, child = value
+                    for index, item in enumerate(instance):
+                        instance[index] = self._normalize_with(item, normalization)
+                    for index, item in enumerate(instance):
+                        path.append(index)
+                        self._apply(child, item, path)
+                        path.pop()
+            elif kind is _REF:
+                self._apply(value, instance, path)
+            else:
+                raise value
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+import threading
+from typing import Any, List, Mapping, Optional, Pattern
 
 import dpath
 
@@ -56,25 +58,48 @@ def get_secrets(
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# Matches any of the secrets. Built whenever the secrets change so that `filter_secrets` only reads it
+__SECRETS_PATTERN: Optional[Pattern[str]] = None
+__SECRETS_LOCK = threading.Lock()
+
+
+def _compile_secrets_pattern(secrets: List[Any]) -> Optional[Pattern[str]]:
+    """
+    Python tries the alternatives of a pattern in order so longer secrets are listed first: when secrets overlap, the longest one
+    starting at a position is the one replaced.
+    """
+    values = {str(secret) for secret in secrets if secret}
+    if not values:
+        return None
+    return re.compile("|".join(re.escape(value) for value in sorted(values, key=len, reverse=True)))
 
 
 def update_secrets(secrets: List[str]) -> None:
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
-    __SECRETS_FROM_CONFIG = secrets
+    global __SECRETS_FROM_CONFIG, __SECRETS_PATTERN
+    with __SECRETS_LOCK:
+        __SECRETS_FROM_CONFIG = secrets
+        __SECRETS_PATTERN = _compile_secrets_pattern(secrets)
 
 
 def add_to_secrets(secret: str) -> None:
     """Add to the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
-    __SECRETS_FROM_CONFIG.append(secret)
+    global __SECRETS_PATTERN
+    with __SECRETS_LOCK:
+        __SECRETS_FROM_CONFIG.append(secret)
+        __SECRETS_PATTERN = _compile_secrets_pattern(__SECRETS_FROM_CONFIG)
+
+
+def get_secrets_from_config() -> List[str]:
+    """Return the secrets currently being replaced by `filter_secrets`"""
+    return list(__SECRETS_FROM_CONFIG)
 
 
 def filter_secrets(string: str) -> str:
     """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    # The string is scanned once for all the secrets. Replacing each secret one after the other would be as slow as the number of
+    # secrets and could leave parts of a secret visible if another secret it contains is replaced first
+    pattern = __SECRETS_PATTERN
+    if pattern is None:
+        return string
+    return pattern.sub("****", string)
@@ -3,3 +3,5 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_BUFFERED_OUTPUT = "AIRBYTE_BUFFERED_OUTPUT"
+ENV_MAX_QUEUE_SIZE_IN_BYTES = "AIRBYTE_MAX_QUEUE_SIZE_IN_BYTES"
@@ -1,6 +1,8 @@
-import hashlib
 import json
-from typing import Any, Mapping, Optional, Final
+import zlib
+from typing import Any, Final, Mapping, Optional
+
+import orjson
 
 
 class SliceEncoder(json.JSONEncoder):
@@ -12,19 +14,44 @@ class SliceEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _to_json_serializable(obj: Any) -> Any:
+    if hasattr(obj, "__json_serializable__"):
+        return obj.__json_serializable__()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class SliceHasher:
+    """
+    Hashes stream slices to identify partitions within a sync. The hash is computed for every partition so it relies on orjson and
+    checksums instead of a cryptographic hash. It is the same across processes as partitions can be created in worker processes.
+    """
+
     _ENCODING: Final = "utf-8"
 
     @classmethod
     def hash(cls, stream_name: str, stream_slice: Optional[Mapping[str, Any]] = None) -> int:
         if stream_slice:
             try:
-                s = json.dumps(stream_slice, sort_keys=True, cls=SliceEncoder)
-                hash_input = f"{stream_name}:{s}".encode(cls._ENCODING)
+                s = cls._serialize(stream_slice)
+                hash_input = f"{stream_name}:".encode(cls._ENCODING) + s
             except TypeError as e:
                 raise ValueError(f"Failed to serialize stream slice: {e}")
         else:
             hash_input = stream_name.encode(cls._ENCODING)
 
-        # Use last 8 bytes as 64-bit integer for better distribution
-        return int.from_bytes(hashlib.sha256(hash_input).digest()[-8:], "big")
+        # Both checksums make a 64-bit integer, the CRC being in the low bits as it is better distributed
+        return (zlib.adler32(hash_input) << 32) | zlib.crc32(hash_input)
+
+    @staticmethod
+    def _serialize(stream_slice: Mapping[str, Any]) -> bytes:
+        try:
+            return orjson.dumps(
+                stream_slice,
+                default=_to_json_serializable,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # orjson rejects integers over 64 bits and strings that are not valid UTF-8
+            return json.dumps(stream_slice, sort_keys=True, cls=SliceEncoder).encode(
+                SliceHasher._ENCODING
+            )
@@ -0,0 +1,121 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import BinaryIO, List, Optional, Type
+
+
+class BufferedStdoutWriter:
+    """
+    Thread-safe writer that batches serialized messages before writing them to stdout.
+
+    Messages are expected to be complete lines (already terminated by a newline) encoded as bytes. They are accumulated
+    in memory and written to the binary stdout stream as a single write once either `max_buffer_size` bytes are
+    buffered or `flush_interval` seconds elapsed since the last flush. A daemon thread enforces the time bound even when
+    no new message is written, so that a slow source does not hold records back indefinitely.
+
+    Unlike `PrintBuffer`, this writer does not replace `sys.stdout`: log lines written by the logging handlers from
+    other threads keep going to `sys.stdout` directly, and because every write to the underlying stream contains only
+    whole lines, outputs from the different writers can never be interleaved within a line.
+
+    Callers must request a flush (see `write(..., flush=True)`) for messages that the platform needs to see without
+    delay, such as STATE and TRACE messages.
+    """
+
+    DEFAULT_MAX_BUFFER_SIZE = 64 * 1024
+    DEFAULT_FLUSH_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        stream: Optional[BinaryIO] = None,
+    ):
+        """
+        :param max_buffer_size: number of buffered bytes after which the buffer is flushed
+        :param flush_interval: maximum time in seconds a message can stay in the buffer
+        :param stream: binary stream to write to. If not provided, the current `sys.stdout` is resolved on every flush
+        """
+        self._max_buffer_size = max_buffer_size
+        self._flush_interval = flush_interval
+        self._stream = stream
+        self._buffer: List[bytes] = []
+        self._buffer_size = 0
+        self._last_flush_time = time.monotonic()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def write(self, message: bytes, flush: bool = False) -> None:
+        """
+        :param message: serialized message including its trailing newline
+        :param flush: if True, the buffer is written to the stream before returning
+        """
+        with self._lock:
+            self._buffer.append(message)
+            self._buffer_size += len(message)
+            if (
+                flush
+                or self._buffer_size >= self._max_buffer_size
+                or time.monotonic() - self._last_flush_time >= self._flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush_time = time.monotonic()
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffer_size = 0
+        self._write_to_stream(data)
+
+    def _write_to_stream(self, data: bytes) -> None:
+        if self._stream is not None:
+            self._stream.write(data)
+            self._stream.flush()
+            return
+
+        stdout = sys.stdout
+        binary_stdout = getattr(stdout, "buffer", None)
+        # Anything written through the text layer (e.g. `print`) must reach the binary stream first to preserve ordering
+        stdout.flush()
+        if binary_stdout is None:
+            # stdout has been replaced by a text-only stream (e.g. io.StringIO)
+            stdout.write(data.decode())
+            stdout.flush()
+        else:
+            binary_stdout.write(data)
+            binary_stdout.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self._flush_interval):
+            with self._lock:
+                if time.monotonic() - self._last_flush_time >= self._flush_interval:
+                    self._flush_locked()
+
+    def __enter__(self) -> "BufferedStdoutWriter":
+        self._closed.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="stdout-flusher", daemon=True
+        )
+        self._flusher.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import logging
+import time
+
+import orjson
+import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteMessageSerializer,
+    AirbyteRecordMessage,
+    Type,
+    dump_record_message,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _serialize_with_serializer(stream, data, emitted_at, namespace=None) -> bytes:
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(
+            stream=stream, data=data, emitted_at=emitted_at, namespace=namespace
+        ),
+    )
+    return orjson.dumps(AirbyteMessageSerializer.dump(message))
+
+
+@pytest.mark.parametrize(
+    "data, namespace",
+    [
+        pytest.param({"id": 1, "name": "a name"}, None, id="test_flat_record"),
+        pytest.param({"id": 1}, "a_namespace", id="test_with_namespace"),
+        pytest.param({}, None, id="test_empty_record"),
+        pytest.param(
+            {
+                "id": 1,
+                "top_level_none": None,
+                "nested": {"none": None, "list": [None, {"a": None}]},
+            },
+            None,
+            id="test_top_level_none_values_are_omitted",
+        ),
+        pytest.param(
+            {
+                "datetime": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                "date": datetime.date(2024, 1, 1),
+                "tuple": (1, 2),
+                "unicode": "héllo",
+            },
+            None,
+            id="test_non_json_native_types",
+        ),
+    ],
+)
+def test_dump_record_message_matches_airbyte_message_serializer(data, namespace):
+    assert dump_record_message("stream", data, 1000, namespace) == _serialize_with_serializer(
+        "stream", data, 1000, namespace
+    )
+
+
+def test_given_append_newline_when_dump_record_message_then_line_is_terminated():
+    assert dump_record_message("stream", {"id": 1}, 1000, append_newline=True) == (
+        _serialize_with_serializer("stream", {"id": 1}, 1000) + b"\n"
+    )
+
+
+def _records_per_second(serialize, data, number_of_records: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number_of_records):
+        serialize("stream", data, 1000)
+    return number_of_records / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(
+            {"id": 1, "name": "a name", "updated_at": "2024-01-01"}, id="test_small_record"
+        ),
+        pytest.param({f"field_{i}": f"value_{i}" for i in range(200)}, id="test_wide_record"),
+    ],
+)
+def test_dump_record_message_performance(data):
+    number_of_records = 20_000
+
+    def _serialize_with_dataclasses(stream, record_data, emitted_at):
+        message = AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(stream=stream, data=record_data, emitted_at=emitted_at),
+        )
+        return orjson.dumps(AirbyteMessageSerializer.dump(message))
+
+    before = _records_per_second(_serialize_with_dataclasses, data, number_of_records)
+    after = _records_per_second(dump_record_message, data, number_of_records)
+
+    logger.info(f"records/sec with AirbyteMessageSerializer: {before:.0f}, fast path: {after:.0f}")
+    assert after > before
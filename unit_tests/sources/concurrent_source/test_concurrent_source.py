@@ -0,0 +1,164 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import functools
+import logging
+import os
+import time
+from typing import List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+from airbyte_cdk.models import Type
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import (
+    AlwaysAvailableAvailabilityStrategy,
+)
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.utils.slice_logger import SliceLogger
+from unit_tests.sources.streams.concurrent.scenarios.thread_based_concurrent_stream_source_builder import (
+    InMemoryPartition,
+    InMemoryPartitionGenerator,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _NeverLogSliceLogger(SliceLogger):
+    def should_log_slice_message(self, logger: logging.Logger) -> bool:
+        return False
+
+
+def _a_stream(
+    name: str,
+    number_of_partitions: int,
+    records_per_partition: int,
+    message_repository: InMemoryMessageRepository,
+) -> DefaultStream:
+    partitions = []
+    for partition_index in range(number_of_partitions):
+        partition = InMemoryPartition(f"{name}_{partition_index}", name, {"p": partition_index}, [])
+        partition._records = [
+            Record({"partition": partition_index, "id": record_index}, partition)
+            for record_index in range(records_per_partition)
+        ]
+        partitions.append(partition)
+    return DefaultStream(
+        InMemoryPartitionGenerator(partitions),
+        name,
+        json_schema={},
+        availability_strategy=AlwaysAvailableAvailabilityStrategy(),
+        primary_key=[],
+        cursor_field=None,
+        logger=_LOGGER,
+        cursor=FinalStateCursor(name, None, message_repository),
+    )
+
+
+def _read_records(
+    num_workers: int,
+    streams_count: int,
+    partitions_per_stream: int,
+    records_per_partition: int,
+    max_queue_size_in_bytes: Optional[int] = None,
+) -> List:
+    message_repository = InMemoryMessageRepository()
+    streams = [
+        _a_stream(f"stream_{i}", partitions_per_stream, records_per_partition, message_repository)
+        for i in range(streams_count)
+    ]
+    source = ConcurrentSource.create(
+        num_workers,
+        1,
+        Mock(spec=logging.Logger),
+        _NeverLogSliceLogger(),
+        message_repository,
+        max_queue_size_in_bytes=max_queue_size_in_bytes,
+    )
+    return [message for message in source.read(streams) if message.type == Type.RECORD]
+
+
+def test_given_many_records_when_read_then_emit_all_records_in_partition_order():
+    records = _read_records(
+        num_workers=4, streams_count=2, partitions_per_stream=5, records_per_partition=250
+    )
+
+    assert len(records) == 2 * 5 * 250
+    ids_per_partition = {}
+    for record in records:
+        key = (record.record.stream, record.record.data["partition"])
+        ids_per_partition.setdefault(key, []).append(record.record.data["id"])
+    assert all(ids == list(range(250)) for ids in ids_per_partition.values())
+
+
+def test_given_small_queue_budget_when_read_then_emit_all_records():
+    records = _read_records(
+        num_workers=4,
+        streams_count=1,
+        partitions_per_stream=10,
+        records_per_partition=500,
+        max_queue_size_in_bytes=1,
+    )
+
+    assert len(records) == 10 * 500
+
+
+@pytest.mark.parametrize(
+    "environment, max_queue_size_in_bytes, expected_max_queue_size_in_bytes",
+    [
+        pytest.param({}, None, ConcurrentSource.DEFAULT_MAX_QUEUE_SIZE_IN_BYTES, id="test_default"),
+        pytest.param({}, 1000, 1000, id="test_from_argument"),
+        pytest.param(
+            {"AIRBYTE_MAX_QUEUE_SIZE_IN_BYTES": "2000"},
+            1000,
+            2000,
+            id="test_environment_has_precedence",
+        ),
+    ],
+)
+def test_max_queue_size_in_bytes(
+    environment, max_queue_size_in_bytes, expected_max_queue_size_in_bytes
+):
+    with patch.dict(os.environ, environment):
+        source = ConcurrentSource.create(
+            2,
+            1,
+            Mock(spec=logging.Logger),
+            _NeverLogSliceLogger(),
+            InMemoryMessageRepository(),
+            max_queue_size_in_bytes=max_queue_size_in_bytes,
+        )
+
+    assert source._max_queue_size_in_bytes == expected_max_queue_size_in_bytes
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_workers", [2, 8, 16])
+def test_record_batching_performance(num_workers):
+    def _records_per_second(max_batch_size: int) -> float:
+        with patch(
+            "airbyte_cdk.sources.concurrent_source.concurrent_source.PartitionReader",
+            functools.partial(PartitionReader, max_batch_size=max_batch_size),
+        ):
+            start = time.perf_counter()
+            number_of_records = len(
+                _read_records(
+                    num_workers,
+                    streams_count=1,
+                    partitions_per_stream=num_workers * 4,
+                    records_per_partition=5_000,
+                )
+            )
+            return number_of_records / (time.perf_counter() - start)
+
+    unbatched = _records_per_second(max_batch_size=1)
+    batched = _records_per_second(max_batch_size=PartitionReader.DEFAULT_MAX_BATCH_SIZE)
+
+    _LOGGER.info(
+        f"{num_workers} workers: {unbatched:.0f} records/sec with one queue item per record, {batched:.0f} records/sec with batches"
+    )
+    assert batched > unbatched
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import threading
+from queue import Full
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import RecordBatch
+
+
+def _a_batch(size_in_bytes: int) -> RecordBatch:
+    return RecordBatch([Record({"id": 1}, Mock(spec=Partition))], size_in_bytes)
+
+
+def test_given_budget_exceeded_when_put_then_raise_full():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+    queue.put(_a_batch(60))
+
+    with pytest.raises(Full):
+        queue.put(_a_batch(60), block=False)
+    with pytest.raises(Full):
+        queue.put(_a_batch(60), timeout=0.01)
+
+
+def test_given_empty_queue_when_put_batch_bigger_than_budget_then_accept():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+
+    queue.put(_a_batch(1000), block=False)
+
+    assert queue.size_in_bytes == 1000
+
+
+def test_given_budget_exceeded_when_put_non_record_item_then_accept():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+    queue.put(_a_batch(100))
+
+    queue.put(Mock(spec=Partition), block=False)
+
+    assert queue.qsize() == 2
+
+
+def test_given_maxsize_reached_when_put_then_raise_full():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100, maxsize=1)
+    queue.put(Mock(spec=Partition))
+
+    with pytest.raises(Full):
+        queue.put(Mock(spec=Partition), block=False)
+
+
+def test_when_get_then_release_budget_and_keep_peak_gauges():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+    queue.put(_a_batch(40))
+    queue.put(_a_batch(50))
+
+    queue.get()
+
+    assert queue.size_in_bytes == 50
+    assert queue.qsize() == 1
+    assert queue.peak_size_in_bytes == 90
+    assert queue.peak_qsize == 2
+
+
+def test_given_blocked_producers_when_get_then_unblock_all_producers_that_fit():
+    queue = MemoryBoundedQueue(max_size_in_bytes=100)
+    queue.put(_a_batch(100))
+    producers = [threading.Thread(target=queue.put, args=(_a_batch(40),)) for _ in range(2)]
+    for producer in producers:
+        producer.start()
+
+    queue.get()
+    for producer in producers:
+        producer.join(timeout=5)
+
+    assert not any(producer.is_alive() for producer in producers)
+    assert queue.size_in_bytes == 80
@@ -0,0 +1,194 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, List
+
+import pytest
+from airbyte_cdk.sources.concurrent_source.worker_process_pool import WorkerProcessPool
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from unit_tests.sources.file_based.in_memory_files_source import InMemoryFilesStreamReader
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _generate_numbers(count: int) -> Iterable[int]:
+    yield from range(count)
+
+
+def _generate_then_fail(count: int) -> Iterable[int]:
+    yield from range(count)
+    raise ValueError("an error")
+
+
+class _UnpicklableError(Exception):
+    def __init__(self, message: str, code: int) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _raise_unpicklable_error() -> Iterable[int]:
+    raise _UnpicklableError("an error", 1)
+    yield
+
+
+def _log_then_generate(count: int) -> Iterable[int]:
+    logging.getLogger("airbyte").info("logged in %s", "the worker")
+    logging.getLogger("airbyte").debug("not logged")
+    yield from range(count)
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[WorkerProcessPool]:
+    pool = WorkerProcessPool(max_workers=2, batch_size=10)
+    yield pool
+    pool.shutdown()
+
+
+def test_when_iterate_then_return_all_items_in_order(pool):
+    assert list(pool.iterate(_generate_numbers, 105)) == list(range(105))
+
+
+def test_given_many_tasks_when_iterate_concurrently_then_return_items_of_each_task(pool):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda count: list(pool.iterate(_generate_numbers, count)), range(50, 58))
+        )
+
+    assert results == [list(range(count)) for count in range(50, 58)]
+
+
+def test_given_function_raises_when_iterate_then_return_items_and_reraise(pool):
+    items = []
+    with pytest.raises(ValueError, match="an error"):
+        for item in pool.iterate(_generate_then_fail, 25):
+            items.append(item)
+
+    assert items == list(range(25))
+
+
+def test_given_exception_cannot_be_pickled_when_iterate_then_raise_runtime_error(pool):
+    with pytest.raises(RuntimeError, match="_UnpicklableError"):
+        list(pool.iterate(_raise_unpicklable_error))
+
+
+def test_given_function_cannot_be_pickled_when_iterate_then_raise_before_submitting(pool):
+    lock = threading.Lock()
+
+    with pytest.raises(TypeError):
+        pool.iterate(_generate_numbers, lock)
+
+
+def test_given_consumer_stops_early_when_iterate_then_other_tasks_are_not_blocked(pool):
+    iterator = pool.iterate(_generate_numbers, 10_000)
+    next(iterator)
+    iterator.close()  # type: ignore  # the iterator is a generator
+
+    assert list(pool.iterate(_generate_numbers, 20)) == list(range(20))
+
+
+def test_given_function_logs_when_iterate_then_emit_log_in_main_process(caplog):
+    pool = WorkerProcessPool(max_workers=1)
+    with caplog.at_level(logging.INFO, logger="airbyte"):
+        # the log record is sent through the same queue as the items so it is emitted before the end of the task is received
+        assert list(pool.iterate(_log_then_generate, 3)) == [0, 1, 2]
+    pool.shutdown()
+
+    assert [
+        (record.name, record.levelno, record.getMessage(), record.process != os.getpid())
+        for record in caplog.records
+    ] == [("airbyte", logging.INFO, "logged in the worker", True)]
+
+
+def test_given_pool_shut_down_when_iterate_then_start_new_workers():
+    pool = WorkerProcessPool(max_workers=1)
+    assert list(pool.iterate(_generate_numbers, 3)) == [0, 1, 2]
+    pool.shutdown()
+
+    assert list(pool.iterate(_generate_numbers, 3)) == [0, 1, 2]
+    pool.shutdown()
+
+
+def test_given_no_worker_when_create_pool_then_raise():
+    with pytest.raises(ValueError):
+        WorkerProcessPool(max_workers=0)
+
+
+def _csv_rows(rows: int) -> List[List[Any]]:
+    return [["id", "name", "amount", "created_at"]] + [
+        [i, f"name_{i}", i * 1.5, "2024-01-01T00:00:00Z"] for i in range(rows)
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    (os.cpu_count() or 1) < 4, reason="Process mode can only be faster with multiple cores"
+)
+def test_csv_parsing_performance_in_threads_and_in_processes():
+    number_of_files = 8
+    # each file gets its own reader so that the whole dataset is not pickled with every file sent to a worker
+    stream_readers = {
+        f"file_{i}.csv": InMemoryFilesStreamReader(
+            files={
+                f"file_{i}.csv": {
+                    "contents": _csv_rows(20_000),
+                    "last_modified": "2024-01-01T00:00:00.000Z",
+                }
+            },
+            file_type="csv",
+        )
+        for i in range(number_of_files)
+    }
+    config = FileBasedStreamConfig(
+        name="stream", validation_policy="Emit Record", format=CsvFormat()
+    )
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "amount": {"type": "number"},
+            "created_at": {"type": "string"},
+        },
+    }
+    remote_files = [
+        RemoteFile(uri=uri, last_modified=datetime(2024, 1, 1)) for uri in stream_readers
+    ]
+    parser = CsvParser()
+
+    def _records_per_second(parse: Callable[..., Iterable[Any]]) -> float:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=number_of_files) as executor:
+            number_of_records = sum(
+                executor.map(
+                    lambda file: sum(
+                        1 for _ in parse(config, file, stream_readers[file.uri], _LOGGER, schema)
+                    ),
+                    remote_files,
+                )
+            )
+        return number_of_records / (time.perf_counter() - start)
+
+    in_threads = _records_per_second(parser.parse_records)
+    pool = WorkerProcessPool(max_workers=4)
+    try:
+        # spawning the workers is a one-time cost that is not part of the comparison
+        warm_up_tasks = [pool.iterate(_generate_numbers, 1) for _ in range(pool.max_workers)]
+        for task in warm_up_tasks:
+            list(task)
+        in_processes = _records_per_second(lambda *args: pool.iterate(parser.parse_records, *args))
+    finally:
+        pool.shutdown()
+
+    _LOGGER.info(
+        f"CSV parsing: {in_threads:.0f} records/sec in threads, {in_processes:.0f} records/sec in worker processes"
+    )
+    assert in_processes > in_threads
@@ -0,0 +1,210 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import json
+from typing import Any, Iterator, List
+from unittest.mock import Mock
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor
+from airbyte_cdk.sources.declarative.models import SimpleRetriever as SimpleRetrieverModel
+from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import (
+    ModelToComponentFactory,
+)
+from airbyte_cdk.sources.types import StreamSlice
+
+_CONFIG = {"records_field": "data"}
+
+
+def _response(body: str, chunk_size: int) -> requests.Response:
+    response = Mock(spec=requests.Response)
+    response.encoding = "utf-8"
+    response.status_code = 200
+    encoded = body.encode("utf-8")
+
+    def _iter_content(**kwargs: Any) -> Iterator[bytes]:
+        # the chunk size asked by the decoder is ignored to test how values split across chunks are decoded
+        for start in range(0, len(encoded), chunk_size):
+            yield encoded[start : start + chunk_size]
+
+    response.iter_content.side_effect = _iter_content
+    response.json.side_effect = lambda: json.loads(body)
+    return response
+
+
+def _extract(decoder: Any, field_path: List[str], body: str, chunk_size: int) -> List[Any]:
+    extractor = DpathExtractor(
+        field_path=field_path, config=_CONFIG, decoder=decoder, parameters={}
+    )
+    return list(extractor.extract_records(_response(body, chunk_size)))
+
+
+@pytest.mark.parametrize(
+    "field_path, body",
+    [
+        pytest.param(["data"], '{"data": [{"id": 1}, {"id": 2}]}', id="test_array_at_root_field"),
+        pytest.param(
+            ["data"],
+            '{"meta": {"count": 2, "ids": [1, 2]}, "data": [{"id": 1, "text": "é, ü ✓"}, {"id": 2}], "next": "page"}',
+            id="test_skip_fields_before_and_after",
+        ),
+        pytest.param(
+            ["data", "records"], '{"data": {"records": [{"id": 1}]}}', id="test_nested_path"
+        ),
+        pytest.param(
+            ["{{ config['records_field'] }}"], '{"data": [{"id": 1}]}', id="test_interpolated_path"
+        ),
+        pytest.param(["data"], '{"data": {"id": 1}}', id="test_object_is_a_record"),
+        pytest.param(["data"], '{"data": {}}', id="test_empty_object_is_not_a_record"),
+        pytest.param(["data"], '{"data": []}', id="test_empty_array"),
+        pytest.param(["data"], '{"other": [1]}', id="test_missing_field"),
+        pytest.param(["data"], "{}", id="test_empty_body_object"),
+        pytest.param(
+            ["data", "records"], '{"data": [{"records": [1]}]}', id="test_path_through_array"
+        ),
+        pytest.param(
+            ["data"], '[{"data": [{"id": 1}]}, {"data": {"id": 2}}]', id="test_top_level_array"
+        ),
+        pytest.param([], '[{"id": 1}, {"id": 2}]', id="test_no_path_with_array"),
+        pytest.param([], '{"id": 1}', id="test_no_path_with_object"),
+        pytest.param(
+            ["data"],
+            '{"data": [1.5e3, 12345678901234567890, -0.25, true, null, "s"]}',
+            id="test_scalars",
+        ),
+        pytest.param(
+            ["data"], '  \n{ "data" :\t[ {"id" : 1} , {"id":2} ] }  ', id="test_whitespace"
+        ),
+        pytest.param(
+            ["data", "*"],
+            '{"data": {"a": {"id": 1}, "b": {"id": 2}}}',
+            id="test_wildcard_falls_back",
+        ),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_streaming_json_decoder_extracts_same_records_as_json_decoder(field_path, body, chunk_size):
+    expected = _extract(JsonDecoder(parameters={}), field_path, body, chunk_size)
+
+    assert _extract(StreamingJsonDecoder(parameters={}), field_path, body, chunk_size) == expected
+
+
+def test_given_invalid_json_when_decode_field_path_then_return_records_read_so_far_and_close():
+    response = _response('{"data": [{"id": 1}, {"id": 2}, {"id"', chunk_size=5)
+
+    records = list(StreamingJsonDecoder(parameters={}).decode_field_path(response, ["data"]))
+
+    assert records == [{"id": 1}, {"id": 2}]
+    response.close.assert_called_once()
+
+
+def test_given_consumer_stops_early_when_decode_field_path_then_only_read_needed_chunks():
+    body = json.dumps({"data": [{"id": i} for i in range(1000)]})
+    response = _response(body, chunk_size=10)
+    chunks_read = []
+    original_iter_content = response.iter_content.side_effect
+    response.iter_content.side_effect = lambda **kwargs: (
+        chunks_read.append(chunk) or chunk for chunk in original_iter_content(**kwargs)
+    )
+
+    records = StreamingJsonDecoder(parameters={}).decode_field_path(response, ["data"])
+    assert next(iter(records)) == {"id": 0}
+
+    assert len(chunks_read) < 5
+
+
+def test_streaming_json_decoder_is_stream_response():
+    assert StreamingJsonDecoder(parameters={}).is_stream_response()
+
+
+def test_given_body_ends_before_array_is_closed_when_decode_field_path_then_log_and_stop():
+    response = _response('{"data": [{"id": 1}', chunk_size=3)
+
+    assert list(StreamingJsonDecoder(parameters={}).decode_field_path(response, ["data"])) == [
+        {"id": 1}
+    ]
+
+
+@pytest.mark.parametrize(
+    "field_path, body, expected",
+    [
+        pytest.param(
+            ["data"],
+            '{"meta": {"count": 2}, "data": [{"id": 1}, {"id": 2}], "next": "page"}',
+            {"meta": {"count": 2}, "next": "page"},
+            id="test_fields_before_and_after_records",
+        ),
+        pytest.param(
+            ["data", "records"],
+            '{"data": {"records": [{"id": 1}], "cursor": "c"}, "total": 1}',
+            {"data": {"cursor": "c"}, "total": 1},
+            id="test_nested_path",
+        ),
+        pytest.param(["data"], '{"other": [1]}', {"other": [1]}, id="test_missing_field"),
+        pytest.param([], '{"id": 1}', {"id": 1}, id="test_no_path_with_object"),
+    ],
+)
+def test_given_records_read_when_decode_then_return_fields_that_are_not_records(
+    field_path, body, expected
+):
+    decoder = StreamingJsonDecoder(parameters={})
+    response = _response(body, chunk_size=3)
+
+    list(decoder.decode_field_path(response, field_path))
+
+    assert next(decoder.decode(response)) == expected
+    response.json.assert_not_called()
+
+
+def test_given_body_cursor_pagination_when_read_then_read_all_pages(requests_mock):
+    requests_mock.get(
+        "https://api.test/items",
+        [
+            {"text": '{"data": [{"id": 1}, {"id": 2}], "next": "page-2"}'},
+            {"text": '{"data": [{"id": 3}], "next": null}'},
+        ],
+    )
+    retriever = ModelToComponentFactory().create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition={
+            "type": "SimpleRetriever",
+            "decoder": {"type": "StreamingJsonDecoder"},
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://api.test",
+                "path": "/items",
+            },
+            "record_selector": {
+                "type": "RecordSelector",
+                "extractor": {"type": "DpathExtractor", "field_path": ["data"]},
+            },
+            "paginator": {
+                "type": "DefaultPaginator",
+                "page_token_option": {
+                    "type": "RequestOption",
+                    "inject_into": "request_parameter",
+                    "field_name": "cursor",
+                },
+                "pagination_strategy": {
+                    "type": "CursorPagination",
+                    "cursor_value": "{{ response.next }}",
+                    "stop_condition": "{{ not response.next }}",
+                },
+            },
+        },
+        config={},
+        name="items",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    records = [
+        dict(record)
+        for record in retriever.read_records({}, StreamSlice(partition={}, cursor_slice={}))
+    ]
+
+    assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requests_mock.request_history[1].qs == {"cursor": ["page-2"]}
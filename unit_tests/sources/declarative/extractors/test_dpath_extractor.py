@@ -3,8 +3,11 @@
 #
 import io
 import json
-from typing import Dict, List, Union
+import logging
+import time
+from typing import Any, Callable, Dict, List, Union
 
+import dpath
 import pytest
 import requests
 from airbyte_cdk import Decoder
@@ -14,6 +17,7 @@ from airbyte_cdk.sources.declarative.decoders.json_decoder import (
     JsonlDecoder,
 )
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
@@ -120,3 +124,129 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+_BODY_FOR_PATHS = {
+    "data": [{"id": 1, "list": [{"id": 2}]}, {"id": 3, "list": []}, "a string", None, [{"id": 4}]],
+    "meta": {"a": {"id": 5}, "b": {"id": 6, "list": [{"id": 7}]}, "c": {}, "d": 0},
+    "nested": {"records": {"id": 8}},
+    "empty": {},
+    "text": "text",
+    "": {"id": 9},
+    "0": {"id": 10},
+}
+
+
+@pytest.mark.parametrize(
+    "field_path",
+    [
+        ["data"],
+        ["meta"],
+        ["nested", "records"],
+        ["nested", "records", "id"],
+        ["empty"],
+        ["text"],
+        ["text", "0"],
+        ["does_not_exist"],
+        ["does_not_exist", "*"],
+        ["data", "0"],
+        ["data", "-1"],
+        ["data", "5"],
+        ["data", "-6"],
+        ["data", "first"],
+        ["data", "0", "list"],
+        ["data", "*"],
+        ["data", "*", "id"],
+        ["data", "*", "list", "*"],
+        ["meta", "*"],
+        ["meta", "*", "list", "*", "id"],
+        ["*"],
+        ["*", "*"],
+        ["*", "0"],
+        [""],
+        ["0"],
+        ["da?a"],
+        ["meta", "[a]"],
+        ["text", "**"],
+        ["{{ config['field'] }}"],
+    ],
+)
+def test_dpath_extractor_extracts_same_records_as_dpath(field_path: List[str]):
+    extractor = DpathExtractor(
+        field_path=field_path, config=config, decoder=decoder_json, parameters=parameters
+    )
+    path = [
+        InterpolatedString.create(segment, parameters={}).eval(config) for segment in field_path
+    ]
+    if "*" in path:
+        expected = dpath.values(_BODY_FOR_PATHS, path)
+    else:
+        extracted = dpath.get(_BODY_FOR_PATHS, path, default=[])
+        expected = extracted if isinstance(extracted, list) else [extracted] if extracted else []
+
+    assert list(extractor.extract_records(create_response(_BODY_FOR_PATHS))) == expected
+
+
+def test_given_config_changes_when_extract_records_then_use_new_field_path():
+    changing_config = {"field": "first"}
+    extractor = DpathExtractor(
+        field_path=["{{ config['field'] }}"],
+        config=changing_config,
+        decoder=decoder_json,
+        parameters={},
+    )
+    body = {"first": [{"id": 1}], "second": [{"id": 2}]}
+    assert list(extractor.extract_records(create_response(body))) == [{"id": 1}]
+
+    changing_config["field"] = "second"
+
+    assert list(extractor.extract_records(create_response(body))) == [{"id": 2}]
+
+
+def _seconds_per_call(function: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "field_path, body",
+    [
+        pytest.param(
+            ["data", "records"],
+            {
+                "data": {"records": [{"id": i, "values": list(range(20))} for i in range(1000)]},
+                "meta": {"count": 1000},
+            },
+            id="wide",
+        ),
+        pytest.param(
+            ["a", "b", "c", "d", "e", "f", "records"],
+            {"a": {"b": {"c": {"d": {"e": {"f": {"records": [{"id": i} for i in range(100)]}}}}}}},
+            id="deep",
+        ),
+        pytest.param(
+            ["data", "*", "records"],
+            {"data": [{"records": [{"id": i, "values": list(range(20))}]} for i in range(1000)]},
+            id="wildcard",
+        ),
+    ],
+)
+def test_compiled_field_path_performance_against_dpath(field_path: List[str], body: Dict[str, Any]):
+    extractor = DpathExtractor(
+        field_path=field_path, config=config, decoder=decoder_json, parameters=parameters
+    )
+    compiled_field_path = extractor._get_compiled_field_path(field_path)
+    assert compiled_field_path is not None
+    get_with_dpath = dpath.values if "*" in field_path else dpath.get
+
+    with_dpath = _seconds_per_call(lambda: get_with_dpath(body, field_path), calls=20)
+    compiled = _seconds_per_call(lambda: compiled_field_path.extract(body), calls=20)
+
+    logging.getLogger(__name__).info(
+        f"Field path {field_path}: {with_dpath * 1e6:.0f}us per response with dpath, {compiled * 1e6:.0f}us compiled"
+    )
+    assert compiled_field_path.extract(body) == get_with_dpath(body, field_path)
+    assert compiled * 10 < with_dpath
@@ -3,12 +3,15 @@ import csv
 import os
 from io import BytesIO
 from pathlib import Path
+from typing import Iterable, List
 from unittest import TestCase
+from unittest.mock import Mock
 
 import pytest
 import requests
 import requests_mock
 from airbyte_cdk.sources.declarative.extractors import ResponseToFileExtractor
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 
 
 class ResponseToFileExtractorTest(TestCase):
@@ -57,6 +60,89 @@ class ResponseToFileExtractorTest(TestCase):
         return requests.get(any_url)
 
 
+def _response_with_chunks(chunks: Iterable[bytes]) -> requests.Response:
+    response = Mock(spec=requests.Response)
+    response.headers = {}
+    response.iter_content.return_value = chunks
+    return response
+
+
+def _downloaded_files(directory: Path) -> List[Path]:
+    return list(directory.glob("airbyte_response_*"))
+
+
+def test_given_chunk_size_when_extract_records_then_return_rows_of_every_chunk_with_missing_values_as_none():
+    csv_response = '"id","name"\n"1","a name"\n"2",\n"3","another name"\n'
+    response = _response_with_chunks([csv_response.encode("utf-8")])
+
+    extracted_records = list(ResponseToFileExtractor(chunk_size=2).extract_records(response))
+
+    assert extracted_records == [
+        {"id": "1", "name": "a name"},
+        {"id": "2", "name": None},
+        {"id": "3", "name": "another name"},
+    ]
+
+
+def test_given_empty_response_when_extract_records_then_return_no_records():
+    assert list(ResponseToFileExtractor().extract_records(_response_with_chunks([]))) == []
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_given_invalid_chunk_size_then_raise(chunk_size):
+    with pytest.raises(ValueError):
+        ResponseToFileExtractor(chunk_size=chunk_size)
+
+
+def test_given_download_fails_when_extract_records_then_raise_download_error(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+
+    def _chunks() -> Iterable[bytes]:
+        yield b'"id"\n"1"\n'
+        raise requests.exceptions.ChunkedEncodingError("connection broken")
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        list(ResponseToFileExtractor().extract_records(_response_with_chunks(_chunks())))
+    assert _downloaded_files(tmp_path) == []
+
+
+def test_when_extract_records_then_download_to_temporary_directory_of_connector_and_remove_file(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    records = ResponseToFileExtractor().extract_records(
+        _response_with_chunks([b'"id"\n', b'"1"\n', b'"2"\n'])
+    )
+
+    assert next(records) == {"id": "1"}
+    assert len(_downloaded_files(tmp_path)) == 1
+    assert list(records) == [{"id": "2"}]
+    assert _downloaded_files(tmp_path) == []
+
+
+def test_given_records_not_all_read_when_close_then_stop_download_and_remove_file(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    downloaded_chunks = []
+
+    def _chunks() -> Iterable[bytes]:
+        yield b'"id"\n'
+        rows = b'"a value"\n' * 1000
+        for i in range(100_000):
+            downloaded_chunks.append(i)
+            yield rows
+
+    records = ResponseToFileExtractor(chunk_size=10).extract_records(
+        _response_with_chunks(_chunks())
+    )
+    assert next(records) == {"id": "a value"}
+    records.close()
+
+    assert len(downloaded_chunks) < 100_000
+    assert _downloaded_files(tmp_path) == []
+
+
 @pytest.fixture(name="large_events_response")
 def large_event_response_fixture():
     lines_in_response = 2_000_000  # ≈ 62 MB of response
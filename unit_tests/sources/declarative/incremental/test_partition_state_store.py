@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import PartitionStateStore
+
+
+def _cursor(state):
+    cursor = Mock(spec=DeclarativeCursor)
+    cursor.get_stream_state.return_value = state
+    return cursor
+
+
+@pytest.fixture
+def create_cursor():
+    return Mock(side_effect=_cursor)
+
+
+def test_given_cursor_evicted_when_getitem_then_create_cursor_from_its_state(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=1)
+    first_cursor = _cursor({"updated_at": "2024-01-01"})
+    store["first"] = first_cursor
+    store["second"] = _cursor({"updated_at": "2024-01-02"})
+
+    cursor = store["first"]
+
+    assert cursor is not first_cursor
+    create_cursor.assert_called_once_with({"updated_at": "2024-01-01"})
+    # The cursor is kept in memory once created again
+    assert store["first"] is cursor
+
+
+def test_given_cursor_in_memory_when_getitem_then_return_same_cursor(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=2)
+    cursor = _cursor({})
+    store["first"] = cursor
+
+    assert store["first"] is cursor
+    create_cursor.assert_not_called()
+
+
+def test_when_iterate_then_partitions_are_in_insertion_order(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=1)
+    for partition_key in ["c", "a", "b"]:
+        store[partition_key] = _cursor({})
+    store["c"] = _cursor({})
+
+    assert list(store) == ["c", "a", "b"]
+    assert len(store) == 3
+
+
+def test_when_popitem_not_last_then_remove_oldest_partition(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=1)
+    for partition_key in ["first", "second", "third"]:
+        store[partition_key] = _cursor({"partition": partition_key})
+
+    partition_key, cursor = store.popitem(last=False)
+
+    assert partition_key == "first"
+    assert cursor.get_stream_state() == {"partition": "first"}
+    assert list(store) == ["second", "third"]
+    assert "first" not in store
+
+
+def test_when_states_then_do_not_create_cursors_on_disk(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=1)
+    store["on_disk"] = _cursor({"updated_at": "2024-01-01"})
+    in_memory_cursor = _cursor({"updated_at": "2024-01-02"})
+    store["in_memory"] = in_memory_cursor
+    in_memory_cursor.get_stream_state.return_value = {"updated_at": "2024-01-03"}
+
+    assert list(store.states()) == [
+        ("on_disk", {"updated_at": "2024-01-01"}),
+        ("in_memory", {"updated_at": "2024-01-03"}),
+    ]
+    create_cursor.assert_not_called()
+
+
+def test_when_set_state_then_create_cursor_once_partition_is_used(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=10)
+
+    for index in range(2500):
+        store.set_state(f"partition_{index}", {"index": index})
+
+    assert len(store) == 2500
+    assert "partition_2000" in store
+    create_cursor.assert_not_called()
+    assert store["partition_2000"].get_stream_state() == {"index": 2000}
+    assert [state for _, state in store.states()] == [{"index": index} for index in range(2500)]
+
+
+def test_when_delitem_then_remove_partition(create_cursor):
+    store = PartitionStateStore(create_cursor, max_cursors_in_memory=1)
+    store["first"] = _cursor({})
+    store["second"] = _cursor({})
+
+    del store["first"]
+
+    assert "first" not in store
+    assert len(store) == 1
+    with pytest.raises(KeyError):
+        store["first"]
+    with pytest.raises(KeyError):
+        del store["first"]
+
+
+def test_given_invalid_max_cursors_in_memory_then_raise(create_cursor):
+    with pytest.raises(ValueError):
+        PartitionStateStore(create_cursor, max_cursors_in_memory=0)
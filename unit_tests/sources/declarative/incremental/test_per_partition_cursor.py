@@ -2,6 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import logging
+import time
 from collections import OrderedDict
 from unittest.mock import Mock
 
@@ -84,6 +87,74 @@ def test_given_tuples_in_json_then_deserialization_convert_to_list():
     )
 
 
+@pytest.mark.parametrize(
+    "partition",
+    [
+        pytest.param({"key": None}, id="test_null"),
+        pytest.param({"key": float("nan")}, id="test_nan"),
+        pytest.param({"key": float("inf")}, id="test_infinity"),
+        pytest.param({"key": "caf\u00e9"}, id="test_non_ascii"),
+        pytest.param({"key": 2**70}, id="test_integer_over_64_bits"),
+        pytest.param({1: "value"}, id="test_integer_key"),
+        pytest.param({"key": 1e-07}, id="test_float_with_exponent"),
+    ],
+)
+def test_given_partition_not_encoded_the_same_by_orjson_when_serialize_then_deserialize_to_same_value(
+    partition,
+):
+    serializer = PerPartitionKeySerializer()
+    partition_key = serializer.to_partition_key(partition)
+
+    assert json.dumps(serializer.to_partition(partition_key)) == json.dumps(
+        json.loads(json.dumps(partition))
+    )
+
+
+def test_given_null_and_nan_values_when_serialize_then_partition_keys_are_different():
+    serializer = PerPartitionKeySerializer()
+
+    assert serializer.to_partition_key({"key": None}) != serializer.to_partition_key(
+        {"key": float("nan")}
+    )
+
+
+def test_given_key_serialized_with_json_dumps_when_to_partition_then_deserialize():
+    partition_key = json.dumps(PARTITION, indent=None, separators=(",", ":"), sort_keys=True)
+
+    assert PerPartitionKeySerializer().to_partition(partition_key) == PARTITION
+
+
+@pytest.mark.slow
+def test_partition_key_serialization_performance():
+    number_of_partitions = 20_000
+    partition = {
+        "parent_slice": {
+            "parent_slice": {"workspace_id": "a workspace", "region": "us-east-1"},
+            "project_id": 12345,
+        },
+        "issue_id": 987654,
+        "labels": ["label 1", "label 2"],
+    }
+
+    def _partitions_per_second(to_partition_key) -> float:
+        start = time.perf_counter()
+        for _ in range(number_of_partitions):
+            to_partition_key(partition)
+        return number_of_partitions / (time.perf_counter() - start)
+
+    before = _partitions_per_second(
+        lambda to_serialize: json.dumps(
+            to_serialize, indent=None, separators=(",", ":"), sort_keys=True
+        )
+    )
+    after = _partitions_per_second(PerPartitionKeySerializer.to_partition_key)
+
+    logging.getLogger(__name__).info(
+        f"partitions/sec with json.dumps: {before:.0f}, with PerPartitionKeySerializer: {after:.0f}"
+    )
+    assert after > before
+
+
 def test_stream_slice_merge_dictionaries():
     stream_slice = StreamSlice(
         partition={"partition key": "partition value"}, cursor_slice={"cursor key": "cursor value"}
@@ -706,3 +777,46 @@ def test_per_partition_state_when_set_initial_global_state(
         },
     ]
     assert cursor.get_stream_state()["states"] == expected_state
+
+
+def _cursor_keeping_initial_state():
+    cursor = MockedCursorBuilder().with_stream_slices([{CURSOR_SLICE_FIELD: "slice"}]).build()
+    cursor.set_initial_state.side_effect = lambda state: setattr(
+        cursor.get_stream_state, "return_value", state
+    )
+    return cursor
+
+
+def test_given_max_partitions_in_memory_when_more_partitions_then_keep_the_state_of_each_partition(
+    mocked_partition_router,
+):
+    cursor_factory = Mock()
+    cursor_factory.create.side_effect = _cursor_keeping_initial_state
+    partitions = [{"partition_field": index} for index in range(5)]
+    mocked_partition_router.stream_slices.return_value = [
+        StreamSlice(partition=partition, cursor_slice={}) for partition in partitions
+    ]
+    mocked_partition_router.get_stream_state.return_value = {}
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_partitions_in_memory=2)
+    cursor.set_initial_state(
+        {
+            "states": [
+                {"partition": partition, "cursor": {CURSOR_STATE_KEY: index}}
+                for index, partition in enumerate(partitions)
+            ]
+        }
+    )
+    # The cursors of the partitions in the state are only created when they are read
+    assert cursor_factory.create.call_count == 0
+
+    slices = list(cursor.stream_slices())
+    for stream_slice in slices:
+        cursor.close_slice(stream_slice)
+
+    assert len(slices) == 5
+    assert len(cursor._cursor_per_partition._cursors) == 2
+    assert not cursor.limit_reached()
+    assert cursor.get_stream_state()["states"] == [
+        {"partition": partition, "cursor": {CURSOR_STATE_KEY: index}}
+        for index, partition in enumerate(partitions)
+    ]
@@ -3,9 +3,14 @@
 #
 
 import datetime
+import logging
+import time
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk import StreamSlice
+from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from freezegun import freeze_time
 from jinja2.exceptions import TemplateSyntaxError
@@ -347,3 +352,115 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+_A_RECORD = {
+    "id": 7,
+    "items": ["1", 2],
+    "amount": 2.5,
+    "numeric_string": "42",
+    "name": "a name",
+    "empty": "",
+    "nothing": None,
+    "is_active": True,
+    "nested": {"key": [1]},
+}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "a static string",
+        "123",
+        "007",
+        " 12",
+        "b'bytes'",
+        "[1, 2]",
+        "True",
+        "None",
+        "{{ config.name }}",
+        "{{ config['name'] }}",
+        "{{ config.missing }}",
+        "{{ config.missing.nested }}",
+        "{{ record.id }}",
+        "{{ record['items'][0] }}",
+        "{{ record.amount }}",
+        "{{ record.numeric_string }}",
+        "{{ record.name }}",
+        "{{ record.empty }}",
+        "{{ record.nothing }}",
+        "{{ record.is_active }}",
+        "{{ record.nested }}",
+        "{{ stream_interval.start_time }}",
+        "{{ stream_partition['parent_id'] }}",
+        "{{ stream_slice._partition }}",
+    ],
+)
+@pytest.mark.parametrize("default", [None, "default", "{{ config.name }}"])
+@pytest.mark.parametrize("valid_types", [None, (str,), (int,)])
+def test_given_template_without_expression_when_eval_then_return_same_value_as_rendered_template(
+    template, default, valid_types
+):
+    config = {"name": "airbyte"}
+    parameters = {
+        "record": _A_RECORD,
+        "stream_slice": StreamSlice(
+            partition={"parent_id": 3}, cursor_slice={"start_time": "2024-01-01"}
+        ),
+    }
+
+    value = JinjaInterpolation().eval(template, config, default, valid_types, **parameters)
+    with patch.object(JinjaInterpolation, "_get_fast_path", return_value=None):
+        rendered_value = JinjaInterpolation().eval(
+            template, config, default, valid_types, **parameters
+        )
+
+    assert value == rendered_value
+    assert type(value) is type(rendered_value)
+
+
+def test_given_lookup_of_undeclared_variable_when_eval_then_raise():
+    with pytest.raises(ValueError):
+        JinjaInterpolation().eval("{{ record.id }}", {})
+
+
+def test_given_static_string_evaluated_to_a_list_when_eval_then_return_a_new_list_every_time():
+    interpolation = JinjaInterpolation()
+
+    first_value = interpolation.eval("[1, 2]", {})
+    first_value.append(3)
+
+    assert interpolation.eval("[1, 2]", {}) == [1, 2]
+
+
+@pytest.mark.slow
+def test_per_record_interpolation_performance():
+    """
+    Typical per-record interpolations: AddFields with a static value and with a lookup, and a RecordFilter condition.
+    """
+    config = {"account_id": "1234"}
+    records = [dict(_A_RECORD, id=i) for i in range(20_000)]
+
+    def _microseconds_per_record() -> float:
+        static_field = InterpolatedString.create("static value", parameters={})
+        lookup_field = InterpolatedString.create("{{ record['nested'] }}", parameters={})
+        account_field = InterpolatedString.create("{{ config.account_id }}", parameters={})
+        condition = InterpolatedBoolean(
+            condition="{{ record.id > 10 and record.is_active }}", parameters={}
+        )
+        start = time.perf_counter()
+        for record in records:
+            static_field.eval(config, record=record)
+            lookup_field.eval(config, record=record)
+            account_field.eval(config, record=record)
+            condition.eval(config, record=record)
+        return (time.perf_counter() - start) / len(records) * 1_000_000
+
+    with_fast_path = _microseconds_per_record()
+    with patch.object(JinjaInterpolation, "_get_fast_path", return_value=None):
+        rendering_every_template = _microseconds_per_record()
+
+    logging.getLogger(__name__).info(
+        f"Interpolation per record: {with_fast_path:.1f}us with fast path, {rendering_every_template:.1f}us rendering every template"
+    )
+    assert with_fast_path < rendering_every_template
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gc
+import weakref
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
+from airbyte_cdk.sources.declarative.interpolation.template_cache import TemplateCache
+
+
+def test_given_key_already_computed_when_get_then_return_cached_value_and_count_hit():
+    cache: TemplateCache[str] = TemplateCache(max_size=2)
+    compute = Mock(side_effect=lambda key: key.upper())
+
+    assert cache.get("a", compute) == "A"
+    assert cache.get("a", compute) == "A"
+
+    compute.assert_called_once_with("a")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_given_max_size_reached_when_get_then_evict_least_recently_used_entry():
+    cache: TemplateCache[str] = TemplateCache(max_size=2)
+    cache.get("a", str.upper)
+    cache.get("b", str.upper)
+    cache.get("a", str.upper)
+
+    cache.get("c", str.upper)
+
+    assert len(cache) == 2
+    compute = Mock(side_effect=str.upper)
+    cache.get("a", compute)
+    cache.get("b", compute)
+    compute.assert_called_once_with("b")
+
+
+def test_given_compute_raises_when_get_then_propagate_and_do_not_cache():
+    cache: TemplateCache[str] = TemplateCache(max_size=2)
+
+    with pytest.raises(ValueError):
+        cache.get("a", Mock(side_effect=ValueError()))
+
+    assert len(cache) == 0
+
+
+def test_when_clear_then_remove_entries_and_reset_counters():
+    cache: TemplateCache[str] = TemplateCache(max_size=2)
+    cache.get("a", str.upper)
+    cache.get("a", str.upper)
+
+    cache.clear()
+
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_given_many_interpolations_of_the_same_template_when_eval_then_compile_template_once():
+    JinjaInterpolation.template_cache.clear()
+    template = "{{ config['a'] ~ config['b'] }}"
+
+    for _ in range(10):
+        assert InterpolatedString.create(template, parameters={}).eval({"a": "x", "b": "y"}) == "xy"
+
+    assert JinjaInterpolation.template_cache.misses == 1
+    assert len(JinjaInterpolation.template_cache) == 1
+
+
+def test_when_eval_then_interpolation_instance_can_be_garbage_collected():
+    interpolation = JinjaInterpolation()
+    interpolation.eval("{{ config['a'] ~ 'b' }}", {"a": "a"})
+    reference = weakref.ref(interpolation)
+
+    del interpolation
+    gc.collect()
+
+    assert reference() is None
@@ -24,7 +24,11 @@ from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders import (
+    JsonDecoder,
+    PaginationDecoderDecorator,
+    StreamingJsonDecoder,
+)
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_filter import (
     ClientSideIncrementalRecordFilterDecorator,
@@ -36,6 +40,7 @@ from airbyte_cdk.sources.declarative.incremental import (
     PerPartitionWithGlobalCursor,
     ResumableFullRefreshCursor,
 )
+from airbyte_cdk.sources.declarative.incremental.partition_state_store import PartitionStateStore
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.models import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models import (
@@ -251,6 +256,7 @@ concurrency_level:
   type: ConcurrencyLevel
   default_concurrency: "{{ config['num_workers'] or 10 }}"
   max_concurrency: 25
+  max_queue_size_in_bytes: 1048576
 spec:
   type: Spec
   documentation_url: https://airbyte.com/#yaml-from-manifest
@@ -416,6 +422,7 @@ spec:
     assert isinstance(concurrency_level._default_concurrency, InterpolatedString)
     assert concurrency_level._default_concurrency.string == "{{ config['num_workers'] or 10 }}"
     assert concurrency_level.max_concurrency == 25
+    assert concurrency_level.max_queue_size_in_bytes == 1048576
 
 
 def test_interpolate_config():
@@ -680,6 +687,128 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].request_option is None
 
 
+@pytest.mark.parametrize(
+    "disable_cache, expect_parent_record_cache",
+    [
+        pytest.param(False, True, id="test_parent_record_cache_shared_by_routers"),
+        pytest.param(True, False, id="test_no_parent_record_cache_if_cache_is_disabled"),
+    ],
+)
+def test_given_same_parent_stream_when_create_substream_partition_routers_then_share_parent_partitions(
+    disable_cache, expect_parent_record_cache
+):
+    content = """
+    parent_stream:
+      type: DeclarativeStream
+      name: "parent"
+      primary_key: "id"
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: HttpRequester
+          url_base: "https://airbyte.io"
+          path: "parents"
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: []
+      schema_loader:
+        type: InlineSchemaLoader
+        schema: {}
+    first_partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/parent_stream"
+          parent_key: id
+          partition_field: parent_id
+    second_partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/parent_stream"
+          parent_key: id
+          partition_field: other_parent_id
+        - stream: "#/parent_stream"
+          parent_key: other_id
+          partition_field: other_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    connector_factory = ModelToComponentFactory(disable_cache=disable_cache)
+
+    first_router, second_router = [
+        connector_factory.create_component(
+            model_type=SubstreamPartitionRouterModel,
+            component_definition=transformer.propagate_types_and_parameters(
+                "", resolved_manifest[router_name], {}
+            ),
+            config=input_config,
+        )
+        for router_name in ("first_partition_router", "second_partition_router")
+    ]
+
+    assert (first_router.parent_record_cache is not None) == expect_parent_record_cache
+    assert first_router.parent_record_cache is second_router.parent_record_cache
+    first_key = first_router.parent_stream_configs[0].cache_key
+    # The partition field is not part of the key as the cached partitions don't depend on it
+    assert second_router.parent_stream_configs[0].cache_key == first_key
+    assert second_router.parent_stream_configs[1].cache_key != first_key
+
+
+def test_given_parent_stream_concurrency_level_when_create_substream_partition_router_then_create_parent_streams_without_cursor():
+    content = """
+    parent_stream:
+      type: DeclarativeStream
+      name: "parent"
+      primary_key: "id"
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: HttpRequester
+          url_base: "https://airbyte.io"
+          path: "parents"
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: []
+        paginator:
+          type: DefaultPaginator
+          pagination_strategy:
+            type: PageIncrement
+            page_size: 10
+      schema_loader:
+        type: InlineSchemaLoader
+        schema: {}
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/parent_stream"
+          parent_key: id
+          partition_field: parent_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    connector_factory = ModelToComponentFactory()
+    connector_factory.set_parent_stream_concurrency_level(4)
+
+    partition_router = connector_factory.create_component(
+        model_type=SubstreamPartitionRouterModel,
+        component_definition=transformer.propagate_types_and_parameters(
+            "", resolved_manifest["partition_router"], {}
+        ),
+        config=input_config,
+    )
+
+    assert partition_router.parent_stream_concurrency_level == 4
+    parent_stream_config = partition_router.parent_stream_configs[0]
+    assert isinstance(parent_stream_config.stream.retriever.cursor, ResumableFullRefreshCursor)
+    parent_stream = parent_stream_config.stream_factory()
+    assert isinstance(parent_stream, DeclarativeStream)
+    assert parent_stream is not parent_stream_config.stream
+    assert parent_stream.retriever.cursor is None
+
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -2513,6 +2642,43 @@ def test_merge_incremental_and_partition_router(incremental, partition_router, e
         assert len(stream.retriever.stream_slicer.stream_slicerS) == len(partition_router)
 
 
+def test_given_max_partitions_in_memory_when_create_partitioned_stream_then_keep_partition_states_in_store():
+    stream_model = {
+        "type": "DeclarativeStream",
+        "incremental_sync": {
+            "type": "DatetimeBasedCursor",
+            "datetime_format": "%Y-%m-%dT%H:%M:%S.%f%z",
+            "start_datetime": "{{ config['start_time'] }}",
+            "cursor_field": "created",
+        },
+        "retriever": {
+            "type": "SimpleRetriever",
+            "record_selector": {
+                "type": "RecordSelector",
+                "extractor": {"type": "DpathExtractor", "field_path": []},
+            },
+            "requester": {
+                "type": "HttpRequester",
+                "name": "list",
+                "url_base": "orange.com",
+                "path": "/v1/api",
+            },
+            "partition_router": {
+                "type": "ListPartitionRouter",
+                "values": "{{config['repos']}}",
+                "cursor_field": "a_key",
+            },
+        },
+    }
+
+    stream = ModelToComponentFactory(max_partitions_in_memory=100).create_component(
+        model_type=DeclarativeStreamModel, component_definition=stream_model, config=input_config
+    )
+
+    per_partition_cursor = stream.retriever.stream_slicer._per_partition_cursor
+    assert isinstance(per_partition_cursor._cursor_per_partition, PartitionStateStore)
+
+
 def test_simple_retriever_emit_log_messages():
     simple_retriever_model = {
         "type": "SimpleRetriever",
@@ -2546,6 +2712,39 @@ def test_simple_retriever_emit_log_messages():
     assert connector_builder_factory._message_repository._log_level == Level.DEBUG
 
 
+def test_simple_retriever_with_streaming_json_decoder():
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "decoder": {"type": "StreamingJsonDecoder"},
+        "record_selector": {
+            "type": "RecordSelector",
+            "extractor": {
+                "type": "DpathExtractor",
+                "field_path": ["data"],
+            },
+        },
+        "requester": {
+            "type": "HttpRequester",
+            "name": "list",
+            "url_base": "orange.com",
+            "path": "/v1/api",
+        },
+    }
+
+    retriever = factory.create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert isinstance(retriever.record_selector.extractor.decoder, StreamingJsonDecoder)
+    assert retriever.requester.decoder.is_stream_response()
+
+
 def test_create_page_increment():
     model = PageIncrementModel(
         type="PageIncrement",
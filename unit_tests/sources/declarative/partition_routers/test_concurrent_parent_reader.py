@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+
+import pytest
+from airbyte_cdk.sources.declarative.partition_routers.concurrent_parent_reader import (
+    ConcurrentParentReader,
+)
+
+
+def _reader(items):
+    return lambda: iter(items)
+
+
+def test_when_read_then_yield_items_of_each_reader_in_order():
+    readers = [_reader([f"{reader}_{item}" for item in range(100)]) for reader in range(5)]
+
+    items = list(ConcurrentParentReader(max_workers=3, max_queue_size=10).read(readers))
+
+    assert sorted(items) == sorted(f"{reader}_{item}" for reader in range(5) for item in range(100))
+    for reader in range(5):
+        assert [item for item in items if item.startswith(f"{reader}_")] == [
+            f"{reader}_{item}" for item in range(100)
+        ]
+
+
+def test_given_slow_reader_when_read_then_yield_items_of_other_readers_first():
+    slow_reader_started = threading.Event()
+    fast_reader_done = threading.Event()
+
+    def _slow_reader():
+        slow_reader_started.set()
+        fast_reader_done.wait(timeout=5)
+        yield "slow"
+
+    def _fast_reader():
+        slow_reader_started.wait(timeout=5)
+        yield "fast"
+
+    items = ConcurrentParentReader(max_workers=2).read([_slow_reader, _fast_reader])
+
+    assert next(items) == "fast"
+    fast_reader_done.set()
+    assert list(items) == ["slow"]
+
+
+def test_given_reader_raises_when_read_then_raise():
+    def _failing_reader():
+        yield 1
+        raise ValueError("the parent stream failed")
+
+    with pytest.raises(ValueError):
+        list(ConcurrentParentReader(max_workers=2).read([_reader([2, 3]), _failing_reader]))
+
+
+def test_given_consumer_stops_when_read_then_readers_stop():
+    closed = threading.Event()
+
+    def _endless_reader():
+        try:
+            while True:
+                yield "item"
+        finally:
+            closed.set()
+
+    items = ConcurrentParentReader(max_workers=1, max_queue_size=1).read([_endless_reader])
+    assert next(items) == "item"
+    items.close()
+
+    assert closed.wait(timeout=5)
+
+
+def test_when_read_then_take_readers_as_threads_are_available():
+    readers_taken = []
+
+    def _readers():
+        for reader in range(4):
+            readers_taken.append(reader)
+            yield _reader([reader])
+
+    items = ConcurrentParentReader(max_workers=2).read(_readers())
+    first_item = next(items)
+
+    assert readers_taken == [0, 1]
+    assert sorted([first_item, *items]) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_given_invalid_max_workers_then_raise(max_workers):
+    with pytest.raises(ValueError):
+        ConcurrentParentReader(max_workers=max_workers)
@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
+
+_PARTITIONS = [(index, {"slice": index % 3}, {"name": f"name{index}"}) for index in range(2500)]
+
+
+def _read_partitions(partitions):
+    read_partitions = Mock()
+    read_partitions.side_effect = lambda: iter(partitions)
+    return read_partitions
+
+
+@pytest.mark.parametrize(
+    "max_partitions_in_memory",
+    [
+        pytest.param(10_000, id="test_all_partitions_in_memory"),
+        pytest.param(0, id="test_all_partitions_in_temporary_file"),
+        pytest.param(1_200, id="test_partitions_in_memory_and_temporary_file"),
+    ],
+)
+def test_given_partitions_read_when_read_through_again_then_return_cached_partitions(
+    max_partitions_in_memory,
+):
+    cache = ParentRecordCache(max_partitions_in_memory=max_partitions_in_memory)
+    read_partitions = _read_partitions(_PARTITIONS)
+
+    assert list(cache.read_through("parent", read_partitions)) == _PARTITIONS
+    assert list(cache.read_through("parent", read_partitions)) == _PARTITIONS
+    assert read_partitions.call_count == 1
+
+
+def test_given_other_key_when_read_through_then_read_partitions():
+    cache = ParentRecordCache()
+    list(cache.read_through("parent", _read_partitions(_PARTITIONS)))
+    other_read_partitions = _read_partitions(_PARTITIONS[:1])
+
+    assert list(cache.read_through("other_parent", other_read_partitions)) == _PARTITIONS[:1]
+    assert other_read_partitions.call_count == 1
+
+
+def test_given_partitions_partially_read_when_read_through_again_then_read_partitions_again():
+    cache = ParentRecordCache()
+    read_partitions = _read_partitions(_PARTITIONS)
+
+    partitions = iter(cache.read_through("parent", read_partitions))
+    next(partitions)
+    partitions.close()
+
+    assert list(cache.read_through("parent", read_partitions)) == _PARTITIONS
+    assert read_partitions.call_count == 2
+
+
+def test_given_read_fails_when_read_through_again_then_read_partitions_again():
+    cache = ParentRecordCache()
+
+    def _failing_read():
+        yield _PARTITIONS[0]
+        raise ValueError("the parent stream failed")
+
+    with pytest.raises(ValueError):
+        list(cache.read_through("parent", _failing_read))
+
+    read_partitions = _read_partitions(_PARTITIONS)
+    assert list(cache.read_through("parent", read_partitions)) == _PARTITIONS
+    assert read_partitions.call_count == 1
+
+
+def test_given_partitions_that_cannot_be_pickled_when_read_through_then_do_not_cache():
+    cache = ParentRecordCache(max_partitions_in_memory=0)
+    partitions = [(threading.Lock(), {}, {})] * 1000
+    read_partitions = _read_partitions(partitions)
+
+    assert list(cache.read_through("parent", read_partitions)) == partitions
+    assert list(cache.read_through("parent", read_partitions)) == partitions
+    assert read_partitions.call_count == 2
+
+
+def test_when_clear_then_read_partitions_again():
+    cache = ParentRecordCache(max_partitions_in_memory=0)
+    read_partitions = _read_partitions(_PARTITIONS)
+    list(cache.read_through("parent", read_partitions))
+
+    cache.clear()
+
+    assert list(cache.read_through("parent", read_partitions)) == _PARTITIONS
+    assert read_partitions.call_count == 2
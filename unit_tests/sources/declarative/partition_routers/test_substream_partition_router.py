@@ -23,6 +23,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     CartesianProductStreamSlicer,
     ListPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
     SubstreamPartitionRouter,
@@ -1109,6 +1112,106 @@ def test_substream_partition_router_with_extra_keys(parent_stream_configs, expec
     assert slices == expected_slices
 
 
+@pytest.mark.parametrize(
+    "incremental_dependency, expected_second_parent_ids",
+    [
+        pytest.param(False, [1, 2], id="test_partitions_read_from_the_cache"),
+        pytest.param(True, [3], id="test_incremental_dependency_reads_the_parent_stream"),
+    ],
+)
+def test_given_parent_record_cache_when_stream_slices_then_share_parent_partitions(
+    incremental_dependency, expected_second_parent_ids
+):
+    parent_record_cache = ParentRecordCache()
+
+    def _partition_router(records, partition_field):
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=MockStream([{}], records, "first_stream"),
+                    parent_key="id",
+                    partition_field=partition_field,
+                    extra_fields=[["field_1"]],
+                    incremental_dependency=incremental_dependency,
+                    cache_key="first_stream_key",
+                    parameters={},
+                    config={},
+                )
+            ],
+            parameters={},
+            config={},
+            parent_record_cache=parent_record_cache,
+        )
+
+    first_router = _partition_router(
+        [{"id": 1, "field_1": "value_1"}, {"id": 2, "field_1": "value_2"}], "first_stream_id"
+    )
+    # Records that would only be read if the partitions are not taken from the cache
+    second_router = _partition_router([{"id": 3, "field_1": "value_3"}], "parent_id")
+
+    assert [s["first_stream_id"] for s in first_router.stream_slices()] == [1, 2]
+    second_slices = list(second_router.stream_slices())
+    assert [s["parent_id"] for s in second_slices] == expected_second_parent_ids
+    assert [s.extra_fields["field_1"] for s in second_slices] == [
+        f"value_{parent_id}" for parent_id in expected_second_parent_ids
+    ]
+
+
+@pytest.mark.parametrize(
+    "incremental_dependency, expected_parent_streams_created",
+    [
+        pytest.param(False, 3, id="test_parent_slices_read_concurrently"),
+        pytest.param(True, 0, id="test_incremental_dependency_reads_parent_slices_in_order"),
+    ],
+)
+def test_given_parent_stream_concurrency_level_when_stream_slices_then_read_all_parent_slices(
+    incremental_dependency, expected_parent_streams_created
+):
+    parent_streams_created = []
+
+    def _create_parent_stream():
+        parent_streams_created.append(MockStream(parent_slices, all_parent_data, "first_stream"))
+        return parent_streams_created[-1]
+
+    parent_stream_configs = [
+        ParentStreamConfig(
+            stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+            parent_key="id",
+            partition_field="first_stream_id",
+            incremental_dependency=incremental_dependency,
+            stream_factory=_create_parent_stream,
+            parameters={},
+            config={},
+        ),
+        ParentStreamConfig(
+            stream=MockStream(second_parent_stream_slice, more_records, "second_stream"),
+            parent_key="id",
+            partition_field="second_stream_id",
+            parameters={},
+            config={},
+        ),
+    ]
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=parent_stream_configs,
+        parameters={},
+        config={},
+        parent_stream_concurrency_level=4,
+    )
+
+    slices = [dict(s) for s in partition_router.stream_slices()]
+
+    expected_slices = [
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+        {"second_stream_id": 10, "parent_slice": {"slice": "second_parent"}},
+        {"second_stream_id": 20, "parent_slice": {"slice": "second_parent"}},
+    ]
+    assert sorted(slices, key=str) == sorted(expected_slices, key=str)
+    # One instance of the parent stream per slice read at the same time
+    assert len(parent_streams_created) == expected_parent_streams_created
+
+
 @pytest.mark.parametrize(
     "stream_slicers, expect_warning",
     [
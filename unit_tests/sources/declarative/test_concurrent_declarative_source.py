@@ -1201,6 +1201,43 @@ def test_default_perform_interpolation_on_concurrency_level():
     )  # We floor the number of initial partitions on creation
 
 
+def test_given_concurrency_level_when_create_source_then_requesters_share_connection_pool_sized_by_concurrency():
+    config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": 20}
+
+    source = ConcurrentDeclarativeSource(
+        source_config=_MANIFEST, config=config, catalog=None, state=[]
+    )
+
+    streams = source.streams(config)
+    # party_members_skills is partitioned by the records of its party_members parent stream
+    partition_router = next(
+        stream for stream in streams if stream.name == "party_members_skills"
+    ).retriever.stream_slicer._partition_router
+    parent_streams = [
+        parent_stream_config.stream
+        for parent_stream_config in partition_router.parent_stream_configs
+    ]
+    adapters = {
+        id(stream.retriever.requester._http_client._session.adapters["https://"])
+        for stream in streams + parent_streams
+    }
+    assert len(adapters) == 1
+    assert source._constructor.get_connection_pool().pool_size == 20
+
+
+def test_given_concurrency_level_when_create_source_then_substreams_read_parent_slices_concurrently():
+    config = {"start_date": "2024-07-01T00:00:00.000Z", "num_workers": 20}
+
+    source = ConcurrentDeclarativeSource(
+        source_config=_MANIFEST, config=config, catalog=None, state=[]
+    )
+
+    partition_router = next(
+        stream for stream in source.streams(config) if stream.name == "party_members_skills"
+    ).retriever.stream_slicer._partition_router
+    assert partition_router.parent_stream_concurrency_level == 20
+
+
 def test_default_to_single_threaded_when_no_concurrency_level():
     catalog = ConfiguredAirbyteCatalog(
         streams=[
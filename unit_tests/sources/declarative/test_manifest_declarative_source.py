@@ -27,6 +27,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.partition_routers import SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from jsonschema.exceptions import ValidationError
 
@@ -1710,6 +1711,78 @@ def test_only_parent_streams_use_cache():
     assert not streams[2].retriever.requester.use_cache
 
 
+def test_parent_records_are_read_again_by_each_read(requests_mock):
+    parent_stream = {
+        "type": "DeclarativeStream",
+        "$parameters": {"name": "parents", "primary_key": "id", "url_base": "https://api.test/"},
+        "schema_loader": {"type": "InlineSchemaLoader", "schema": {}},
+        "retriever": {
+            "requester": {"path": "parents"},
+            "record_selector": {"extractor": {"type": "DpathExtractor", "field_path": []}},
+        },
+    }
+    manifest = {
+        "version": "0.29.3",
+        "definitions": {},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {
+                    "name": "children",
+                    "primary_key": "id",
+                    "url_base": "https://api.test/",
+                },
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {}},
+                "retriever": {
+                    "requester": {"path": "parents/{{ stream_partition.parent_id }}/children"},
+                    "record_selector": {"extractor": {"type": "DpathExtractor", "field_path": []}},
+                    "partition_router": {
+                        "type": "SubstreamPartitionRouter",
+                        "parent_stream_configs": [
+                            {
+                                "parent_key": "id",
+                                "partition_field": "parent_id",
+                                "stream": parent_stream,
+                            }
+                        ],
+                    },
+                },
+            },
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["children"]},
+    }
+    requests_mock.get("https://api.test/parents", json=[{"id": 1}])
+    requests_mock.get("https://api.test/parents/1/children", json=[{"id": 10}])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="children", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    source = ManifestDeclarativeSource(source_config=manifest)
+
+    with patch.object(
+        SubstreamPartitionRouter,
+        "_read_parent_records",
+        autospec=True,
+        side_effect=SubstreamPartitionRouter._read_parent_records,
+    ) as read_parent_records:
+        for _ in range(2):
+            records = [
+                message.record.data
+                for message in source.read(logger, {}, catalog, {})
+                if message.record
+            ]
+            assert records == [{"id": 10}]
+
+    assert read_parent_records.call_count == 2
+
+
 def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMessage]:
     source = ManifestDeclarativeSource(source_config=manifest)
     catalog = ConfiguredAirbyteCatalog(
@@ -3,11 +3,16 @@
 #
 
 import datetime
+import io
 import uuid
+from unittest.mock import Mock
 
+import fastavro
 import pytest
 from airbyte_cdk.sources.file_based.config.avro_format import AvroFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.file_types import AvroParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 _default_avro_format = AvroFormat()
 _double_as_string_avro_format = AvroFormat(double_as_string=True)
@@ -387,3 +392,35 @@ def test_convert_primitive_avro_type_to_json(
 def test_to_output_value(avro_format, record_type, record_value, expected_value):
     parser = AvroParser()
     assert parser._to_output_value(avro_format, record_type, record_value) == expected_value
+
+
+def test_given_selected_fields_when_parse_records_then_only_output_selected_fields():
+    schema = {
+        "type": "record",
+        "name": "record",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {"name": "name", "type": "string"},
+            {"name": "amount", "type": "double"},
+        ],
+    }
+    content = io.BytesIO()
+    fastavro.writer(
+        content,
+        fastavro.parse_schema(schema),
+        [{"id": 1, "name": "a", "amount": 1.5}, {"id": 2, "name": "b", "amount": 2.5}],
+    )
+    content.seek(0)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=content)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", format=_double_as_string_avro_format
+    )
+    file = RemoteFile(uri="s3://bucket/file.avro", last_modified=datetime.datetime.now())
+
+    records = AvroParser().parse_records(
+        config, file, stream_reader, Mock(), None, selected_fields={"id", "amount"}
+    )
+
+    assert list(records) == [{"id": 1, "amount": "1.5"}, {"id": 2, "amount": "2.5"}]
@@ -6,9 +6,10 @@ import asyncio
 import csv
 import io
 import logging
+import time
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -17,6 +18,7 @@ from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import (
     DEFAULT_FALSE_VALUES,
     DEFAULT_TRUE_VALUES,
+    CsvEngine,
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
@@ -657,13 +659,49 @@ class CsvReaderTest(unittest.TestCase):
         assert "encoding" in ate.value.message
         assert self._csv_reader._get_headers.called
 
-    def _read_data(self) -> Generator[Dict[str, str], None, None]:
+    def test_given_selected_fields_when_read_data_then_only_return_selected_columns(
+        self,
+    ) -> None:
+        self._stream_reader.open_file.return_value = (
+            CsvFileBuilder()
+            .with_data(
+                [
+                    "header1, header2,header3,header1",
+                    "value1,value2,value3,value4",
+                    "",
+                    "value5,value6,value7,value8",
+                ]
+            )
+            .build()
+        )
+
+        data_generator = self._read_data(selected_fields={"header1", "header2"})
+
+        assert list(data_generator) == [
+            {"header1": "value4", " header2": "value2"},
+            {"header1": "value8", " header2": "value6"},
+        ]
+
+    def test_given_selected_fields_and_too_few_values_for_unselected_columns_when_read_data_then_raise_exception(
+        self,
+    ) -> None:
+        self._stream_reader.open_file.return_value = (
+            CsvFileBuilder().with_data(["header1,header2,header3", "value1,value2"]).build()
+        )
+
+        with pytest.raises(RecordParseError):
+            list(self._read_data(selected_fields={"header1"}))
+
+    def _read_data(
+        self, selected_fields: Optional[Set[str]] = None
+    ) -> Generator[Dict[str, str], None, None]:
         data_generator = self._csv_reader.read_data(
             self._config,
             self._file,
             self._stream_reader,
             self._logger,
             FileReadMode.READ,
+            selected_fields,
         )
         return data_generator
 
@@ -680,6 +718,7 @@ _TOO_FEW_VALUES = [
 ]
 
 
+@pytest.mark.parametrize("selected_fields", [None, {"header", "header1"}])
 @pytest.mark.parametrize(
     "ignore_errors_on_fields_mismatch, data, error_message",
     [
@@ -706,7 +745,7 @@ _TOO_FEW_VALUES = [
     ],
 )
 def test_mismatch_between_values_and_header(
-    ignore_errors_on_fields_mismatch, data, error_message
+    ignore_errors_on_fields_mismatch, data, error_message, selected_fields
 ) -> None:
     config_format = CsvFormat()
     config = Mock()
@@ -727,6 +766,7 @@ def test_mismatch_between_values_and_header(
         stream_reader,
         logger,
         FileReadMode.READ,
+        selected_fields,
     )
 
     # Check if exception is raised only when skip_wrong_number_of_fields_error is False
@@ -784,3 +824,277 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_ALL_TYPES_SCHEMA = {
+    "properties": {
+        "col_null": {"type": "null"},
+        "col_boolean": {"type": ["null", "boolean"]},
+        "col_integer": {"type": "integer"},
+        "col_number": {"type": "number"},
+        "col_string": {"type": "string"},
+        "col_object": {"type": "object"},
+        "col_array": {"type": "array"},
+    }
+}
+_ALL_TYPES_DATA = "\n".join(
+    [
+        "col_null,col_boolean,col_integer,col_number,col_string,col_object,col_array,col_not_in_schema",
+        ',true,1,1.5,a string,"{""a"": 1}","[1, 2]",x',
+        'not null,no,-0,-0,"a ""quoted""\nstring",{},[],x',
+        ",maybe, 12 ,1e5,NA,not json,[,x",
+        ",0,1_000,.5,,[1],{},x",
+        ",,99999999999999999999,inf,,,,x",
+        ",1,,1e400,,,,x",
+        "NA,NA,NA,NA,NA,NA,NA,NA",
+    ]
+)
+
+
+def _parse_records_with_engine(
+    engine: CsvEngine,
+    data: str,
+    discovered_schema: Optional[Mapping[str, Any]],
+    selected_fields: Optional[Set[str]] = None,
+    schemaless: bool = False,
+    **format_options: Any,
+) -> Tuple[List[Any], List[Any]]:
+    config_format = CsvFormat(engine=engine, **format_options)
+    config = FileBasedStreamConfig(
+        name="test",
+        validation_policy="Emit Record",
+        file_type="csv",
+        format=config_format,
+        schemaless=schemaless,
+    )
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data.encode(config_format.encoding))
+        if mode == FileReadMode.READ_BINARY
+        else io.StringIO(data)
+    )
+    file = RemoteFile(uri="a uri", last_modified=datetime.now())
+    engine_logger = Mock(spec=logging.Logger)
+    records = list(
+        CsvParser().parse_records(
+            config, file, stream_reader, engine_logger, discovered_schema, selected_fields
+        )
+    )
+    return records, engine_logger.warning.call_args_list
+
+
+def _iterate_records_with_engine(
+    engine: CsvEngine, data: str, selected_fields: Optional[Set[str]]
+) -> Iterable[Dict[str, Any]]:
+    config_format = CsvFormat(engine=engine)
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", file_type="csv", format=config_format
+    )
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data.encode("utf8")) if mode == FileReadMode.READ_BINARY else io.StringIO(data)
+    )
+    file = RemoteFile(uri="a uri", last_modified=datetime.now())
+    return CsvParser().parse_records(
+        config, file, stream_reader, Mock(spec=logging.Logger), None, selected_fields
+    )
+
+
+@pytest.mark.parametrize(
+    "data, discovered_schema, selected_fields, schemaless, format_options",
+    [
+        pytest.param(_ALL_TYPES_DATA, _ALL_TYPES_SCHEMA, None, False, {}, id="test_all_types"),
+        pytest.param(
+            _ALL_TYPES_DATA,
+            {
+                "properties": {
+                    key: value
+                    for key, value in _ALL_TYPES_SCHEMA["properties"].items()
+                    if key not in {"col_object", "col_array"}
+                }
+            },
+            None,
+            False,
+            {"null_values": {"NA", ""}, "strings_can_be_null": False},
+            id="test_null_values",
+        ),
+        pytest.param(
+            _ALL_TYPES_DATA,
+            _ALL_TYPES_SCHEMA,
+            {"col_integer", "col_string", "col_not_in_schema"},
+            False,
+            {},
+            id="test_selected_fields",
+        ),
+        pytest.param(_ALL_TYPES_DATA, _ALL_TYPES_SCHEMA, None, True, {}, id="test_schemaless"),
+        pytest.param(
+            _ALL_TYPES_DATA, None, None, False, {"null_values": {"NA"}}, id="test_no_schema"
+        ),
+        pytest.param(
+            _ALL_TYPES_DATA,
+            _ALL_TYPES_SCHEMA,
+            set(),
+            False,
+            {},
+            id="test_no_selected_field_in_the_file",
+        ),
+        pytest.param(
+            "header\na value\n\n   \nlast value\n",
+            {"properties": {"header": {"type": "string"}}},
+            None,
+            False,
+            {},
+            id="test_empty_lines",
+        ),
+        pytest.param(
+            "a,b,a\n1,2,3\n4,5,6",
+            {"properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}},
+            None,
+            False,
+            {},
+            id="test_duplicated_headers",
+        ),
+        pytest.param(
+            "a,b,a\n1,2,3\n4,5,6",
+            {"properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}},
+            {"a"},
+            False,
+            {},
+            id="test_selected_duplicated_headers",
+        ),
+        pytest.param(
+            "'a';'b'\n'x\\'y';'x\\;y'\n'multi\nline';z",
+            None,
+            None,
+            False,
+            {"delimiter": ";", "quote_char": "'", "escape_char": "\\", "double_quote": False},
+            id="test_dialect",
+        ),
+        pytest.param(
+            "skipped\nskipped\nskipped\n1,2\n3,4",
+            {"properties": {"f0": {"type": "integer"}, "f1": {"type": "string"}}},
+            None,
+            False,
+            {
+                "skip_rows_before_header": 2,
+                "skip_rows_after_header": 1,
+                "header_definition": CsvHeaderAutogenerated(),
+            },
+            id="test_autogenerated_headers_and_skipped_rows",
+        ),
+        pytest.param(
+            "1,2\n3,4",
+            {"properties": {"first": {"type": "integer"}, "second": {"type": "number"}}},
+            None,
+            False,
+            {"header_definition": CsvHeaderUserProvided(column_names=["first", "second"])},
+            id="test_user_provided_headers",
+        ),
+        pytest.param(
+            "h\u00e9ader\nval\u00fce",
+            None,
+            None,
+            False,
+            {"encoding": "latin-1"},
+            id="test_encoding",
+        ),
+        pytest.param("header", None, None, False, {}, id="test_no_rows"),
+        pytest.param(
+            "",
+            None,
+            None,
+            False,
+            {"header_definition": CsvHeaderUserProvided(column_names=["header"])},
+            id="test_empty_file",
+        ),
+    ],
+)
+def test_arrow_engine_parses_same_records_as_python_engine(
+    data, discovered_schema, selected_fields, schemaless, format_options
+) -> None:
+    expected = _parse_records_with_engine(
+        CsvEngine.PYTHON, data, discovered_schema, selected_fields, schemaless, **format_options
+    )
+
+    records_and_warnings = _parse_records_with_engine(
+        CsvEngine.ARROW, data, discovered_schema, selected_fields, schemaless, **format_options
+    )
+
+    assert records_and_warnings == expected
+
+
+@pytest.mark.parametrize(
+    "data, selected_fields",
+    [
+        pytest.param(_TOO_MANY_VALUES, None, id="test_too_many_values"),
+        pytest.param(_TOO_FEW_VALUES, None, id="test_too_few_values"),
+        pytest.param(["a,b"] + ["1,2"] * 5 + ["1,2,3"], None, id="test_valid_rows_before"),
+        pytest.param(["a,b"] + ["1,2"] * 5 + ["1,2,3"], {"b"}, id="test_selected_fields"),
+    ],
+)
+def test_given_mismatch_between_values_and_header_when_parse_records_with_arrow_engine_then_raise_same_error(
+    data, selected_fields
+) -> None:
+    results = []
+    for engine in [CsvEngine.PYTHON, CsvEngine.ARROW]:
+        records: List[Dict[str, Any]] = []
+        with pytest.raises(RecordParseError) as error:
+            records.extend(_iterate_records_with_engine(engine, "\n".join(data), selected_fields))
+        results.append((records, str(error.value), str(error.value.__cause__)))
+
+    assert results[0] == results[1]
+
+
+def test_given_ignored_mismatch_when_parse_records_with_arrow_then_use_python_engine() -> None:
+    data = "\n".join(_TOO_MANY_VALUES)
+
+    records, _ = _parse_records_with_engine(
+        CsvEngine.ARROW, data, None, ignore_errors_on_fields_mismatch=True
+    )
+
+    assert records == [{"header": "too many values", None: ["value", "value", "value"]}]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "number_of_columns, number_of_rows",
+    [pytest.param(4, 200_000, id="narrow"), pytest.param(100, 10_000, id="wide")],
+)
+def test_parse_records_performance_by_engine(number_of_columns, number_of_rows) -> None:
+    column_types = ["integer", "number", "boolean", "string"]
+    values_by_type = {
+        "integer": lambda row: str(row),
+        "number": lambda row: str(row / 100),
+        "boolean": lambda row: "true" if row % 2 else "false",
+        "string": lambda row: f"value {row % 1000}",
+    }
+    types = [column_types[column % len(column_types)] for column in range(number_of_columns)]
+    data = "\n".join(
+        [",".join(f"col{column}" for column in range(number_of_columns))]
+        + [
+            ",".join(values_by_type[column_type](row) for column_type in types)
+            for row in range(number_of_rows)
+        ]
+    )
+    discovered_schema = {
+        "properties": {
+            f"col{column}": {"type": ["null", column_type]}
+            for column, column_type in enumerate(types)
+        }
+    }
+
+    rows_per_second_by_engine = {}
+    records_by_engine = {}
+    for engine in [CsvEngine.PYTHON, CsvEngine.ARROW]:
+        start = time.perf_counter()
+        records_by_engine[engine], _ = _parse_records_with_engine(engine, data, discovered_schema)
+        rows_per_second_by_engine[engine] = number_of_rows / (time.perf_counter() - start)
+
+    logging.getLogger(__name__).info(
+        f"rows/sec with {number_of_columns} columns using the Python engine: {rows_per_second_by_engine[CsvEngine.PYTHON]:.0f}, "
+        f"the Arrow engine: {rows_per_second_by_engine[CsvEngine.ARROW]:.0f}"
+    )
+    assert records_by_engine[CsvEngine.ARROW] == records_by_engine[CsvEngine.PYTHON]
+    assert (
+        rows_per_second_by_engine[CsvEngine.ARROW] > rows_per_second_by_engine[CsvEngine.PYTHON] * 2
+    )
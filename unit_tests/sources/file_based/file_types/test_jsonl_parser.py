@@ -5,13 +5,14 @@
 import asyncio
 import io
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types import JsonlParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange
 
 JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS = [
     b'{"a": 1, "b": "1"}',
@@ -200,3 +201,65 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def _parse_records_by_range(content: bytes, range_size: int) -> List[List[Dict[str, Any]]]:
+    stream_reader = MagicMock(spec=AbstractFileBasedStreamReader)
+    stream_reader.file_size.return_value = len(content)
+    stream_reader.open_file.return_value.__enter__.side_effect = lambda: io.BytesIO(content)
+    parser = JsonlParser()
+    file_ranges = parser.get_file_ranges(Mock(), Mock(), stream_reader, Mock(), range_size)
+    assert file_ranges is not None
+    return [
+        list(parser.parse_records(Mock(), Mock(), stream_reader, Mock(), None, None, file_range))
+        for file_range in file_ranges
+    ]
+
+
+@pytest.mark.parametrize("range_size", [1, 2, 18, 19, 20, 25, 40])
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS * 3), id="test_lf"),
+        pytest.param(
+            b"\r\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS * 3) + b"\r\n", id="test_crlf"
+        ),
+        pytest.param(
+            b"\n\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS * 3) + b"\n\n",
+            id="test_empty_lines",
+        ),
+    ],
+)
+def test_given_file_ranges_when_parse_records_then_each_record_is_in_one_range(
+    content: bytes, range_size: int
+) -> None:
+    records_by_range = _parse_records_by_range(content, range_size)
+
+    assert len(records_by_range) == -(-len(content) // range_size)
+    assert [record for records in records_by_range for record in records] == [
+        {"a": 1, "b": "1"},
+        {"a": 2, "b": "2"},
+    ] * 3
+
+
+def test_given_file_smaller_than_range_size_when_get_file_ranges_then_do_not_split(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.file_size.return_value = 10
+
+    assert JsonlParser().get_file_ranges(Mock(), Mock(), stream_reader, Mock(), 10) is None
+
+
+def test_given_multiline_json_object_when_parse_file_range_then_raise_error(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(
+        b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS)
+    )
+
+    with pytest.raises(RecordParseError):
+        list(
+            JsonlParser().parse_records(
+                Mock(), Mock(), stream_reader, Mock(), None, None, FileRange(0, 10)
+            )
+        )
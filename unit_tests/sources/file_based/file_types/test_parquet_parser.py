@@ -4,11 +4,16 @@
 
 import asyncio
 import datetime
+import io
+import logging
 import math
-from typing import Any, Mapping, Union
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
@@ -18,6 +23,7 @@ from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
 from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
 from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
 from airbyte_cdk.sources.file_based.file_types import ParquetParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pyarrow import Scalar
 
@@ -516,3 +522,259 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
         asyncio.get_event_loop().run_until_complete(
             parser.infer_schema(config, file, stream_reader, logger)
         )
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    return buffer.getvalue()
+
+
+def _parse_records(
+    parser: ParquetParser,
+    content: bytes,
+    parquet_format: ParquetFormat,
+    uri: str,
+    selected_fields: Optional[Set[str]] = None,
+    file_range: Optional[FileRange] = None,
+) -> Iterator[Dict[str, Any]]:
+    config = FileBasedStreamConfig(
+        name="test.parquet",
+        format=parquet_format,
+        validation_policy=ValidationPolicy.emit_record,
+    )
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = lambda _: io.BytesIO(content)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    return parser.parse_records(
+        config, file, stream_reader, Mock(), None, selected_fields, file_range
+    )
+
+
+def _records_converted_value_by_value(
+    content: bytes, parquet_format: ParquetFormat
+) -> List[Dict[str, Any]]:
+    table = pq.read_table(io.BytesIO(content))
+    return [
+        {
+            column: ParquetParser._to_output_value(table.column(column)[row], parquet_format)
+            for column in table.column_names
+        }
+        for row in range(table.num_rows)
+    ]
+
+
+_A_TABLE_WITH_ALL_TYPES = pa.table(
+    {
+        "bool": pa.array([True, None, False, True, None], type=pa.bool_()),
+        "int64": pa.array([1, 2, None, -4, 5], type=pa.int64()),
+        "int64_not_null": pa.array([1, 2, 3, -4, 5], type=pa.int64()),
+        "uint8": pa.array([1, 2, 3, 4, 255], type=pa.uint8()),
+        "float32": pa.array([2.7, 1.0, 3.25, 0.0, -1.1], type=pa.float32()),
+        "float64": pa.array([1.5, None, 3.25, 0.0, -1.0], type=pa.float64()),
+        "large_string": pa.array(["a", None, "c", "", "e"], type=pa.large_string()),
+        "string": pa.array(["a", "é", None, "", "e"], type=pa.string()),
+        "binary": pa.array([b"a", None, b"c", b"", b"e"], type=pa.binary()),
+        "time": pa.array([datetime.time(1, 2, 3)] * 4 + [None], type=pa.time64("us")),
+        "timestamp": pa.array(
+            [datetime.datetime(2023, 7, 7, 10, 11, 12)] * 4 + [None], type=pa.timestamp("ms")
+        ),
+        "timestamp_tz": pa.array(
+            [datetime.datetime(2023, 7, 7, 10, 11, 12)] * 5, type=pa.timestamp("s", "utc")
+        ),
+        "timestamp_s": pa.array(
+            [datetime.datetime(2023, 7, 7, 10, 11, 12), None] * 2 + [None], type=pa.timestamp("s")
+        ),
+        "timestamp_us": pa.array(
+            [datetime.datetime(2023, 7, 7, 10, 11, 12, 345678)] * 5, type=pa.timestamp("us")
+        ),
+        "timestamp_ns": pa.array([1_000_000_001] * 5, type=pa.timestamp("ns")),
+        "date": pa.array([datetime.date(2023, 7, 7), None] * 2 + [None], type=pa.date32()),
+        "date64": pa.array([datetime.date(2023, 7, 7), None] * 2 + [None], type=pa.date64()),
+        "decimal": pa.array(
+            [Decimal("3.14"), None, Decimal("-1.00"), Decimal("0.01"), Decimal("2.50")],
+            type=pa.decimal128(5, 2),
+        ),
+        "duration": pa.array([datetime.timedelta(seconds=90)] * 4 + [None], type=pa.duration("ms")),
+        "list": pa.array([[1, 2], [], None, [3], [4, None]], type=pa.list_(pa.int32())),
+        "struct": pa.array(
+            [{"field": 1}, None, {"field": None}, {"field": 4}, {"field": 5}],
+            type=pa.struct([pa.field("field", pa.int32())]),
+        ),
+        "map": pa.array(
+            [[("hello", 1)], None, [], [("a", 1), ("b", 2)], [("world", 2)]],
+            type=pa.map_(pa.string(), pa.int32()),
+        ),
+        "dictionary": pa.array(["apple", "banana", None, "apple", "cherry"]).dictionary_encode(),
+        "null": pa.array([None] * 5, type=pa.null()),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "parquet_format", [_default_parquet_format, _decimal_as_float_parquet_format]
+)
+@pytest.mark.parametrize(
+    "row_group_size, batch_size",
+    [
+        pytest.param(5, ParquetParser.DEFAULT_BATCH_SIZE, id="test_one_batch"),
+        pytest.param(2, ParquetParser.DEFAULT_BATCH_SIZE, id="test_many_row_groups"),
+        pytest.param(4, 3, id="test_row_groups_larger_than_batches"),
+    ],
+)
+def test_parse_records_converts_values_like_each_value_is_converted(
+    parquet_format, row_group_size, batch_size
+) -> None:
+    content = _parquet_file(_A_TABLE_WITH_ALL_TYPES, row_group_size)
+
+    records = list(
+        _parse_records(
+            ParquetParser(batch_size=batch_size),
+            content,
+            parquet_format,
+            "s3://mybucket/test.parquet",
+        )
+    )
+
+    assert records == _records_converted_value_by_value(content, parquet_format)
+
+
+def test_given_partitioned_file_when_parse_records_then_add_partition_columns() -> None:
+    content = _parquet_file(pa.table({"id": [1, 2], "year": [2000, 2001]}), row_group_size=1)
+
+    records = list(
+        _parse_records(
+            ParquetParser(),
+            content,
+            _default_parquet_format,
+            "bucket/year=2024/month=01/test.parquet",
+        )
+    )
+
+    assert records == [
+        {"id": 1, "year": "2024", "month": "01"},
+        {"id": 2, "year": "2024", "month": "01"},
+    ]
+
+
+def test_given_selected_fields_when_parse_records_then_only_read_selected_columns() -> None:
+    content = _parquet_file(
+        pa.table({"id": [1, 2], "name": ["a", "b"], "struct": [{"a": 1}, {"a": 2}]}),
+        row_group_size=1,
+    )
+
+    records = list(
+        _parse_records(
+            ParquetParser(),
+            content,
+            _default_parquet_format,
+            "bucket/year=2024/month=01/test.parquet",
+            selected_fields={"id", "struct", "month", "not_in_file"},
+        )
+    )
+
+    assert records == [
+        {"id": 1, "struct": {"a": 1}, "month": "01"},
+        {"id": 2, "struct": {"a": 2}, "month": "01"},
+    ]
+
+
+def test_given_no_column_selected_when_parse_records_then_yield_a_record_per_row() -> None:
+    content = _parquet_file(pa.table({"id": [1, 2, 3]}), row_group_size=2)
+
+    records = list(
+        _parse_records(
+            ParquetParser(),
+            content,
+            _default_parquet_format,
+            "bucket/year=2024/test.parquet",
+            selected_fields={"year"},
+        )
+    )
+
+    assert records == [{"year": "2024"}] * 3
+
+
+def test_given_file_ranges_when_parse_records_then_each_row_group_is_read_once() -> None:
+    content = _parquet_file(pa.table({"id": list(range(1000))}), row_group_size=100)
+    row_group_size = len(content) // 10
+    stream_reader = Mock()
+    stream_reader.file_size.return_value = len(content)
+    stream_reader.open_file.return_value.__enter__ = lambda _: io.BytesIO(content)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    file_ranges = ParquetParser().get_file_ranges(
+        Mock(), Mock(), stream_reader, Mock(), range_size=row_group_size * 3
+    )
+
+    assert file_ranges is not None and len(file_ranges) > 1
+    assert file_ranges[0].start == 0 and file_ranges[-1].end == 10
+    assert all(
+        previous.end == current.start for previous, current in zip(file_ranges, file_ranges[1:])
+    )
+    records = [
+        record
+        for file_range in file_ranges
+        for record in _parse_records(
+            ParquetParser(),
+            content,
+            _default_parquet_format,
+            "s3://mybucket/test.parquet",
+            file_range=file_range,
+        )
+    ]
+    assert records == [{"id": i} for i in range(1000)]
+
+
+def test_given_single_row_group_when_get_file_ranges_then_do_not_split() -> None:
+    content = _parquet_file(pa.table({"id": list(range(1000))}), row_group_size=1000)
+    stream_reader = Mock()
+    stream_reader.file_size.return_value = len(content)
+    stream_reader.open_file.return_value.__enter__ = lambda _: io.BytesIO(content)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    assert ParquetParser().get_file_ranges(Mock(), Mock(), stream_reader, Mock(), 1) is None
+
+
+@pytest.mark.slow
+def test_parse_records_performance() -> None:
+    number_of_rows = 2_000_000
+    table = pa.table(
+        {
+            "id": pa.array(range(number_of_rows), type=pa.int64()),
+            "name": pa.array([f"name {i % 1000}" for i in range(number_of_rows)]),
+            "amount": pa.array([i / 100 for i in range(number_of_rows)], type=pa.float64()),
+            "updated_at": pa.array(
+                [i * 1000 for i in range(number_of_rows)], type=pa.timestamp("ms")
+            ),
+        }
+    )
+    content = _parquet_file(table, row_group_size=1_000_000)
+
+    start = time.perf_counter()
+    number_of_records = sum(
+        1
+        for _ in _parse_records(
+            ParquetParser(), content, _default_parquet_format, "s3://mybucket/test.parquet"
+        )
+    )
+    batches_rows_per_second = number_of_records / (time.perf_counter() - start)
+
+    # Converting each value is too slow to be done on the whole file
+    sample = table.slice(0, 50_000)
+    start = time.perf_counter()
+    for row in range(sample.num_rows):
+        {
+            column: ParquetParser._to_output_value(
+                sample.column(column)[row], _default_parquet_format
+            )
+            for column in sample.column_names
+        }
+    values_rows_per_second = sample.num_rows / (time.perf_counter() - start)
+
+    logging.getLogger(__name__).info(
+        f"rows/sec converting each value: {values_rows_per_second:.0f}, converting batches: {batches_rows_per_second:.0f}"
+    )
+    assert number_of_records == number_of_rows
+    assert batches_rows_per_second > values_rows_per_second * 5
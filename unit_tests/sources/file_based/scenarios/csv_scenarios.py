@@ -302,6 +302,13 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "default": False,
                                                     "description": "Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
                                                 },
+                                                "engine": {
+                                                    "title": "Engine",
+                                                    "description": "The engine used to read the records. `Arrow` reads and casts the values in batches, which is faster for large files. It falls back to `Python` if errors on field mismatch are ignored.",
+                                                    "default": "Python",
+                                                    "airbyte_hidden": True,
+                                                    "enum": ["Python", "Arrow"],
+                                                },
                                             },
                                             "required": ["filetype"],
                                         },
@@ -17,6 +17,7 @@ from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileB
 from airbyte_cdk.sources.file_based.discovery_policy import DefaultDiscoveryPolicy
 from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector
 from airbyte_cdk.sources.file_based.file_types import default_parsers
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_validation_policies import EmitRecordPolicy
 from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
@@ -56,6 +57,7 @@ def test_file_based_stream_partition_generator(sync_mode):
         {"files": [RemoteFile(uri="2", last_modified=datetime.now())]},
     ]
     stream.stream_slices.return_value = stream_slices
+    stream.get_file_ranges.return_value = None
 
     partition_generator = FileBasedStreamPartitionGenerator(
         stream, message_repository, _ANY_SYNC_MODE, _ANY_CURSOR_FIELD, _ANY_STATE, _ANY_CURSOR
@@ -69,6 +71,25 @@ def test_file_based_stream_partition_generator(sync_mode):
     )
 
 
+def test_given_file_ranges_when_generate_then_create_one_partition_per_range():
+    stream = Mock()
+    message_repository = Mock()
+    file = RemoteFile(uri="1", last_modified=datetime.now())
+    stream.stream_slices.return_value = [{"files": [file]}]
+    stream.get_file_ranges.return_value = [FileRange(0, 10), FileRange(10, 20)]
+
+    partition_generator = FileBasedStreamPartitionGenerator(
+        stream, message_repository, _ANY_SYNC_MODE, _ANY_CURSOR_FIELD, _ANY_STATE, _ANY_CURSOR
+    )
+
+    partitions = list(partition_generator.generate())
+    assert [partition.to_slice() for partition in partitions] == [
+        {"files": [file], "file_range": FileRange(0, 10)},
+        {"files": [file], "file_range": FileRange(10, 20)},
+    ]
+    assert hash(partitions[0]) != hash(partitions[1])
+
+
 @pytest.mark.parametrize(
     "transformer, expected_records",
     [
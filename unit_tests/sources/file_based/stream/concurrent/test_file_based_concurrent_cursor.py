@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 from airbyte_cdk.models import AirbyteStateMessage, SyncMode
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileRange
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.stream.concurrent.adapters import FileBasedStreamPartition
 from airbyte_cdk.sources.file_based.stream.concurrent.cursor import FileBasedConcurrentCursor
@@ -236,6 +237,43 @@ def test_add_file(
     )
 
 
+def test_given_file_split_in_ranges_when_add_file_then_only_add_to_history_once_all_ranges_are_read():
+    cursor = _make_cursor({"history": {}})
+    mock_message_repository = MagicMock()
+    cursor._message_repository = mock_message_repository
+    file = RemoteFile(
+        uri="a.jsonl",
+        last_modified=datetime.strptime("2021-01-05T00:00:00.000000Z", DATE_TIME_FORMAT),
+    )
+    cursor.set_pending_partitions(
+        [
+            FileBasedStreamPartition(
+                MagicMock(),
+                {"files": [file], "file_range": file_range},
+                mock_message_repository,
+                SyncMode.full_refresh,
+                FileBasedConcurrentCursor.CURSOR_FIELD,
+                {"history": {}},
+            )
+            for file_range in [FileRange(0, 10), FileRange(10, 20)]
+        ]
+    )
+
+    cursor.add_file(file)
+    assert cursor._file_to_datetime_history == {}
+    mock_message_repository.emit_message.assert_not_called()
+
+    cursor.add_file(file)
+    assert cursor._file_to_datetime_history == {"a.jsonl": "2021-01-05T00:00:00.000000Z"}
+    assert cursor._pending_files == {}
+    assert (
+        mock_message_repository.emit_message.call_args_list[0]
+        .args[0]
+        .state.stream.stream_state._ab_source_file_last_modified
+        == "2021-01-05T00:00:00.000000Z_a.jsonl"
+    )
+
+
 @pytest.mark.parametrize(
     "initial_state, pending_files, file_to_add, expected_history, expected_pending_files, expected_cursor_value",
     [
@@ -2,6 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import os
+import pickle
+import tempfile
 import traceback
 import unittest
 from datetime import datetime, timezone
@@ -12,15 +15,18 @@ from unittest.mock import Mock
 import pytest
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.worker_process_pool import WorkerProcessPool
 from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
 )
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
 from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types import FileTransfer
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
 from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
@@ -112,6 +118,118 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         )
         assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
 
+    def test_given_process_pool_when_read_records_from_slice_then_parse_in_process_pool(
+        self,
+    ) -> None:
+        process_pool = Mock(spec=WorkerProcessPool)
+        process_pool.iterate.return_value = iter([self._A_RECORD])
+        stream = self._a_stream_with_process_pool(process_pool)
+        file = RemoteFile(uri="uri", last_modified=self._NOW)
+
+        messages = list(stream.read_records_from_slice({"files": [file]}))
+
+        assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
+        process_pool.iterate.assert_called_once_with(
+            self._parser.parse_records,
+            self._stream_config,
+            file,
+            self._stream_reader,
+            stream.logger,
+            self._catalog_schema,
+        )
+        self._parser.parse_records.assert_not_called()
+        self._cursor.add_file.assert_called_once_with(file)
+
+    def test_given_arguments_cannot_be_pickled_when_read_records_from_slice_then_parse_in_current_process(
+        self,
+    ) -> None:
+        process_pool = Mock(spec=WorkerProcessPool)
+        process_pool.iterate.side_effect = pickle.PicklingError("can't pickle")
+        self._parser.parse_records.return_value = [self._A_RECORD]
+        stream = self._a_stream_with_process_pool(process_pool)
+
+        messages = list(
+            stream.read_records_from_slice(
+                {"files": [RemoteFile(uri="uri", last_modified=self._NOW)]}
+            )
+        )
+
+        assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
+
+    def _a_stream_with_process_pool(
+        self, process_pool: WorkerProcessPool
+    ) -> DefaultFileBasedStream:
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+            errors_collector=FileBasedErrorsCollector(),
+            process_pool=process_pool,
+        )
+
+    def test_given_project_selected_fields_when_read_records_from_slice_then_pass_catalog_fields_to_parser(
+        self,
+    ) -> None:
+        self._stream_config.schemaless = False
+        self._parser.parse_records.return_value = [self._A_RECORD]
+        catalog_schema = {
+            "type": "object",
+            "properties": {
+                "a_record": {"type": "integer"},
+                DefaultFileBasedStream.ab_last_mod_col: {"type": "string"},
+                DefaultFileBasedStream.ab_file_name_col: {"type": "string"},
+            },
+        }
+        stream = self._a_stream_projecting_selected_fields(catalog_schema)
+        file = RemoteFile(uri="uri", last_modified=self._NOW)
+
+        list(stream.read_records_from_slice({"files": [file]}))
+
+        self._parser.parse_records.assert_called_once_with(
+            self._stream_config,
+            file,
+            self._stream_reader,
+            stream.logger,
+            catalog_schema,
+            {"a_record"},
+        )
+
+    def test_given_project_selected_fields_and_schemaless_when_read_records_from_slice_then_read_all_fields(
+        self,
+    ) -> None:
+        self._stream_config.schemaless = True
+        self._parser.parse_records.return_value = [self._A_RECORD]
+        catalog_schema = {"type": "object", "properties": {"data": {"type": "object"}}}
+        stream = self._a_stream_projecting_selected_fields(catalog_schema)
+        file = RemoteFile(uri="uri", last_modified=self._NOW)
+
+        list(stream.read_records_from_slice({"files": [file]}))
+
+        self._parser.parse_records.assert_called_once_with(
+            self._stream_config, file, self._stream_reader, stream.logger, catalog_schema
+        )
+
+    def _a_stream_projecting_selected_fields(
+        self, catalog_schema: Mapping[str, Any]
+    ) -> DefaultFileBasedStream:
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+            errors_collector=FileBasedErrorsCollector(),
+            project_selected_fields=True,
+        )
+
     def test_when_transform_record_then_return_updated_record(self) -> None:
         file = RemoteFile(uri="uri", last_modified=self._NOW)
         last_updated = self._NOW.isoformat()
@@ -212,6 +330,49 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_schema_inference_cache_when_get_json_schema_then_only_infer_schema_of_modified_files(
+        self,
+    ) -> None:
+        with tempfile.TemporaryDirectory() as cache_directory:
+            cache_path = os.path.join(cache_directory, "schemas.json")
+            self._discovery_policy.n_concurrent_requests = 1
+            self._discovery_policy.get_max_n_files_for_schema_inference.return_value = 10
+            self._stream_config.format = JsonlFormat()
+            self._stream_config.input_schema = None
+            self._stream_config.schemaless = None
+            self._stream_config.recent_n_files_to_read_for_schema_discovery = None
+            self._parser.infer_schema.return_value = {"data": {"type": "string"}}
+            files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(3)]
+            self._stream_reader.get_matching_files.return_value = files
+            self._a_stream_with_schema_inference_cache(cache_path).get_json_schema()
+
+            self._parser.infer_schema.reset_mock()
+            self._parser.infer_schema.return_value = {"data": {"type": "integer"}}
+            modified_file = RemoteFile(
+                uri="file0", last_modified=datetime(2023, 1, 1, tzinfo=timezone.utc)
+            )
+            self._stream_reader.get_matching_files.return_value = [modified_file] + files[1:]
+            schema = self._a_stream_with_schema_inference_cache(cache_path).get_json_schema()
+
+        self._parser.infer_schema.assert_called_once_with(
+            self._stream_config, modified_file, self._stream_reader, mock.ANY
+        )
+        assert schema["properties"]["data"] == {"type": ["null", "string"]}
+
+    def _a_stream_with_schema_inference_cache(self, cache_path: str) -> DefaultFileBasedStream:
+        return DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={JsonlFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=self._cursor,
+            errors_collector=FileBasedErrorsCollector(),
+            schema_inference_cache=SchemaInferenceCache(cache_path),
+        )
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from datetime import datetime
+
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.file_types import CsvParser, JsonlParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_inference_cache import SchemaInferenceCache
+
+_FILE = RemoteFile(uri="a.jsonl", last_modified=datetime(2024, 1, 1))
+_SCHEMA = {"col": {"type": "string"}}
+_FORMAT_KEY = SchemaInferenceCache.format_key(JsonlParser(), JsonlFormat())
+
+
+def test_given_saved_cache_when_get_then_return_schema_and_count_saved_time(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = SchemaInferenceCache(path)
+    cache.set(_FILE, _FORMAT_KEY, _SCHEMA, 1.5)
+    cache.save()
+
+    other_cache = SchemaInferenceCache(path)
+
+    assert other_cache.get(_FILE, _FORMAT_KEY) == _SCHEMA
+    assert (other_cache.hits, other_cache.misses, other_cache.saved_seconds) == (1, 0, 1.5)
+
+
+def test_given_file_modified_when_get_then_miss(tmp_path):
+    cache = SchemaInferenceCache(str(tmp_path / "cache.json"))
+    cache.set(_FILE, _FORMAT_KEY, _SCHEMA, 1.5)
+
+    modified_file = RemoteFile(uri=_FILE.uri, last_modified=datetime(2024, 1, 2))
+
+    assert cache.get(modified_file, _FORMAT_KEY) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_given_other_format_when_get_then_miss(tmp_path):
+    cache = SchemaInferenceCache(str(tmp_path / "cache.json"))
+    cache.set(_FILE, _FORMAT_KEY, _SCHEMA, 1.5)
+
+    assert cache.get(_FILE, SchemaInferenceCache.format_key(CsvParser(), CsvFormat())) is None
+    assert (
+        cache.get(_FILE, SchemaInferenceCache.format_key(CsvParser(), CsvFormat(delimiter=";")))
+        is None
+    )
+
+
+def test_given_file_modified_when_set_then_replace_entry(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = SchemaInferenceCache(str(path))
+    cache.set(_FILE, _FORMAT_KEY, _SCHEMA, 1.5)
+    cache.set(
+        RemoteFile(uri=_FILE.uri, last_modified=datetime(2024, 1, 2)), _FORMAT_KEY, _SCHEMA, 1.5
+    )
+    cache.save()
+
+    assert len(json.loads(path.read_text())["entries"]) == 1
+
+
+def test_given_corrupted_or_outdated_cache_file_when_get_then_miss(tmp_path):
+    corrupted_path = tmp_path / "corrupted.json"
+    corrupted_path.write_text("{not json")
+    outdated_path = tmp_path / "outdated.json"
+    outdated_path.write_text(
+        json.dumps(
+            {
+                "version": SchemaInferenceCache.VERSION - 1,
+                "entries": {
+                    f"{_FORMAT_KEY}:{_FILE.uri}": {
+                        "last_modified": _FILE.last_modified.isoformat(),
+                        "schema": _SCHEMA,
+                        "inference_seconds": 1.5,
+                    }
+                },
+            }
+        )
+    )
+
+    assert SchemaInferenceCache(str(corrupted_path)).get(_FILE, _FORMAT_KEY) is None
+    assert SchemaInferenceCache(str(outdated_path)).get(_FILE, _FORMAT_KEY) is None
+
+
+def test_given_nothing_set_when_save_then_do_not_write(tmp_path):
+    path = tmp_path / "cache.json"
+
+    SchemaInferenceCache(str(path)).save()
+
+    assert not path.exists()
@@ -129,6 +129,7 @@ test_stream_facade_single_stream = (
                 {"level": "INFO", "message": "Read 2 records from stream1 stream"},
                 {"level": "INFO", "message": "Marking stream stream1 as STOPPED"},
                 {"level": "INFO", "message": "Finished syncing stream1"},
+                {"level": "INFO", "message": "Record queue peak usage"},
                 {"level": "INFO", "message": "Finished syncing"},
             ]
         }
@@ -245,6 +245,7 @@ test_concurrent_cdk_single_stream = (
                 {"level": "INFO", "message": "Read 2 records from stream1 stream"},
                 {"level": "INFO", "message": "Marking stream stream1 as STOPPED"},
                 {"level": "INFO", "message": "Finished syncing stream1"},
+                {"level": "INFO", "message": "Record queue peak usage"},
                 {"level": "INFO", "message": "Finished syncing"},
             ]
         }
@@ -170,10 +170,10 @@ def test_stream_partition_raising_exception(exception_type, expected_display_mes
     [
         pytest.param(
             {"partition": 1, "k": "v"},
-            1088629586613270006,
+            11455198223958478408,
             id="test_hash_with_slice",
         ),
-        pytest.param(None, 5149571505982114308, id="test_hash_no_slice"),
+        pytest.param(None, 658091304205008412, id="test_hash_no_slice"),
     ],
 )
 def test_stream_partition_hash(_slice, expected_hash):
@@ -31,7 +31,10 @@ from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionE
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    RecordBatch,
+)
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -474,6 +477,51 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         assert messages == expected_messages
         assert handler._record_counter[_STREAM_NAME] == 2
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_on_record_batch_emits_records_in_order_each_followed_by_repository_messages(self):
+        repository_messages = [
+            AirbyteMessage(
+                type=MessageType.LOG,
+                log=AirbyteLogMessage(
+                    level=LogLevel.INFO, message=f"message {i} from the repository"
+                ),
+            )
+            for i in range(3)
+        ]
+        self._message_repository.consume_queue.side_effect = [
+            [message] for message in repository_messages
+        ]
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        records = [Record({"id": i}, self._partition) for i in range(3)]
+
+        messages = list(handler.on_record_batch(RecordBatch(records)))
+
+        assert messages[0].type == MessageType.TRACE
+        assert messages[0].trace.stream_status.status == AirbyteStreamStatus.RUNNING
+        assert messages[1:] == [
+            message
+            for i in range(3)
+            for message in [
+                AirbyteMessage(
+                    type=MessageType.RECORD,
+                    record=AirbyteRecordMessage(
+                        stream=_STREAM_NAME, data={"id": i}, emitted_at=1577836800000
+                    ),
+                ),
+                repository_messages[i],
+            ]
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 3
+        self._stream.cursor.observe.assert_has_calls([call(record) for record in records])
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_emits_status_message_on_first_record_no_repository_message(self):
         self._streams_currently_generating_partitions = [_STREAM_NAME]
@@ -26,6 +26,7 @@ from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_sta
     ConcurrencyCompatibleStateType,
 )
 from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
+    CustomFormatConcurrentStreamStateConverter,
     EpochValueConcurrentStreamStateConverter,
     IsoMillisConcurrentStreamStateConverter,
 )
@@ -187,6 +188,89 @@ class ConcurrentCursorStateTest(TestCase):
             {"a_cursor_field_key": 10},
         )
 
+    def test_given_records_out_of_order_when_close_partition_then_emit_most_recent_value_and_parse_it_once(
+        self,
+    ) -> None:
+        converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%SZ")
+        cursor = ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            converter,
+            CursorField(_A_CURSOR_FIELD_KEY),
+            None,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        )
+        partition = _partition(_NO_SLICE)
+        parse_value = Mock(wraps=converter.parse_value)
+        converter.parse_value = parse_value
+
+        for cursor_value in [
+            "2024-01-02T00:00:00Z",
+            "2024-01-03T00:00:00Z",
+            "2024-01-01T00:00:00Z",
+        ]:
+            cursor.observe(_record(cursor_value, partition=partition))
+        cursor.close_partition(partition)
+
+        assert cursor.state["slices"][0]["most_recent_cursor_value"] == datetime(
+            2024, 1, 3, tzinfo=timezone.utc
+        )
+        parse_value.assert_called_once_with("2024-01-03T00:00:00Z")
+
+    def test_given_impossible_date_matching_ordered_format_when_observe_then_raise_on_the_record(
+        self,
+    ) -> None:
+        cursor = ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%SZ"),
+            CursorField(_A_CURSOR_FIELD_KEY),
+            None,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        )
+        partition = _partition(_NO_SLICE)
+        cursor.observe(_record("2024-03-01T00:00:00Z", partition=partition))
+
+        with pytest.raises(ValueError):
+            cursor.observe(_record("2024-02-30T00:00:00Z", partition=partition))
+
+    def test_given_values_needing_parsing_when_observe_then_parse_each_distinct_value_once(
+        self,
+    ) -> None:
+        converter = IsoMillisConcurrentStreamStateConverter()
+        cursor = ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            converter,
+            CursorField(_A_CURSOR_FIELD_KEY),
+            None,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        )
+        partition = _partition(_NO_SLICE)
+        parse_value = Mock(wraps=converter.parse_value)
+        converter.parse_value = parse_value
+
+        for cursor_value in ["2024-01-01T00:00:00.000Z", "2024-01-02T00:00:00.000+01:00"] * 10:
+            cursor.observe(_record(cursor_value, partition=partition))
+        cursor.close_partition(partition)
+
+        assert cursor.state["slices"][0]["most_recent_cursor_value"] == datetime(
+            2024, 1, 1, 23, tzinfo=timezone.utc
+        )
+        assert parse_value.call_count == 2
+
     def test_given_no_boundary_fields_when_close_multiple_partitions_then_raise_exception(
         self,
     ) -> None:
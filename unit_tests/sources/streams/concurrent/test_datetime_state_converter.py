@@ -405,3 +405,146 @@ def test_given_when_parse_timestamp_then_eventually_fallback_on_output_format():
     parsed_datetime = converter.parse_timestamp("2024-01-01T02:00:00")
 
     assert parsed_datetime == datetime(2024, 1, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "converter, value, expected_ordering_key",
+    [
+        pytest.param(
+            EpochValueConcurrentStreamStateConverter(), 1617030403, 1617030403, id="epoch-int"
+        ),
+        pytest.param(
+            EpochValueConcurrentStreamStateConverter(), 1617030403.5, 1617030403.5, id="epoch-float"
+        ),
+        pytest.param(
+            EpochValueConcurrentStreamStateConverter(),
+            "1617030403",
+            None,
+            id="epoch-string-needs-parsing",
+        ),
+        pytest.param(
+            EpochValueConcurrentStreamStateConverter(), True, None, id="epoch-bool-needs-parsing"
+        ),
+        pytest.param(
+            IsoMillisConcurrentStreamStateConverter(),
+            "2021-04-01T00:00:00.000Z",
+            None,
+            id="isomillis-always-needs-parsing",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "2021-04-01T00:00:00.000000Z",
+            "2021-04-01T00:00:00.000000Z",
+            id="custom-ordered-format",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-04-01",
+            "2021-04-01",
+            id="custom-date",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-4-1",
+            None,
+            id="custom-value-not-padded",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-13-01",
+            None,
+            id="custom-invalid-month",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-02-30",
+            None,
+            id="custom-day-not-in-month",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2021-02-29",
+            None,
+            id="custom-february-29th-not-in-leap-year",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "2024-02-29",
+            "2024-02-29",
+            id="custom-february-29th-in-leap-year",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            "0000-01-01",
+            None,
+            id="custom-year-zero",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            20210401,
+            None,
+            id="custom-value-not-a-string",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S%z"),
+            "2021-04-01T00:00:00+0000",
+            None,
+            id="custom-format-with-timezone",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%d/%m/%Y"),
+            "01/04/2021",
+            None,
+            id="custom-format-not-ordered",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%H:%M"),
+            "12:00",
+            None,
+            id="custom-format-without-year",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%s"),
+            1617030403,
+            1617030403,
+            id="custom-timestamp-number",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%s"),
+            "1617030403",
+            None,
+            id="custom-timestamp-string",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter(
+                "%Y-%m-%dT%H:%M:%S", ["%d/%m/%Y", "%Y-%m-%d"]
+            ),
+            "2021-04-01",
+            None,
+            id="custom-first-input-format-not-ordered",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%d/%m/%Y", ["%Y-%m-%d"]),
+            "2021-04-01",
+            "2021-04-01",
+            id="custom-first-input-format-ordered",
+        ),
+    ],
+)
+def test_get_ordering_key(converter, value, expected_ordering_key):
+    assert converter.get_ordering_key(value) == expected_ordering_key
+
+
+def test_given_ordered_format_when_compare_ordering_keys_then_same_order_as_parsed_values():
+    converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S.%f")
+    values = [
+        "2021-04-01T00:00:00.000001",
+        "2020-12-31T23:59:59.999999",
+        "2021-04-01T10:00:00.000000",
+        "2021-04-01T09:59:59.999999",
+        "2021-11-01T00:00:00.000000",
+    ]
+
+    assert sorted(values, key=converter.get_ordering_key) == sorted(
+        values, key=converter.parse_value
+    )
@@ -4,7 +4,7 @@
 import unittest
 from queue import Queue
 from typing import Callable, Iterable, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
@@ -14,6 +14,7 @@ from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
+    RecordBatch,
 )
 
 _RECORDS = [
@@ -43,7 +44,85 @@ class PartitionReaderTest(unittest.TestCase):
 
         queue_content = self._consume_queue()
 
-        assert queue_content == _RECORDS + [PartitionCompleteSentinel(partition)]
+        assert queue_content == [RecordBatch(_RECORDS), PartitionCompleteSentinel(partition)]
+
+    def test_given_more_records_than_max_batch_size_when_process_partition_then_queue_multiple_batches(
+        self,
+    ):
+        partition_reader = PartitionReader(self._queue, max_batch_size=2)
+        records = [Record({"id": i}, "stream") for i in range(5)]
+        partition = self._a_partition(records)
+        partition_reader.process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(records[0:2]),
+            RecordBatch(records[2:4]),
+            RecordBatch(records[4:5]),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_exceeds_max_size_in_bytes_when_process_partition_then_queue_batch(self):
+        record_size = len('{"id":1,"name":"Jack"}')
+        partition_reader = PartitionReader(
+            self._queue, max_batch_size=100, max_batch_size_in_bytes=record_size
+        )
+        partition_reader._RECORD_SIZE_SAMPLING_INTERVAL = 1
+        partition = self._a_partition(_RECORDS)
+        partition_reader.process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS[0:1]),
+            RecordBatch(_RECORDS[1:2]),
+            PartitionCompleteSentinel(partition),
+        ]
+        assert [item.approximate_size_in_bytes for item in queue_content[:2]] == [
+            record_size,
+            len('{"id":2,"name":"John"}'),
+        ]
+
+    def test_given_small_first_record_then_large_ones_when_process_partition_then_batch_size_is_sum_of_record_sizes(
+        self,
+    ):
+        records = [Record({"id": 1}, "stream")] + [
+            Record({"id": i, "text": "a" * 10_000}, "stream") for i in range(2, 6)
+        ]
+        partition_reader = PartitionReader(
+            self._queue, max_batch_size=100, max_batch_size_in_bytes=25_000
+        )
+        partition_reader._RECORD_SIZE_SAMPLING_INTERVAL = 1
+        partition = self._a_partition(records)
+        partition_reader.process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        large_record_size = len('{"id":2,"text":""}') + 10_000
+        assert queue_content == [
+            RecordBatch(records[0:4]),
+            RecordBatch(records[4:5]),
+            PartitionCompleteSentinel(partition),
+        ]
+        assert [item.approximate_size_in_bytes for item in queue_content[:2]] == [
+            len('{"id":1}') + 3 * large_record_size,
+            large_record_size,
+        ]
+
+    def test_given_records_when_process_partition_then_only_measure_sampled_records(self):
+        records = [Record({"id": i}, "stream") for i in range(25)]
+        partition_reader = PartitionReader(self._queue, max_batch_size=100)
+
+        with patch(
+            "airbyte_cdk.sources.streams.concurrent.partition_reader.approximate_record_size_in_bytes",
+            side_effect=lambda data: 100 + data["id"],
+        ) as approximate_record_size_in_bytes:
+            partition_reader.process_partition(self._a_partition(records))
+
+        assert approximate_record_size_in_bytes.call_count == 3
+        # each record is assumed to have the size of the last sampled record
+        assert self._consume_queue()[0].approximate_size_in_bytes == 10 * 100 + 10 * 110 + 5 * 120
 
     def test_given_exception_when_process_partition_then_queue_records_and_exception_and_sentinel(
         self,
@@ -55,7 +134,8 @@ class PartitionReaderTest(unittest.TestCase):
 
         queue_content = self._consume_queue()
 
-        assert queue_content == _RECORDS + [
+        assert queue_content == [
+            RecordBatch(_RECORDS),
             StreamThreadException(exception, partition.stream_name()),
             PartitionCompleteSentinel(partition),
         ]
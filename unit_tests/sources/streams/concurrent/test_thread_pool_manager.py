@@ -1,9 +1,11 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import threading
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 
@@ -11,6 +13,7 @@ from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPool
 class ThreadPoolManagerTest(TestCase):
     def setUp(self):
         self._threadpool = Mock(spec=ThreadPoolExecutor)
+        self._threadpool.submit.side_effect = lambda *args: Future()
         self._thread_pool_manager = ThreadPoolManager(
             self._threadpool, Mock(), max_concurrent_tasks=1
         )
@@ -23,63 +26,96 @@ class ThreadPoolManagerTest(TestCase):
 
         assert len(self._thread_pool_manager._futures) == 1
 
-    def test_given_exception_during_pruning_when_check_for_errors_and_shutdown_then_shutdown_and_raise(
+    def test_given_future_done_when_submit_then_future_is_not_tracked_anymore(self):
+        future = self._submit()
+
+        future.set_result(None)
+
+        assert len(self._thread_pool_manager._futures) == 0
+
+    def test_given_exception_in_future_when_check_for_errors_and_shutdown_then_shutdown_and_raise(
         self,
     ):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
-        future.done.side_effect = [True, True]
+        future = self._submit()
+        future.set_exception(ValueError())
 
-        self._thread_pool_manager._futures = [future]
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+        with self.assertRaises(RuntimeError):
+            self._thread_pool_manager.check_for_errors_and_shutdown()
+        self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_given_exception_in_future_before_done_callback_when_check_for_errors_and_shutdown_then_shutdown_and_raise(
+        self,
+    ):
+        with patch.object(ThreadPoolManager, "_on_future_done"):
+            future = self._submit()
+        future.set_exception(ValueError())
 
         with self.assertRaises(RuntimeError):
             self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
-    def test_is_done_is_false_if_not_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = False
+    def test_given_cancelled_future_when_check_for_errors_and_shutdown_then_do_not_raise(self):
+        future = self._submit()
+        future.cancel()
 
-        self._thread_pool_manager._futures = [future]
+        self._thread_pool_manager.check_for_errors_and_shutdown()
+        self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_is_done_is_false_if_not_all_futures_are_done(self):
+        self._submit()
 
         assert not self._thread_pool_manager.is_done()
 
     def test_is_done_is_true_if_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
 
         assert self._thread_pool_manager.is_done()
 
-    def test_threadpool_shutdown_if_errors(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
+    def test_has_reached_futures_limit(self):
+        future = self._submit()
+        assert self._thread_pool_manager.has_reached_futures_limit()
+        assert self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
 
-        self._thread_pool_manager._futures = [future]
+        future.set_result(None)
 
-        with self.assertRaises(RuntimeError):
-            self._thread_pool_manager.check_for_errors_and_shutdown()
-        self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+        assert not self._thread_pool_manager.has_reached_futures_limit()
 
-    def test_check_for_errors_and_shutdown_raises_error_if_futures_are_not_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = False
+    def test_given_limit_reached_when_wait_until_below_futures_limit_then_unblock_once_future_is_done(
+        self,
+    ):
+        future = self._submit()
+        waiter = threading.Thread(target=self._thread_pool_manager.wait_until_below_futures_limit)
+        waiter.start()
+        waiter.join(timeout=0.05)
+        assert waiter.is_alive()
+
+        future.set_result(None)
+        waiter.join(timeout=5)
 
-        self._thread_pool_manager._futures = [future]
+        assert not waiter.is_alive()
+
+    def test_check_for_errors_and_shutdown_raises_error_if_futures_are_not_done(self):
+        self._thread_pool_manager._WAIT_FOR_FUTURES_TIMEOUT_IN_SECONDS = 0.01
+        self._submit()
 
         with self.assertRaises(RuntimeError):
             self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
     def test_check_for_errors_and_shutdown_does_not_raise_error_if_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
 
         self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_given_future_still_running_when_check_for_errors_and_shutdown_then_wait_for_it(self):
+        with ThreadPoolExecutor(max_workers=1) as threadpool:
+            thread_pool_manager = ThreadPoolManager(threadpool, Mock())
+            thread_pool_manager.submit(time.sleep, 0.2)
+
+            # does not raise as the future completes successfully
+            thread_pool_manager.check_for_errors_and_shutdown()
+
+    def _submit(self) -> Future:
+        self._thread_pool_manager.submit(self._fn, self._arg)
+        return next(iter(self._thread_pool_manager._futures))
@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http.http_connection_pool import (
+    ConnectionPoolStats,
+    HttpConnectionPool,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"id": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _http_client(name: str, connection_pool: HttpConnectionPool) -> HttpClient:
+    return HttpClient(
+        name=name, logger=logging.getLogger("airbyte"), connection_pool=connection_pool
+    )
+
+
+def test_given_clients_sharing_pool_when_send_requests_then_reuse_connection(server_url):
+    connection_pool = HttpConnectionPool(pool_size=2)
+    clients = [_http_client("stream1", connection_pool), _http_client("stream2", connection_pool)]
+
+    for client in clients * 2:
+        client.send_request("GET", f"{server_url}/records", request_kwargs={})
+
+    assert connection_pool.get_stats() == ConnectionPoolStats(
+        hosts=1, new_connections=1, reused_connections=3
+    )
+    assert clients[0]._session.adapters["http://"] is clients[1]._session.adapters["http://"]
+
+
+def test_given_no_request_when_get_stats_then_return_zeros():
+    assert HttpConnectionPool().get_stats() == ConnectionPoolStats(
+        hosts=0, new_connections=0, reused_connections=0
+    )
+
+
+def test_when_resize_then_adapter_keeps_the_new_number_of_connections_per_host():
+    connection_pool = HttpConnectionPool(pool_size=2)
+    session = requests.Session()
+    connection_pool.mount(session)
+
+    connection_pool.resize(7)
+
+    assert connection_pool.pool_size == 7
+    assert session.adapters["https://"]._pool_maxsize == 7
+    assert session.adapters["https://"].poolmanager.connection_pool_kw["maxsize"] == 7
+
+
+@pytest.mark.parametrize("pool_size", [0, -1])
+def test_given_invalid_pool_size_then_raise(pool_size):
+    with pytest.raises(ValueError):
+        HttpConnectionPool(pool_size=pool_size)
+    with pytest.raises(ValueError):
+        HttpConnectionPool().resize(pool_size)
+
+
+def test_given_connect_retries_when_mount_then_only_retry_connection_errors():
+    session = requests.Session()
+
+    HttpConnectionPool(connect_retries=3).mount(session)
+
+    retries = session.adapters["https://"].max_retries
+    assert (retries.connect, retries.read, retries.status, retries.other) == (3, False, 0, 0)
+
+
+def test_given_tcp_keep_alive_when_mount_then_set_keep_alive_socket_options():
+    session = requests.Session()
+
+    HttpConnectionPool(tcp_keep_alive_idle_seconds=30).mount(session)
+
+    socket_options = session.adapters["https://"].poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in socket_options
+
+
+def test_given_tcp_keep_alive_when_resize_then_keep_socket_options():
+    connection_pool = HttpConnectionPool(tcp_keep_alive_idle_seconds=30)
+    session = requests.Session()
+    connection_pool.mount(session)
+
+    connection_pool.resize(5)
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in session.adapters[
+        "https://"
+    ].poolmanager.connection_pool_kw["socket_options"]
@@ -3,6 +3,7 @@
 #
 import os
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Any, Iterable, Mapping, Optional
@@ -17,6 +18,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     HttpRequestMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    TokenBucketCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -297,6 +299,138 @@ class TestMovingWindowCallRatePolicy:
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
 
+class TestTokenBucketCallRatePolicy:
+    def test_limit_rate(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(10, timedelta(minutes=1)), matchers=[])
+
+        for i in range(10):
+            policy.try_acquire("call", weight=1), f"{i + 1} call"
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1), "call over limit"
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(6, 0.1)
+        assert excinfo.value.rate == "10 per 0:01:00"
+
+    def test_given_capacity_then_limit_bursts(self):
+        policy = TokenBucketCallRatePolicy(
+            rate=Rate(10, timedelta(minutes=1)), matchers=[], capacity=2
+        )
+
+        policy.try_acquire("call", weight=2)
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(6, 0.1)
+        with pytest.raises(ValueError, match="Weight can not exceed the capacity"):
+            policy.try_acquire("call", weight=3)
+
+    def test_when_reserve_then_each_call_waits_for_its_own_token(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(1, timedelta(seconds=10)), matchers=[])
+
+        times_to_wait = [policy.reserve("call", weight=1).total_seconds() for _ in range(3)]
+
+        assert times_to_wait == pytest.approx([0, 10, 20], abs=0.1)
+        assert policy.get_time_to_wait().total_seconds() == pytest.approx(30, abs=0.1)
+
+    def test_given_time_to_wait_exceeds_max_when_reserve_then_raise_without_reserving(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(1, timedelta(seconds=10)), matchers=[])
+        policy.reserve("call", weight=1)
+
+        with pytest.raises(CallRateLimitHit):
+            policy.reserve("call", weight=1, max_time_to_wait=timedelta(seconds=5))
+
+        assert policy.get_time_to_wait().total_seconds() == pytest.approx(10, abs=0.1)
+
+    def test_update_available_calls(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(100, timedelta(hours=1)), matchers=[])
+
+        policy.update(available_calls=2, call_reset_ts=None)
+        policy.try_acquire("call", weight=2)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=1)
+
+        # update to increase number of calls available, ignored
+        policy.update(available_calls=20, call_reset_ts=None)
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=1)
+
+    def test_given_no_available_calls_and_reset_time_when_update_then_wait_until_reset(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(100, timedelta(seconds=1)), matchers=[])
+
+        policy.update(available_calls=0, call_reset_ts=datetime.now() + timedelta(minutes=1))
+
+        assert policy.get_time_to_wait().total_seconds() == pytest.approx(60, abs=0.1)
+
+    def test_stats(self):
+        policy = TokenBucketCallRatePolicy(rate=Rate(2, timedelta(seconds=1)), matchers=[])
+        assert policy.get_stats().calls == 0
+
+        for _ in range(4):
+            policy.reserve("call", weight=1)
+
+        stats = policy.get_stats()
+        assert (stats.calls, stats.waits) == (4, 2)
+        assert stats.time_waited.total_seconds() == pytest.approx(1.5, abs=0.1)
+        assert stats.utilization == pytest.approx(1, abs=0.1)
+
+
+class TestAPIBudget:
+    def test_given_token_bucket_when_acquire_call_from_threads_then_calls_are_made_at_rate(self):
+        policy = TokenBucketCallRatePolicy(
+            rate=Rate(20, timedelta(seconds=1)), matchers=[], capacity=1
+        )
+        api_budget = APIBudget(policies=[policy])
+        call_times = []
+        lock = threading.Lock()
+
+        def _call() -> None:
+            for _ in range(5):
+                api_budget.acquire_call("call")
+                with lock:
+                    call_times.append(time.monotonic())
+
+        threads = [threading.Thread(target=_call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        call_times.sort()
+        assert len(call_times) == 20
+        assert call_times[-1] - call_times[0] == pytest.approx(19 / 20, abs=0.15)
+        assert policy.get_stats().calls == 20
+
+    def test_given_token_bucket_and_timeout_exceeded_when_acquire_call_then_raise(self):
+        api_budget = APIBudget(
+            policies=[TokenBucketCallRatePolicy(rate=Rate(1, timedelta(minutes=1)), matchers=[])]
+        )
+        api_budget.acquire_call("call")
+
+        with pytest.raises(CallRateLimitHit):
+            api_budget.acquire_call("call", timeout=1)
+        with pytest.raises(CallRateLimitHit):
+            api_budget.acquire_call("call", block=False)
+
+    def test_get_time_to_wait(self, mocker):
+        api_budget = APIBudget(
+            policies=[
+                TokenBucketCallRatePolicy(
+                    rate=Rate(1, timedelta(minutes=1)),
+                    matchers=[HttpRequestMatcher(url="http://domain/api/a")],
+                ),
+                MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(minutes=1))], matchers=[]),
+            ]
+        )
+        limited_request = Request("GET", "http://domain/api/a").prepare()
+        other_request = Request("GET", "http://domain/api/b").prepare()
+        api_budget.acquire_call(limited_request)
+        api_budget.acquire_call(other_request)
+
+        assert api_budget.get_time_to_wait(limited_request).total_seconds() == pytest.approx(
+            60, abs=0.1
+        )
+        assert api_budget.get_time_to_wait(other_request) == timedelta(0)
+
+
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
         """Test that HttpStream will use call budget when provided"""
@@ -2,7 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+import logging
+import time
+from typing import Any, Callable, Dict
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
@@ -339,3 +344,270 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/definitions/node"}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {
+                "value": {"type": "integer"},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}},
+            },
+        }
+    },
+}
+SCHEMA_WITH_ID = {
+    "$id": "http://example.com/root.json",
+    "type": "object",
+    "properties": {
+        "scoped": {
+            "$id": "http://example.com/scoped.json",
+            "type": "object",
+            "properties": {"value": {"$ref": "#/definitions/number"}},
+            "definitions": {"number": {"type": "number"}},
+        },
+        "value": {"$ref": "#/definitions/string"},
+    },
+    "definitions": {"string": {"type": "string"}},
+}
+SCHEMA_WITH_REF_AND_SIBLINGS = {
+    "type": "object",
+    "properties": {
+        "value": {"$ref": "#/definitions/object", "properties": {"a": {"type": "string"}}}
+    },
+    "definitions": {
+        "object": {
+            "type": "object",
+            "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
+        }
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        pytest.param(
+            COMPLEX_SCHEMA,
+            {"value": "true", "int_prop": 1.0, "number_prop": True, "array": [1, None, [1]]},
+            id="complex",
+        ),
+        pytest.param(COMPLEX_SCHEMA, {"def": {"dd": 1}}, id="unresolvable_ref_is_reached"),
+        pytest.param(
+            COMPLEX_SCHEMA,
+            {"int_prop": "1.5", "prop_with_null": 12, "too_many_types": None},
+            id="nullable",
+        ),
+        pytest.param(COMPLEX_SCHEMA, {"int_prop": float("inf")}, id="conversion_error_not_caught"),
+        pytest.param(
+            COMPLEX_SCHEMA,
+            {"value": "not a boolean", "list_of_lists": [1, [2, None], "3"]},
+            id="invalid_values",
+        ),
+        pytest.param(
+            VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": "1"}}, id="very_nested"
+        ),
+        pytest.param(
+            RECURSIVE_SCHEMA,
+            {
+                "root": {
+                    "value": "1",
+                    "children": [{"value": 2.0, "children": [{"value": "x"}, None, 3]}],
+                }
+            },
+            id="recursive",
+        ),
+        pytest.param(
+            SCHEMA_WITH_ID, {"scoped": {"value": "1.5"}, "value": 1}, id="ids_change_scope"
+        ),
+        pytest.param(
+            SCHEMA_WITH_REF_AND_SIBLINGS,
+            {"value": {"a": "1", "b": 2}},
+            id="ref_siblings_are_applied",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"value": {"type": "datetime"}}},
+            {"value": 1},
+            id="unknown_type",
+        ),
+        pytest.param({"type": ["datetime", "object"]}, {"value": 1}, id="unknown_type_not_checked"),
+        pytest.param(
+            {"type": "object", "properties": {"value": {"type": 1}}},
+            {"value": 1},
+            id="invalid_type_fall_back",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"value": True}},
+            {"other": 1},
+            id="boolean_schema_fall_back",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "properties": {"value": {"type": "array", "items": [{"type": "string"}]}},
+            },
+            {"value": []},
+            id="items_array_fall_back",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "properties": {"value": {"type": "array", "items": {"type": "string"}}},
+            },
+            {"value": ("a", 1)},
+            id="tuple_is_not_an_array",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"value": {"type": "string"}}},
+            {"value": 1.5e300, "other": None},
+            id="float",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "config",
+    [
+        TransformConfig.DefaultSchemaNormalization,
+        TransformConfig.CustomSchemaNormalization,
+        TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization,
+    ],
+)
+def test_compiled_schema_transforms_records_like_jsonschema(schema, record, config, caplog):
+    def _transform(transform_with_jsonschema: bool) -> Any:
+        transformer = TypeTransformer(config)
+        if TransformConfig.CustomSchemaNormalization in config:
+            transformer.registerCustomTransform(
+                lambda value, subschema: (
+                    f"{value}-{subschema.get('type')}" if isinstance(value, str) else value
+                )
+            )
+        actual = copy.deepcopy(record)
+        caplog.clear()
+        try:
+            if transform_with_jsonschema:
+                transformer._transform_with_jsonschema(actual, schema)
+            else:
+                transformer.transform(actual, schema)
+        except Exception as exception:
+            return type(exception), str(exception), [r.message for r in caplog.records]
+        return actual, [r.message for r in caplog.records]
+
+    assert _transform(transform_with_jsonschema=False) == _transform(transform_with_jsonschema=True)
+
+
+def test_given_same_schema_when_transform_then_compile_schema_once():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    with patch.object(transformer, "_compile", wraps=transformer._compile) as compile_mock:
+        for value in range(3):
+            transformer.transform({"value": value}, SIMPLE_SCHEMA)
+
+    assert compile_mock.call_count == 2  # the root schema and its property
+
+
+def test_given_equal_schema_for_each_record_when_transform_then_compile_schema_once():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    with patch.object(transformer, "_compile", wraps=transformer._compile) as compile_mock:
+        for value in range(3):
+            transformer.transform({"value": value}, copy.deepcopy(SIMPLE_SCHEMA))
+
+    assert compile_mock.call_count == 2  # the root schema and its property
+
+
+def test_given_schema_changed_in_place_when_transform_then_use_changed_schema():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schema = copy.deepcopy(SIMPLE_SCHEMA)
+    transformer.transform({"value": 12}, schema)
+
+    schema["properties"]["value"]["type"] = "integer"
+    record = {"value": "12"}
+    transformer.transform(record, schema)
+
+    assert record == {"value": 12}
+
+
+def test_given_more_schemas_than_cached_when_transform_then_only_recompile_evicted_schema():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schemas = [
+        {"type": "object", "properties": {f"value_{i}": {"type": "string"}}}
+        for i in range(TypeTransformer._MAX_COMPILED_SCHEMAS + 1)
+    ]
+    for schema in schemas:
+        transformer.transform({}, schema)
+
+    with patch.object(transformer, "_compile", wraps=transformer._compile) as compile_mock:
+        for schema in schemas[1:]:
+            transformer.transform({}, copy.deepcopy(schema))
+        assert compile_mock.call_count == 0
+
+        transformer.transform({}, copy.deepcopy(schemas[0]))
+        assert compile_mock.call_count == 2
+
+
+def test_given_default_convert_overridden_when_transform_then_use_override():
+    class Transformer(TypeTransformer):
+        @staticmethod
+        def default_convert(original_item: Any, subschema: Dict[str, Any]) -> Any:
+            return f"converted to {subschema['type']}"
+
+    record = {"value": 12}
+    Transformer(TransformConfig.DefaultSchemaNormalization).transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "converted to string"}
+
+
+@pytest.mark.slow
+def test_compiled_schema_performance_against_jsonschema():
+    schema = {
+        "type": "object",
+        "properties": {
+            **{f"string_{i}": {"type": ["null", "string"]} for i in range(10)},
+            **{f"number_{i}": {"type": ["null", "number"]} for i in range(10)},
+            "nested": {"$ref": "#/definitions/nested"},
+            "items": {"type": "array", "items": {"$ref": "#/definitions/nested"}},
+        },
+        "definitions": {
+            "nested": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+            }
+        },
+    }
+    records = [
+        {
+            **{f"string_{i}": i for i in range(10)},
+            **{f"number_{i}": str(i) for i in range(10)},
+            "nested": {"id": "1", "name": "a"},
+            "items": [{"id": str(i), "name": i} for i in range(5)],
+        }
+        for _ in range(2000)
+    ]
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    def _seconds_per_record(
+        transform: Callable[[Dict[str, Any], Dict[str, Any]], None], fresh_schemas: bool = False
+    ) -> float:
+        copied_records = copy.deepcopy(records)
+        # some streams build a new schema for each record
+        schemas = (
+            [copy.deepcopy(schema) for _ in records] if fresh_schemas else [schema] * len(records)
+        )
+        start = time.perf_counter()
+        for record, record_schema in zip(copied_records, schemas):
+            transform(record, record_schema)
+        return (time.perf_counter() - start) / len(records)
+
+    with_jsonschema = _seconds_per_record(transformer._transform_with_jsonschema)
+    compiled = _seconds_per_record(transformer.transform)
+    compiled_with_fresh_schemas = _seconds_per_record(transformer.transform, fresh_schemas=True)
+
+    logging.getLogger(__name__).info(
+        f"{with_jsonschema * 1e6:.0f}us per record with jsonschema, {compiled * 1e6:.0f}us compiled, "
+        f"{compiled_with_fresh_schemas * 1e6:.0f}us compiled with a new schema for each record"
+    )
+    assert compiled * 3 < with_jsonschema
+    assert compiled_with_fresh_schemas * 3 < with_jsonschema
@@ -460,6 +460,52 @@ def test_invalid_command(entrypoint: AirbyteEntrypoint, config_mock):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
 
 
+@pytest.mark.parametrize("buffered_output", ["true", "false"])
+def test_launch_spec_writes_messages_to_stdout(mocker, spec_mock, capsys, buffered_output):
+    mocker.patch.dict(os.environ, {"AIRBYTE_BUFFERED_OUTPUT": buffered_output})
+
+    entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert capsys.readouterr().out.splitlines() == [
+        _wrap_message(ConnectorSpecification(connectionSpecification={}))
+    ]
+
+
+def test_given_state_message_when_launch_then_flush_buffered_messages(mocker, capsys):
+    record = AirbyteMessage(
+        type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"a": 1}, emitted_at=1)
+    )
+    state = AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name="stream"),
+                stream_state=AirbyteStateBlob(cursor=1),
+            ),
+        ),
+    )
+    outputs_on_state = []
+
+    def _run_messages(_parsed_args):
+        yield record
+        yield state
+        outputs_on_state.append(capsys.readouterr().out)
+        yield record
+
+    mocker.patch.object(AirbyteEntrypoint, "run_messages", side_effect=_run_messages)
+
+    entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert outputs_on_state == [
+        AirbyteEntrypoint.airbyte_message_to_string(record)
+        + "\n"
+        + AirbyteEntrypoint.airbyte_message_to_string(state)
+        + "\n"
+    ]
+    assert capsys.readouterr().out == AirbyteEntrypoint.airbyte_message_to_string(record) + "\n"
+
+
 @pytest.mark.parametrize(
     "deployment_mode, url, expected_error",
     [
@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+import time
+
 import pytest
 from airbyte_cdk.utils.airbyte_secrets_utils import (
     add_to_secrets,
     filter_secrets,
     get_secret_paths,
     get_secrets,
+    get_secrets_from_config,
     update_secrets,
 )
 
@@ -183,3 +187,71 @@ def test_secrets_added_are_filtered():
     add_to_secrets(ADDED_SECRET)
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE}"
+
+
+@pytest.mark.parametrize(
+    "secrets",
+    [
+        pytest.param(["x", "xk"], id="test_shorter_secret_first"),
+        pytest.param(["xk", "x"], id="test_longer_secret_first"),
+    ],
+)
+def test_given_secret_containing_another_secret_when_filter_secrets_then_longest_secret_is_filtered(
+    secrets,
+):
+    update_secrets(secrets)
+
+    assert filter_secrets("a xk and a x") == "a **** and a ****"
+
+
+def test_given_secret_is_not_a_string_when_filter_secrets_then_filter_its_string_value():
+    update_secrets([SECRET_INT_VALUE, SECRET_STRING_VALUE])
+
+    assert filter_secrets(f"{SECRET_INT_VALUE}:{SECRET_STRING_VALUE}") == "****:****"
+
+
+def test_given_secrets_with_regex_characters_when_filter_secrets_then_filter_them_literally():
+    update_secrets(["a.c", "(x|y)*"])
+
+    assert filter_secrets("abc a.c (x|y)* x") == "abc **** **** x"
+
+
+def test_given_secrets_updated_when_filter_secrets_then_only_filter_new_secrets():
+    update_secrets([SECRET_STRING_VALUE])
+    add_to_secrets(SECRET_STRING_2_VALUE)
+    update_secrets([NOT_SECRET_VALUE])
+
+    assert get_secrets_from_config() == [NOT_SECRET_VALUE]
+    assert (
+        filter_secrets(f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE} {NOT_SECRET_VALUE}")
+        == f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE} ****"
+    )
+
+
+@pytest.mark.slow
+def test_filter_secrets_performance_on_large_payloads():
+    secrets = [f"secret-token-{i:04d}-{'x' * 20}" for i in range(50)]
+    payload = "".join(
+        f'{{"id": {i}, "name": "a record with a long enough description", "token": "{secrets[i % 100] if i % 100 < 50 else "none"}"}}'
+        for i in range(20_000)
+    )
+
+    def _filter_secrets_one_by_one(string):
+        for secret in secrets:
+            string = string.replace(secret, "****")
+        return string
+
+    update_secrets(secrets)
+    start = time.perf_counter()
+    filtered = filter_secrets(payload)
+    single_pass = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = _filter_secrets_one_by_one(payload)
+    one_by_one = time.perf_counter() - start
+
+    logging.getLogger(__name__).info(
+        f"Filtering {len(secrets)} secrets from {len(payload)} characters: {one_by_one * 1e3:.1f}ms one secret at a time, "
+        f"{single_pass * 1e3:.1f}ms in a single pass"
+    )
+    assert filtered == expected
+    update_secrets([])
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.utils.slice_hasher import SliceHasher
+
+
+def test_given_same_slice_with_different_key_orders_when_hash_then_same_hash():
+    assert SliceHasher.hash("stream", {"a": 1, "b": {"c": 2, "d": 3}}) == SliceHasher.hash(
+        "stream", {"b": {"d": 3, "c": 2}, "a": 1}
+    )
+
+
+def test_given_different_slices_when_hash_then_different_hashes():
+    hashes = {
+        SliceHasher.hash("stream"),
+        SliceHasher.hash("another stream"),
+        SliceHasher.hash("stream", {"id": 1}),
+        SliceHasher.hash("stream", {"id": 2}),
+        SliceHasher.hash("another stream", {"id": 1}),
+    }
+
+    assert len(hashes) == 5
+
+
+def test_given_stream_slice_when_hash_then_hash_its_json_serializable_value():
+    stream_slice = StreamSlice(partition={"id": 1}, cursor_slice={"start": "2024-01-01"})
+
+    assert SliceHasher.hash("stream", stream_slice) == SliceHasher.hash(
+        "stream", {"id": 1, "start": "2024-01-01"}
+    )
+
+
+def test_given_integer_over_64_bits_when_hash_then_hash_slice():
+    assert SliceHasher.hash("stream", {"id": 2**70}) != SliceHasher.hash("stream", {"id": 2**71})
+
+
+def test_when_hash_then_hash_is_64_bits_and_stable():
+    # The hash doesn't depend on the process so that partitions created in worker processes have the same hash
+    assert SliceHasher.hash("stream", {"id": 1}) == 3271307932277143139
+    assert 0 <= SliceHasher.hash("stream", {"id": 1}) < 2**64
+
+
+def test_given_slice_not_serializable_when_hash_then_raise_value_error():
+    with pytest.raises(ValueError):
+        SliceHasher.hash("stream", {"id": object()})
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import threading
+import time
+
+from airbyte_cdk.utils.stdout_writer import BufferedStdoutWriter
+
+
+def test_given_buffer_below_limits_when_write_then_nothing_is_written_until_flush():
+    stream = io.BytesIO()
+    writer = BufferedStdoutWriter(max_buffer_size=1024, flush_interval=60, stream=stream)
+
+    writer.write(b'{"a": 1}\n')
+    writer.write(b'{"a": 2}\n')
+    assert stream.getvalue() == b""
+
+    writer.flush()
+    assert stream.getvalue() == b'{"a": 1}\n{"a": 2}\n'
+
+
+def test_given_flush_requested_when_write_then_buffer_is_written():
+    stream = io.BytesIO()
+    writer = BufferedStdoutWriter(max_buffer_size=1024, flush_interval=60, stream=stream)
+
+    writer.write(b"record\n")
+    writer.write(b"state\n", flush=True)
+
+    assert stream.getvalue() == b"record\nstate\n"
+
+
+def test_given_buffer_exceeds_max_size_when_write_then_buffer_is_written():
+    stream = io.BytesIO()
+    writer = BufferedStdoutWriter(max_buffer_size=10, flush_interval=60, stream=stream)
+
+    writer.write(b"12345\n")
+    assert stream.getvalue() == b""
+    writer.write(b"67890\n")
+
+    assert stream.getvalue() == b"12345\n67890\n"
+
+
+def test_given_context_manager_when_idle_then_buffer_is_flushed_after_interval():
+    stream = io.BytesIO()
+    with BufferedStdoutWriter(max_buffer_size=1024, flush_interval=0.01, stream=stream) as writer:
+        writer.write(b"record\n")
+        deadline = time.monotonic() + 5
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.getvalue() == b"record\n"
+
+
+def test_when_exiting_context_then_remaining_messages_are_flushed():
+    stream = io.BytesIO()
+    with BufferedStdoutWriter(max_buffer_size=1024, flush_interval=60, stream=stream) as writer:
+        writer.write(b"record\n")
+
+    assert stream.getvalue() == b"record\n"
+
+
+def test_given_concurrent_writers_when_write_then_lines_are_not_interleaved():
+    stream = io.BytesIO()
+    lines_per_thread = 1000
+
+    def _write(writer: BufferedStdoutWriter, thread_id: int) -> None:
+        for i in range(lines_per_thread):
+            writer.write(f"{thread_id}-{i}\n".encode())
+
+    with BufferedStdoutWriter(max_buffer_size=100, flush_interval=0.001, stream=stream) as writer:
+        threads = [threading.Thread(target=_write, args=(writer, i)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = stream.getvalue().decode().splitlines()
+    assert sorted(lines) == sorted(f"{t}-{i}" for t in range(8) for i in range(lines_per_thread))
+
+
+def test_given_no_stream_when_flush_then_write_to_stdout(capsys):
+    writer = BufferedStdoutWriter()
+    print("printed before")
+    writer.write(b"record\n", flush=True)
+
+    assert capsys.readouterr().out == "printed before\nrecord\n"